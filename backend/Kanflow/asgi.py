@@ -13,4 +13,10 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Kanflow.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# realtime push endpoints (api/realtime/asgi.py) in front of the django app; imported once
+# django is set up
+from api.realtime.asgi import RealtimeRouter
+
+application = RealtimeRouter(django_application)
@@ -2,6 +2,7 @@ from pathlib import Path
 import os
 from dotenv import load_dotenv
 from urllib.parse import urlparse, parse_qsl
+from corsheaders.defaults import default_headers
 
 load_dotenv()
 
@@ -20,6 +21,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'corsheaders',
@@ -32,6 +34,10 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
 ]
 
+# conditional reads: let the frontend send If-None-Match and see the ETag
+CORS_ALLOW_HEADERS = (*default_headers, "if-none-match")
+CORS_EXPOSE_HEADERS = ["ETag"]
+
 COOKIE_SETTINGS = {
     'httponly': True,
     'secure': True,
@@ -40,6 +46,92 @@ COOKIE_SETTINGS = {
     'path': '/'
 }
 
+# membership lookups are cached here, point this at a shared backend (redis/memcached)
+# when running more than one worker so invalidations reach every process
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv("CACHE_BACKEND", 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv("CACHE_LOCATION", 'kanflow'),
+    }
+}
+
+MEMBERSHIP_CACHE_TTL = int(os.getenv("MEMBERSHIP_CACHE_TTL", 300))
+
+# upper bound for a single page of get_all_tasks
+TASKS_PAGE_MAX = int(os.getenv("TASKS_PAGE_MAX", 500))
+
+# tasks/changes/ delta sync
+TASK_SYNC_OVERLAP_SECONDS = int(os.getenv("TASK_SYNC_OVERLAP_SECONDS", 2))
+TASK_SYNC_MAX_CHANGES = int(os.getenv("TASK_SYNC_MAX_CHANGES", 1000))
+TASK_TOMBSTONE_RETENTION_DAYS = int(os.getenv("TASK_TOMBSTONE_RETENTION_DAYS", 30))
+
+# tasks/bulk/ batch size limit
+TASK_BULK_MAX_OPERATIONS = int(os.getenv("TASK_BULK_MAX_OPERATIONS", 500))
+
+# rank keys longer than this get their column respaced in the background
+TASK_RANK_REBALANCE_LENGTH = int(os.getenv("TASK_RANK_REBALANCE_LENGTH", 24))
+# how long a move waits for the column it landed in to be respaced before giving up
+TASK_RANK_REBALANCE_WAIT_SECONDS = int(os.getenv("TASK_RANK_REBALANCE_WAIT_SECONDS", 5))
+
+# tasks/analytics/ rollups, keyed by workspace version so task writes invalidate them
+ANALYTICS_CACHE_TTL = int(os.getenv("ANALYTICS_CACHE_TTL", 3600))
+
+# rows per server-side cursor fetch / per encoded chunk for ?stream=true listings
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", 2000))
+
+# smallest columnar (msgpack) body worth gzipping
+COLUMNAR_GZIP_MIN_BYTES = int(os.getenv("COLUMNAR_GZIP_MIN_BYTES", 1024))
+
+# archive_done_tasks: tasks done for longer than this move to archived_tasks, this many per transaction
+TASK_ARCHIVE_AFTER_DAYS = int(os.getenv("TASK_ARCHIVE_AFTER_DAYS", 90))
+TASK_ARCHIVE_BATCH_SIZE = int(os.getenv("TASK_ARCHIVE_BATCH_SIZE", 500))
+
+# notifications are partitioned by month: get_all_notfications reads this many days by default,
+# manage_notification_partitions drops partitions older than this many months
+NOTIFICATIONS_WINDOW_DAYS = int(os.getenv("NOTIFICATIONS_WINDOW_DAYS", 90))
+NOTIFICATION_RETENTION_MONTHS = int(os.getenv("NOTIFICATION_RETENTION_MONTHS", 12))
+# largest page get_all_notfications hands out when a limit is asked for
+NOTIFICATIONS_PAGE_MAX = int(os.getenv("NOTIFICATIONS_PAGE_MAX", 100))
+# ids a single bulk read/dismiss/answer request may name ("all" has no limit)
+NOTIFICATION_BULK_MAX_IDS = int(os.getenv("NOTIFICATION_BULK_MAX_IDS", 500))
+
+# export_pdf engine when the request doesn't pick one: "browser" renders the frontend's print
+# view, "native" draws the board in python without a browser
+PDF_EXPORT_ENGINE = os.getenv("PDF_EXPORT_ENGINE", "browser")
+
+# export_pdf: the Next.js app whose print view gets rendered, by this many pooled headless
+# browsers (each relaunched after PDF_BROWSER_MAX_JOBS exports); seconds an export may wait
+# for a browser and then take to render
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+PDF_BROWSER_POOL_SIZE = int(os.getenv("PDF_BROWSER_POOL_SIZE", 2))
+PDF_BROWSER_MAX_JOBS = int(os.getenv("PDF_BROWSER_MAX_JOBS", 50))
+PDF_EXPORT_QUEUE_TIMEOUT = int(os.getenv("PDF_EXPORT_QUEUE_TIMEOUT", 30))
+PDF_EXPORT_TIMEOUT = int(os.getenv("PDF_EXPORT_TIMEOUT", 30))
+
+# export-pdf/jobs/: background render threads and the queued + running jobs a process accepts,
+# job records kept for PDF_JOB_TTL seconds
+PDF_EXPORT_WORKERS = int(os.getenv("PDF_EXPORT_WORKERS", 2))
+PDF_EXPORT_MAX_PENDING = int(os.getenv("PDF_EXPORT_MAX_PENDING", 20))
+PDF_JOB_TTL = int(os.getenv("PDF_JOB_TTL", 3600))
+
+# rendered PDFs, one per board state, in PDF_CACHE_DIR (defaults to <tmp>/kanflow-pdf); least
+# recently used ones are evicted past PDF_CACHE_MAX_BYTES
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "")
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+
+# realtime push (api/realtime/, served by Kanflow/asgi.py): dotted path of the fan-out broker,
+# messages a slow subscriber may have queued before it is told to resync, heartbeat interval
+REALTIME_BROKER = os.getenv("REALTIME_BROKER", "api.realtime.memory.InMemoryBroker")
+REALTIME_QUEUE_SIZE = int(os.getenv("REALTIME_QUEUE_SIZE", 100))
+REALTIME_HEARTBEAT_SECONDS = int(os.getenv("REALTIME_HEARTBEAT_SECONDS", 25))
+# board changes are coalesced per workspace over this window; past MAX_IDS clients refetch instead
+REALTIME_BOARD_COALESCE_MS = int(os.getenv("REALTIME_BOARD_COALESCE_MS", 150))
+REALTIME_BOARD_MAX_IDS = int(os.getenv("REALTIME_BOARD_MAX_IDS", 200))
+
+# verified access tokens are cached per process, never past the token's own exp
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 10000))
+AUTH_TOKEN_CACHE_TTL = int(os.getenv("AUTH_TOKEN_CACHE_TTL", 300))
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Kanflow.settings')
 
 application = get_wsgi_application()
+
+# realtime pushes only reach clients through the ASGI app (Kanflow/asgi.py), say so when they
+# can't from here
+from api.realtime import check_wsgi_broker
+
+check_wsgi_broker()
@@ -0,0 +1,27 @@
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from api.utils.archive import archive_batch
+
+class Command(BaseCommand):
+    help = "Moves tasks that have been done for longer than TASK_ARCHIVE_AFTER_DAYS into archived_tasks, in short batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=getattr(settings, "TASK_ARCHIVE_AFTER_DAYS", 90))
+        parser.add_argument("--batch-size", type=int, default=getattr(settings, "TASK_ARCHIVE_BATCH_SIZE", 500))
+        parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches, the next run picks up the rest.")
+        parser.add_argument("--pause", type=float, default=0.1, help="Seconds to sleep between batches.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        archived, batches = 0, 0
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            moved = archive_batch(cutoff, options["batch_size"])
+            if not moved:
+                break
+            archived += moved
+            batches += 1
+            time.sleep(options["pause"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} tasks in {batches} batches"))
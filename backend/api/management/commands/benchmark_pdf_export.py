@@ -0,0 +1,92 @@
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from api.models.user import User
+from api.models.workspace import Workspace
+from api.models.team_members import TeamMembers
+from api.models.tasks import Tasks
+from api.utils.jwt_utils import generate_token
+from api.utils.pdf_export import render_board_pdf
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore magna aliqua".split()
+
+class Command(BaseCommand):
+    help = "Times the native PDF engine (and optionally the browser one) on throwaway boards of increasing size."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000])
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--browser", action="store_true",
+            help="Also time the browser engine; needs playwright and the frontend running at FRONTEND_URL.",
+        )
+
+    def handle(self, *args, **options):
+        sizes = sorted(options["sizes"])
+        # committed, the browser engine reads the board through the frontend on its own connection
+        users, samples = [], {}
+        try:
+            self.seed(sizes, users, samples)
+            with connection.cursor() as cursor:
+                for model in (User, Workspace, Tasks, TeamMembers):
+                    cursor.execute(f'ANALYZE "{model._meta.db_table}"')
+            for size in sizes:
+                sample = samples[size]
+                native_time, pdf = self.best_of(options["repeat"], lambda: render_board_pdf(sample["workspace"], None, "native"))
+                if not pdf.startswith(b"%PDF-") or not pdf.rstrip().endswith(b"%%EOF"):
+                    raise CommandError(f"native x{size}: output is not a PDF")
+                tracemalloc.start()
+                render_board_pdf(sample["workspace"], None, "native")
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                line = (
+                    f"x{size:<6} native {native_time * 1000:9.1f} ms  {len(pdf) / 1024:8.1f} KB  "
+                    f"{pdf.count(b'/Type /Page '):4d} pages  peak {peak / 2**20:6.1f} MB"
+                )
+                if options["browser"]:
+                    browser_time, pdf = self.best_of(options["repeat"], lambda: render_board_pdf(sample["workspace"], sample["token"], "browser"))
+                    line += f"   browser {browser_time * 1000:9.1f} ms  {len(pdf) / 1024:8.1f} KB  {browser_time / native_time:6.1f}x"
+                self.stdout.write(line)
+        finally:
+            # the seeded rows are only there to be measured, never keep them
+            Workspace.objects.filter(creator__in=users).delete()
+            User.objects.filter(userId__in=[u.userId for u in users]).delete()
+
+    def best_of(self, repeat, fn):
+        best, result = None, None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def seed(self, sizes, users, samples):
+        rng = random.Random(42)
+        self.stdout.write(f"Seeding boards of {', '.join(map(str, sizes))} tasks...")
+
+        users += [User(name=f"user{i}", email=f"bench-{uuid.uuid4().hex}@example.com", password="x") for i in range(20)]
+        User.objects.bulk_create(users)
+        for size in sizes:
+            workspace = Workspace.objects.create(name=f"benchmark {size}", description="PDF export benchmark", creator=users[0])
+            TeamMembers.objects.bulk_create([
+                TeamMembers(userId=user, email=user.email, workspaceId=workspace, status="accepted", privilege="admin" if i == 0 else "user")
+                for i, user in enumerate(users)
+            ])
+            Tasks.objects.bulk_create([
+                Tasks(
+                    workspaceId=workspace, created_by=rng.choice(users),
+                    title=" ".join(rng.choices(WORDS, k=rng.randint(2, 12))).capitalize(),
+                    # mostly short, some long enough to span columns and pages
+                    description=" ".join(rng.choices(WORDS, k=rng.choice([0, 10, 40, 300])))[:2000],
+                    dueDate=date.today() + timedelta(days=rng.randint(-60, 60)),
+                    priority=rng.choice(Tasks.Priority.values), status=rng.choice(Tasks.Status.values),
+                    assignees=[u.userId for u in rng.sample(users, rng.randint(0, 3))],
+                    tags=[f"tag{rng.randint(0, 20)}" for _ in range(rng.randint(0, 4))],
+                ) for _ in range(size)
+            ], batch_size=5000)
+            samples[size] = {"workspace": workspace.workspaceId, "token": generate_token(users[0].userId)["access_token"]}
@@ -0,0 +1,93 @@
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.renderers import JSONRenderer
+from api.models.user import User
+from api.models.workspace import Workspace
+from api.models.team_members import TeamMembers
+from api.models.notifications import Notifications
+from api.models.message import Message
+from api.models.tasks import Tasks
+from api.serializers.task_serializer import TaskSerializer, TASK_PROJECTION
+from api.serializers.notification_serializer import NotificationSerializer, NOTIFICATION_PROJECTION
+from api.serializers.team_serializer import TeamSerializer, TEAM_PROJECTION
+from api.utils.renderers import FastJSONRenderer
+
+class Command(BaseCommand):
+    help = "Times DRF serializers against the projection fast path on a throwaway dataset and checks both render the same bytes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        sizes = sorted(options["sizes"])
+        with transaction.atomic():
+            # one workspace / recipient per size, the endpoints always list all of them
+            samples = self.seed(sizes)
+            with connection.cursor() as cursor:
+                for model in (User, Workspace, Message, Tasks, TeamMembers, Notifications):
+                    cursor.execute(f'ANALYZE "{model._meta.db_table}"')
+            listings = {
+                "tasks": (lambda s: Tasks.objects.filter(workspaceId=s["workspace"]).order_by("created_at", "task_id"), TaskSerializer, TASK_PROJECTION),
+                "notifications": (lambda s: Notifications.objects.filter(toUser=s["user"]).order_by("created_at", "notification_id"), NotificationSerializer, NOTIFICATION_PROJECTION),
+                "team members": (lambda s: TeamMembers.objects.filter(workspaceId=s["workspace"]).order_by("created_at", "member_id"), TeamSerializer, TEAM_PROJECTION),
+            }
+            for name, (listing, serializer_class, projection) in listings.items():
+                for size in sizes:
+                    rows = listing(samples[size])
+                    drf_time, drf_body = self.best_of(options["repeat"], lambda: JSONRenderer().render(serializer_class(rows.all(), many=True).data))
+                    fast_time, fast_body = self.best_of(options["repeat"], lambda: FastJSONRenderer().render(projection.serialize(projection.values(rows))))
+                    if drf_body != fast_body:
+                        raise CommandError(f"{name} x{size}: fast path output differs from {serializer_class.__name__}")
+                    self.stdout.write(f"{name:>14} x{size:<7} drf {drf_time * 1000:9.1f} ms   fast {fast_time * 1000:9.1f} ms   {drf_time / fast_time:5.1f}x")
+            # the seeded rows are only there to be measured, never keep them
+            transaction.set_rollback(True)
+
+    def best_of(self, repeat, fn):
+        best, result = None, None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def seed(self, sizes):
+        rng = random.Random(42)
+        batch = 5000
+        self.stdout.write(f"Seeding {', '.join(map(str, sizes))} rows per listing...")
+
+        users = [User(name=f"user{i}", email=f"bench-{uuid.uuid4().hex}@example.com", password="x") for i in range(max(sizes) + len(sizes))]
+        User.objects.bulk_create(users, batch_size=batch)
+        message = Message.objects.create(content="You have been invited to join a workspace")
+        samples = {}
+        for size, recipient in zip(sizes, users[max(sizes):]):
+            workspace = Workspace.objects.create(name=f"benchmark {size}", description="", creator=recipient)
+            TeamMembers.objects.bulk_create([
+                TeamMembers(
+                    userId=user, email=user.email, workspaceId=workspace,
+                    status=rng.choice(TeamMembers.Status.values), privilege=rng.choice(TeamMembers.Privilege.values),
+                ) for user in users[:size]
+            ], batch_size=batch)
+            Tasks.objects.bulk_create([
+                Tasks(
+                    workspaceId=workspace, created_by=rng.choice(users),
+                    title=f"task {i}", description="",
+                    dueDate=date.today() + timedelta(days=rng.randint(-60, 60)),
+                    priority=rng.choice(Tasks.Priority.values), status=rng.choice(Tasks.Status.values),
+                    assignees=[u.userId for u in rng.sample(users[:50], 2)], tags=[f"tag{rng.randint(0, 99)}"],
+                ) for i in range(size)
+            ], batch_size=batch)
+            Notifications.objects.bulk_create([
+                Notifications(
+                    fromUser=rng.choice(users), toUser=recipient, to_email=recipient.email,
+                    workspaceId=workspace if i % 2 else None, messageId=message if i % 3 else None,
+                    type="request", is_read=rng.random() < 0.5,
+                ) for i in range(size)
+            ], batch_size=batch)
+            samples[size] = {"workspace": workspace.workspaceId, "user": recipient.userId}
+        return samples
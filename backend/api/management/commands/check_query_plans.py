@@ -0,0 +1,144 @@
+import json
+import random
+import re
+import uuid
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from django.contrib.postgres.search import SearchQuery
+from api.models.user import User
+from api.models.workspace import Workspace
+from api.models.team_members import TeamMembers
+from api.models.notifications import Notifications
+from api.models.tasks import Tasks
+
+# tables that must never be read with a Seq Scan by the hot queries below
+HOT_TABLES = {"tasks", "team_members", "notifications"}
+# partitions (notifications_p202610, notifications_default) count as their parent table
+PARTITION_SUFFIX = re.compile(r"_(p\d{6}|default)$")
+# the planner rightly seq-scans partitions this small (empty future months)
+SMALL_PARTITION_ROWS = 1000
+
+def hot_queries(sample):
+    ws, user, tag = sample["workspace"], sample["user"], sample["tag"]
+    return {
+        "board (get_all_tasks)": Tasks.objects.filter(workspaceId=ws).order_by("created_at", "task_id")[:100],
+        "board column": Tasks.objects.filter(workspaceId=ws, status=Tasks.Status.TODO),
+        "ranked column": Tasks.objects.filter(workspaceId=ws, status=Tasks.Status.TODO).order_by("rank", "task_id")[:100],
+        "tasks by assignee": Tasks.objects.filter(assignees__contains=[user]),
+        "tasks by tag": Tasks.objects.filter(tags__contains=[tag]),
+        "archive candidates": Tasks.objects.filter(status=Tasks.Status.DONE, done_at__lt=timezone.now() - timedelta(days=90)).order_by("done_at")[:500],
+        "task search": Tasks.objects.filter(workspaceId=ws, search_vector=SearchQuery("task:*", search_type="raw", config="english")),
+        "memberships of user": TeamMembers.objects.filter(userId=user, status=TeamMembers.Status.ACCEPTED),
+        "membership check": TeamMembers.objects.filter(workspaceId=ws, userId=user),
+        "notifications of user": Notifications.objects.filter(toUser=user, created_at__gte=timezone.now() - timedelta(days=90)).order_by("-created_at")[:50],
+        "unread notifications": Notifications.objects.filter(toUser=user, is_read=False, created_at__gte=timezone.now() - timedelta(days=90)).values("notification_id"),
+    }
+
+def seq_scans(plan, small_partitions=(), found=None):
+    found = [] if found is None else found
+    relation = plan.get("Relation Name") or ""
+    if plan.get("Node Type") == "Seq Scan" and PARTITION_SUFFIX.sub("", relation) in HOT_TABLES and relation not in small_partitions:
+        found.append(relation)
+    for child in plan.get("Plans", []):
+        seq_scans(child, small_partitions, found)
+    return found
+
+def scan_nodes(plan):
+    nodes = [f"{plan['Node Type']} on {plan.get('Index Name') or plan.get('Relation Name')}"] if "Scan" in plan.get("Node Type", "") else []
+    for child in plan.get("Plans", []):
+        nodes += scan_nodes(child)
+    return nodes
+
+class Command(BaseCommand):
+    help = "Seeds a large throwaway dataset, EXPLAINs the hot queries and fails if any of them seq-scans a hot table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=2000)
+        parser.add_argument("--workspaces", type=int, default=1000)
+        parser.add_argument("--tasks", type=int, default=200000)
+        parser.add_argument("--notifications", type=int, default=100000)
+        parser.add_argument("--no-seed", action="store_true", help="Explain against the data already in the database.")
+
+    def handle(self, *args, **options):
+        failures = []
+        with transaction.atomic():
+            sample = self.existing_sample() if options["no_seed"] else self.seed(options)
+            with connection.cursor() as cursor:
+                for table in HOT_TABLES:
+                    cursor.execute(f'ANALYZE "{table}"')
+                cursor.execute(
+                    "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE child.reltuples < %s", [SMALL_PARTITION_ROWS]
+                )
+                small_partitions = {row[0] for row in cursor.fetchall()}
+
+            for name, queryset in hot_queries(sample).items():
+                plan = json.loads(queryset.explain(format="json"))[0]["Plan"]
+                scanned = seq_scans(plan, small_partitions)
+                if scanned:
+                    failures.append(name)
+                    self.stdout.write(self.style.ERROR(f"SEQ SCAN  {name}: {', '.join(scanned)}"))
+                else:
+                    self.stdout.write(self.style.SUCCESS(f"ok        {name}: {'; '.join(scan_nodes(plan))}"))
+
+            # the seeded rows are only there for the planner, never keep them
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"{len(failures)} hot queries fall back to a sequential scan: {', '.join(failures)}")
+
+    def existing_sample(self):
+        task = Tasks.objects.exclude(assignees=[]).exclude(tags=[]).first()
+        if not task:
+            raise CommandError("No tasks with assignees and tags to sample from, run without --no-seed")
+        return {"workspace": task.workspaceId_id, "user": task.assignees[0], "tag": task.tags[0]}
+
+    def seed(self, options):
+        rng = random.Random(42)
+        batch = 5000
+        self.stdout.write("Seeding throwaway dataset...")
+
+        users = [User(name=f"user{i}", email=f"plan-check-{uuid.uuid4().hex}@example.com", password="x") for i in range(options["users"])]
+        User.objects.bulk_create(users, batch_size=batch)
+        workspaces = [Workspace(name=f"ws{i}", description="", creator=rng.choice(users)) for i in range(options["workspaces"])]
+        Workspace.objects.bulk_create(workspaces, batch_size=batch)
+
+        members = []
+        for ws in workspaces:
+            for user in rng.sample(users, 8):
+                members.append(TeamMembers(
+                    userId=user, email=user.email, workspaceId=ws,
+                    status=rng.choice(TeamMembers.Status.values), privilege=TeamMembers.Privilege.USER,
+                ))
+        TeamMembers.objects.bulk_create(members, batch_size=batch)
+
+        tag_pool = [f"tag{i}" for i in range(500)]
+        tasks = []
+        for i in range(options["tasks"]):
+            tasks.append(Tasks(
+                workspaceId=rng.choice(workspaces), created_by=rng.choice(users),
+                title=f"task {i}", description="",
+                dueDate=date.today() + timedelta(days=rng.randint(-60, 60)),
+                priority=rng.choice(Tasks.Priority.values), status=rng.choice(Tasks.Status.values),
+                assignees=[u.userId for u in rng.sample(users, 2)], tags=rng.sample(tag_pool, 2),
+            ))
+            if len(tasks) == batch:
+                Tasks.objects.bulk_create(tasks)
+                tasks = []
+        Tasks.objects.bulk_create(tasks)
+
+        notifications = []
+        for i in range(options["notifications"]):
+            to_user = rng.choice(users)
+            notifications.append(Notifications(
+                fromUser=rng.choice(users), toUser=to_user, to_email=to_user.email,
+                workspaceId=rng.choice(workspaces), type="request", is_read=rng.random() < 0.9,
+            ))
+            if len(notifications) == batch:
+                Notifications.objects.bulk_create(notifications)
+                notifications = []
+        Notifications.objects.bulk_create(notifications)
+
+        return {"workspace": workspaces[0].workspaceId, "user": users[0].userId, "tag": tag_pool[0]}
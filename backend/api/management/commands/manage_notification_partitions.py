@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from api.utils.partitions import DEFAULT_PARTITION, add_months, ensure_partition, list_partitions, month_start, retire_partition
+
+class Command(BaseCommand):
+    help = "Creates upcoming monthly notification partitions and drops (or archives) the ones past NOTIFICATION_RETENTION_MONTHS."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ahead", type=int, default=3, help="Months to create past the current one.")
+        parser.add_argument("--retention-months", type=int, default=getattr(settings, "NOTIFICATION_RETENTION_MONTHS", 12))
+        parser.add_argument("--archive", action="store_true", help="Detach expired partitions and keep them as archived_* tables instead of dropping them.")
+
+    def handle(self, *args, **options):
+        this_month = month_start(timezone.now().astimezone(timezone.utc).date())
+        for offset in range(options["ahead"] + 1):
+            month = add_months(this_month, offset)
+            if ensure_partition(month):
+                self.stdout.write(f"Created partition for {month:%Y-%m}")
+
+        cutoff = add_months(this_month, -options["retention_months"])
+        for month, name in sorted(list_partitions().items()):
+            if month < cutoff:
+                retire_partition(name, archive=options["archive"])
+                self.stdout.write(f"{'Archived' if options['archive'] else 'Dropped'} {name}")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM "{DEFAULT_PARTITION}"')
+            stray = cursor.fetchone()[0]
+        if stray:
+            self.stdout.write(self.style.WARNING(f"{stray} notifications sit in {DEFAULT_PARTITION}, outside every monthly partition"))
+        self.stdout.write(self.style.SUCCESS("Notification partitions up to date"))
@@ -0,0 +1,13 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from api.models.task_tombstones import TaskTombstones
+
+class Command(BaseCommand):
+    help = "Deletes task tombstones older than TASK_TOMBSTONE_RETENTION_DAYS, sync cursors that old are reset anyway."
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=getattr(settings, "TASK_TOMBSTONE_RETENTION_DAYS", 30))
+        deleted, _ = TaskTombstones.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} tombstones"))
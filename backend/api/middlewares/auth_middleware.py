@@ -1,9 +1,28 @@
 from rest_framework.response import Response
-from api.utils.jwt_utils import verify_token
+from api.utils.jwt_utils import decode_token
+from api.utils.token_cache import token_cache, Principal
 from api.models.user import User
 from rest_framework import status as drf_status
-from api.serializers.user_serializer import UserSerializer
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+def verify_access_token(token):
+    # -> (cached token entry, None) or (None, (message, http status)); shared with the realtime
+    # endpoints in api/realtime/asgi.py, which don't go through DRF
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached, None
+
+    payload = decode_token(token, token_type="access")
+    if not isinstance(payload, dict):
+        print("Invalid or expired token")
+        return None, ("Invalid token", drf_status.HTTP_401_UNAUTHORIZED)
+
+    principal = User.objects.filter(userId=payload["sub"]).values_list("userId", "name", "email").first()
+    if not principal:
+        return None, ("User not found", drf_status.HTTP_404_NOT_FOUND)
+
+    return token_cache.set(token, payload["sub"], payload["exp"], Principal(*principal)), None
 
 def jwt_authentication(view_func):
     def wrapper(request, *args, **kwargs):
@@ -12,34 +31,26 @@ def jwt_authentication(view_func):
         if print_mode and secret and secret == getattr(settings, "PRINT_SECRET", None):
             request.user = None
             request.user_id = None
+            request.principal = None
             return view_func(request, *args, **kwargs)
-        
+
         auth_headers = request.headers.get('Authorization')
         if not auth_headers or not auth_headers.startswith("Bearer "):
             print("Missing or malformed auth header")
             return Response({"success": False, "message": "Auth header missing"}, status=drf_status.HTTP_400_BAD_REQUEST)
-        
+
         token = auth_headers.split(" ")[1]
-        user_id = verify_token(token, token_type="access")
-
-        if user_id in [None, "expired"]:
-            print(f"Invalid or expired token: {token}")
-            return Response({"success": False, "message": "Invalid token"}, status=drf_status.HTTP_401_UNAUTHORIZED)
-        
-        try:
-            user = User.objects.get(userId=user_id)
-            user_serialized = UserSerializer(user).data
-            print("User_serialized : ", user_serialized)
-            
-            request.user = user
-            request.user_id = user_id
-            
-            print("User (middleware): ", user)
-            print("User ID from token:", user_id)
-            
-        except User.DoesNotExist:
-            return Response({"success": False, "message": "User not found"}, status=drf_status.HTTP_404_NOT_FOUND)
-        
+        cached, error = verify_access_token(token)
+        if error:
+            message, status = error
+            return Response({"success": False, "message": message}, status=status)
+
+        user_id = cached.sub
+        request.user_id = user_id
+        request.principal = cached.principal
+        # only views that really need the model instance pay for the lookup
+        request.user = SimpleLazyObject(lambda: User.objects.get(userId=user_id))
+
         return view_func(request, *args, **kwargs)
-    
-    return wrapper
\ No newline at end of file
+
+    return wrapper
@@ -0,0 +1,111 @@
+# Generated by Django 4.2.23 on 2026-10-18 06:56
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Message',
+            fields=[
+                ('messageId', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('content', models.CharField(blank=True, max_length=3000, null=True)),
+            ],
+            options={
+                'db_table': 'message',
+            },
+        ),
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('userId', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('password', models.CharField(max_length=128)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'user',
+            },
+        ),
+        migrations.CreateModel(
+            name='Workspace',
+            fields=[
+                ('workspaceId', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.CharField(max_length=1000)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('creator', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='workspace_created_by', to='api.user')),
+            ],
+            options={
+                'db_table': 'workspaces',
+            },
+        ),
+        migrations.CreateModel(
+            name='Tasks',
+            fields=[
+                ('task_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('assignees', django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), blank=True, default=list, size=None)),
+                ('tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=20), blank=True, default=list, size=None)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.CharField(max_length=2000)),
+                ('dueDate', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('priority', models.CharField(choices=[('high', 'High'), ('medium', 'Medium'), ('low', 'Low')], max_length=20)),
+                ('status', models.CharField(choices=[('todo', 'Todo'), ('in_progress', 'In Progress'), ('blocked', 'Blocked'), ('in_review', 'In Review'), ('done', 'Done')], max_length=20)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='task_creator', to='api.user')),
+                ('workspaceId', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='workspace_tasks', to='api.workspace')),
+            ],
+            options={
+                'db_table': 'tasks',
+            },
+        ),
+        migrations.CreateModel(
+            name='Notifications',
+            fields=[
+                ('notification_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('reaction', models.CharField(blank=True, choices=[('accepted', 'Accepted'), ('rejected', 'Rejected'), ('pending', 'Pending'), ('revoked', 'Revoked')], default='pending', null=True)),
+                ('is_read', models.BooleanField(default=False)),
+                ('to_email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('type', models.CharField(blank=True, choices=[('request', 'Request'), ('info', 'Revoke')], max_length=10, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('fromUser', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_from_user', to='api.user')),
+                ('messageId', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='message_notfication', to='api.message')),
+                ('toUser', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notifications_to_user', to='api.user')),
+                ('workspaceId', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notification_workspace', to='api.workspace')),
+            ],
+            options={
+                'db_table': 'notifications',
+            },
+        ),
+        migrations.CreateModel(
+            name='TeamMembers',
+            fields=[
+                ('member_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('email', models.EmailField(max_length=254, null=True)),
+                ('status', models.CharField(choices=[('accepted', 'Accepted'), ('pending', 'Pending'), ('rejected', 'Rejected'), ('revoked', 'Revoked')], default='pending', max_length=10)),
+                ('privilege', models.CharField(choices=[('admin', 'Admin'), ('user', 'User')], default='user', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('userId', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='team_members', to='api.user')),
+                ('workspaceId', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='member_of_workspace', to='api.workspace')),
+            ],
+            options={
+                'db_table': 'team_members',
+                'unique_together': {('workspaceId', 'email')},
+            },
+        ),
+    ]
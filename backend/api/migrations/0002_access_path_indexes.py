@@ -0,0 +1,57 @@
+# Generated by Django 4.2.23 on 2026-10-18 06:58
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # indexes are built without blocking writes on the (already large) tables
+    atomic = False
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='notifications',
+            index=models.Index(fields=['toUser', '-created_at'], name='notif_to_user_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='notifications',
+            index=models.Index(fields=['to_email', 'workspaceId'], name='notif_email_ws_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='notifications',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['toUser'], name='notif_unread_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=models.Index(fields=['workspaceId', 'status'], name='tasks_ws_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=models.Index(fields=['workspaceId', 'created_at', 'task_id'], name='tasks_ws_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['assignees'], name='tasks_assignees_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='tasks_tags_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='teammembers',
+            index=models.Index(fields=['userId', 'status'], name='team_members_user_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='teammembers',
+            index=models.Index(fields=['workspaceId', 'userId'], name='team_members_ws_user_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='teammembers',
+            index=models.Index(condition=models.Q(('userId__isnull', True)), fields=['email'], name='team_members_unlinked_idx'),
+        ),
+    ]
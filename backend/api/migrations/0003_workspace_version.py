@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-18 07:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workspace',
+            name='version',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
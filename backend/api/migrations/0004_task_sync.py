@@ -0,0 +1,42 @@
+# Generated by Django 4.2.23 on 2026-10-18 07:01
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('api', '0003_workspace_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTombstones',
+            fields=[
+                ('tombstone_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('task_id', models.UUIDField()),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'task_tombstones',
+            },
+        ),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=models.Index(fields=['workspaceId', 'updated_at'], name='tasks_ws_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='tasktombstones',
+            name='workspaceId',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_tombstones', to='api.workspace'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstones',
+            index=models.Index(fields=['workspaceId', 'deleted_at'], name='tombstones_ws_deleted_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.23 on 2026-10-18 07:03
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+def even_ranks(count):
+    # frozen copy of api.utils.ranking.even_ranks
+    width = 1
+    while len(DIGITS) ** width <= count:
+        width += 1
+    step = len(DIGITS) ** width / (count + 1)
+    ranks = []
+    for i in range(1, count + 1):
+        value, digits = int(step * i), []
+        for _ in range(width):
+            value, digit = divmod(value, len(DIGITS))
+            digits.append(DIGITS[digit])
+        ranks.append("".join(reversed(digits)).rstrip(DIGITS[0]))
+    return ranks
+
+
+def backfill_ranks(apps, schema_editor):
+    # existing columns keep their creation order
+    Tasks = apps.get_model("api", "Tasks")
+    columns = Tasks.objects.order_by().values_list("workspaceId", "status").distinct()
+    for workspace_id, status in columns.iterator():
+        tasks = list(
+            Tasks.objects.filter(workspaceId=workspace_id, status=status)
+            .order_by("created_at", "task_id").only("task_id")
+        )
+        for task, rank in zip(tasks, even_ranks(len(tasks))):
+            task.rank = rank
+        Tasks.objects.bulk_update(tasks, ["rank"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('api', '0004_task_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tasks',
+            name='rank',
+            field=models.CharField(blank=True, db_collation='C', default='', max_length=255),
+        ),
+        migrations.RunPython(backfill_ranks, migrations.RunPython.noop, atomic=True),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=models.Index(fields=['workspaceId', 'status', 'rank', 'task_id'], name='tasks_ws_status_rank_idx'),
+        ),
+    ]
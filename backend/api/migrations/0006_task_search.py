@@ -0,0 +1,89 @@
+# Generated by Django 4.2.23 on 2026-10-18 07:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+# Keep in sync with the search query in tasks_view.search_tasks: titles and tags weigh more
+# than descriptions, tags are matched as-is (no stemming).
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('simple', array_to_string(coalesce({row}tags, '{{}}'), ' ')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}description, '')), 'B')
+"""
+
+CREATE_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION tasks_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tasks_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, tags ON tasks
+    FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_update();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS tasks_search_vector_trigger ON tasks;
+DROP FUNCTION IF EXISTS tasks_search_vector_update();
+"""
+
+BACKFILL = f"UPDATE tasks SET search_vector = {SEARCH_VECTOR_SQL.format(row='')};"
+
+# pg_trgm isn't in every postgres build: without it the trigram index is skipped and
+# search_tasks matches on the search vector alone (api/utils/trigram.py)
+def create_trigram_extension(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+        if cursor.fetchone()[0]:
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+def trigram_index(table, name, concurrently):
+    # -> operation adding a GIN trigram index on table.title when pg_trgm is installed
+    option = "CONCURRENTLY " if concurrently else ""
+
+    def forwards(apps, schema_editor):
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            if cursor.fetchone()[0]:
+                schema_editor.execute(f'CREATE INDEX {option}IF NOT EXISTS "{name}" ON "{table}" USING gin ("title" gin_trgm_ops)')
+
+    def backwards(apps, schema_editor):
+        schema_editor.execute(f'DROP INDEX {option}IF EXISTS "{name}"')
+
+    return migrations.RunPython(forwards, backwards)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('api', '0005_task_rank'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_extension, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='tasks',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='tasks_search_gin'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='tasks',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='tasks_title_trgm', opclasses=['gin_trgm_ops']),
+                ),
+            ],
+            database_operations=[trigram_index('tasks', 'tasks_title_trgm', concurrently=True)],
+        ),
+    ]
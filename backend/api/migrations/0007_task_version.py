@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-18 07:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_task_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tasks',
+            name='version',
+            field=models.IntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 4.2.23 on 2026-10-18 07:42
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+# done_at is stamped when a task enters done and cleared when it leaves, whatever path wrote
+# the status (create, update, bulk, move) so archiving can trust it.
+CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION tasks_done_at_update() RETURNS trigger AS $$
+BEGIN
+    IF NEW.status <> 'done' THEN
+        NEW.done_at := NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        NEW.done_at := coalesce(NEW.done_at, now());
+    ELSIF OLD.status <> 'done' THEN
+        NEW.done_at := now();
+    ELSE
+        NEW.done_at := OLD.done_at;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tasks_done_at_trigger
+    BEFORE INSERT OR UPDATE OF status ON tasks
+    FOR EACH ROW EXECUTE FUNCTION tasks_done_at_update();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS tasks_done_at_trigger ON tasks;
+DROP FUNCTION IF EXISTS tasks_done_at_update();
+"""
+
+# best guess for tasks that were already done: their last write
+BACKFILL = "UPDATE tasks SET done_at = updated_at WHERE status = 'done';"
+
+# same as the tasks title index in 0006, only where pg_trgm is installed
+TRIGRAM_INDEX = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        CREATE INDEX IF NOT EXISTS archived_title_trgm ON archived_tasks USING gin (title gin_trgm_ops);
+    END IF;
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('api', '0007_task_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTasks',
+            fields=[
+                ('task_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('assignees', django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), blank=True, default=list, size=None)),
+                ('tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=20), blank=True, default=list, size=None)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.CharField(max_length=2000)),
+                ('dueDate', models.DateField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('priority', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=20)),
+                ('version', models.IntegerField(default=1)),
+                ('done_at', models.DateTimeField(null=True)),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'archived_tasks',
+            },
+        ),
+        migrations.AddField(
+            model_name='tasks',
+            name='done_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+        AddIndexConcurrently(
+            model_name='tasks',
+            index=models.Index(condition=models.Q(('status', 'done')), fields=['done_at'], name='tasks_done_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedtasks',
+            name='created_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='archived_task_creator', to='api.user'),
+        ),
+        migrations.AddField(
+            model_name='archivedtasks',
+            name='workspaceId',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_tasks', to='api.workspace'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedtasks',
+            index=models.Index(fields=['workspaceId', '-archived_at', 'task_id'], name='archived_ws_archived_idx'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='archivedtasks',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='archived_title_trgm', opclasses=['gin_trgm_ops']),
+                ),
+            ],
+            database_operations=[migrations.RunSQL(TRIGRAM_INDEX, "DROP INDEX IF EXISTS archived_title_trgm;")],
+        ),
+    ]
@@ -0,0 +1,76 @@
+from django.db import migrations
+
+# Turns notifications into a table range partitioned by created_at month (see
+# api/utils/partitions.py). Partitioned tables need the partition key in the primary key,
+# so the db key becomes (notification_id, created_at); the model keeps notification_id as
+# its pk, uuid4 ids don't collide. Rows are copied once, writes wait for the migration.
+
+CONSTRAINTS_AND_INDEXES = """
+ALTER TABLE notifications ADD CONSTRAINT "notifications_fromUser_id_68101ecf_fk_user_userId"
+    FOREIGN KEY ("fromUser_id") REFERENCES "user" ("userId") DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE notifications ADD CONSTRAINT "notifications_messageId_id_96f1c421_fk_message_messageId"
+    FOREIGN KEY ("messageId_id") REFERENCES message ("messageId") DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE notifications ADD CONSTRAINT "notifications_toUser_id_93198009_fk_user_userId"
+    FOREIGN KEY ("toUser_id") REFERENCES "user" ("userId") DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE notifications ADD CONSTRAINT "notifications_workspaceId_id_b7df761c_fk_workspaces_workspaceId"
+    FOREIGN KEY ("workspaceId_id") REFERENCES workspaces ("workspaceId") DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX "notifications_fromUser_id_68101ecf" ON notifications ("fromUser_id");
+CREATE INDEX "notifications_messageId_id_96f1c421" ON notifications ("messageId_id");
+CREATE INDEX "notifications_toUser_id_93198009" ON notifications ("toUser_id");
+CREATE INDEX "notifications_workspaceId_id_b7df761c" ON notifications ("workspaceId_id");
+CREATE INDEX notif_to_user_created_idx ON notifications ("toUser_id", created_at DESC);
+CREATE INDEX notif_email_ws_idx ON notifications (to_email, "workspaceId_id");
+CREATE INDEX notif_unread_idx ON notifications ("toUser_id") WHERE NOT is_read;
+"""
+
+PARTITION = """
+ALTER TABLE notifications RENAME TO notifications_unpartitioned;
+CREATE TABLE notifications (LIKE notifications_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (created_at);
+CREATE TABLE notifications_default PARTITION OF notifications DEFAULT;
+
+-- every month that has rows, up to a few months ahead
+DO $$
+DECLARE
+    month timestamp;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', coalesce((SELECT min(created_at) FROM notifications_unpartitioned), now()) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months',
+            interval '1 month'
+        )
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF notifications FOR VALUES FROM (%L) TO (%L)',
+            'notifications_p' || to_char(month, 'YYYYMM'),
+            month AT TIME ZONE 'UTC',
+            (month + interval '1 month') AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END
+$$;
+
+INSERT INTO notifications SELECT * FROM notifications_unpartitioned;
+DROP TABLE notifications_unpartitioned;
+ALTER TABLE notifications ADD CONSTRAINT notifications_pkey PRIMARY KEY (notification_id, created_at);
+""" + CONSTRAINTS_AND_INDEXES
+
+UNPARTITION = """
+ALTER TABLE notifications RENAME TO notifications_partitioned;
+CREATE TABLE notifications (LIKE notifications_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+INSERT INTO notifications SELECT * FROM notifications_partitioned;
+DROP TABLE notifications_partitioned;
+ALTER TABLE notifications ADD CONSTRAINT notifications_pkey PRIMARY KEY (notification_id);
+""" + CONSTRAINTS_AND_INDEXES
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_task_archive'),
+    ]
+
+    operations = [
+        migrations.RunSQL(PARTITION, UNPARTITION),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-18 08:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_partition_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notifications',
+            name='dismissed',
+            field=models.BooleanField(default=False),
+        ),
+    ]
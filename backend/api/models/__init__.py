@@ -3,3 +3,5 @@ from .workspace import Workspace
 from .team_members import TeamMembers
 from .notifications import Notifications
 from .tasks import Tasks
+from .task_tombstones import TaskTombstones
+from .archived_tasks import ArchivedTasks
@@ -0,0 +1,46 @@
+from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.utils import timezone
+from api.models.workspace import Workspace
+from api.models.workspace import User
+
+# cold storage for tasks that have been done for a while (archive_done_tasks), so the
+# tasks table and every board read only carry active work. Same columns as Tasks, the
+# timestamps are plain fields so moving a row keeps them as they were.
+class ArchivedTasks(models.Model):
+    task_id = models.UUIDField(primary_key=True)
+    assignees = ArrayField(
+        base_field=models.UUIDField(),
+        blank=True,
+        default=list
+    )
+    tags = ArrayField(
+        base_field=models.CharField(max_length=20),
+        blank=True,
+        default=list
+    )
+    created_by = models.ForeignKey(User, on_delete=models.DO_NOTHING, related_name="archived_task_creator", null=True, blank=True)
+    title = models.CharField(max_length=200)
+    description = models.CharField(max_length=2000)
+    dueDate = models.DateField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    workspaceId = models.ForeignKey(
+        Workspace,
+        on_delete=models.CASCADE,
+        related_name="archived_tasks",
+    )
+    priority = models.CharField(max_length=20)
+    status = models.CharField(max_length=20)
+    version = models.IntegerField(default=1)
+    done_at = models.DateTimeField(null=True)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "archived_tasks"
+        indexes = [
+            # archive browsing, newest first
+            models.Index(fields=["workspaceId", "-archived_at", "task_id"], name="archived_ws_archived_idx"),
+            GinIndex(fields=["title"], opclasses=["gin_trgm_ops"], name="archived_title_trgm"),
+        ]
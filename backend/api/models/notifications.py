@@ -30,6 +30,8 @@ class Notifications(models.Model):
     fromUser = models.ForeignKey(User, on_delete=models.CASCADE, related_name="notification_from_user")
     toUser = models.ForeignKey(User, on_delete=models.CASCADE, related_name="notifications_to_user", null=True, blank=True)
     is_read=models.BooleanField(default=False)
+    # hidden from the inbox by its recipient, kept for the invite history
+    dismissed=models.BooleanField(default=False)
     to_email = models.EmailField(null=True, blank=True)
     messageId=models.ForeignKey(Message, on_delete=models.CASCADE, related_name="message_notfication", null=True, blank=True)
     type = models.CharField(
@@ -40,5 +42,13 @@ class Notifications(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # the table is partitioned by created_at month (migration 0009, api/utils/partitions.py),
+    # in the db the primary key is (notification_id, created_at)
     class Meta:
-        db_table="notifications"
\ No newline at end of file
+        db_table="notifications"
+        indexes = [
+            models.Index(fields=["toUser", "-created_at"], name="notif_to_user_created_idx"),
+            models.Index(fields=["to_email", "workspaceId"], name="notif_email_ws_idx"),
+            # unread badge only ever looks at the unread slice
+            models.Index(fields=["toUser"], condition=models.Q(is_read=False), name="notif_unread_idx"),
+        ]
\ No newline at end of file
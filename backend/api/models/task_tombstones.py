@@ -0,0 +1,21 @@
+from django.db import models
+from django.utils import timezone
+import uuid
+from api.models.workspace import Workspace
+
+# left behind by deleted tasks so delta sync clients learn about removals
+class TaskTombstones(models.Model):
+    tombstone_id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    task_id = models.UUIDField()
+    workspaceId = models.ForeignKey(Workspace, on_delete=models.CASCADE, related_name="task_tombstones")
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "task_tombstones"
+        indexes = [
+            models.Index(fields=["workspaceId", "deleted_at"], name="tombstones_ws_deleted_idx"),
+        ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 import uuid
 from api.models.workspace import Workspace
 from api.models.workspace import User
@@ -47,6 +49,30 @@ class Tasks(models.Model):
 
     priority = models.CharField(choices=Priority.choices, max_length=20)
     status = models.CharField(choices=Status.choices, max_length=20)
+    # fractional position inside the (workspace, status) column, see api/utils/ranking.py
+    rank = models.CharField(max_length=255, blank=True, default="", db_collation="C")
+    # title/tags/description tsvector, maintained by a db trigger (migration 0006) so every write path keeps it fresh
+    search_vector = SearchVectorField(null=True, editable=False)
+    # optimistic concurrency, every write bumps it and update_task only writes the version it read
+    version = models.IntegerField(default=1)
+    # when the task last moved into done, maintained by a db trigger (migration 0008); drives archiving
+    done_at = models.DateTimeField(null=True, editable=False)
 
     class Meta:
         db_table = "tasks"
+        indexes = [
+            models.Index(fields=["workspaceId", "status"], name="tasks_ws_status_idx"),
+            # get_all_tasks default keyset ordering
+            models.Index(fields=["workspaceId", "created_at", "task_id"], name="tasks_ws_created_idx"),
+            # tasks/changes/ delta sync
+            models.Index(fields=["workspaceId", "updated_at"], name="tasks_ws_updated_idx"),
+            # columns pre-sorted by rank
+            models.Index(fields=["workspaceId", "status", "rank", "task_id"], name="tasks_ws_status_rank_idx"),
+            GinIndex(fields=["search_vector"], name="tasks_search_gin"),
+            # typo tolerant / prefix matching on titles
+            GinIndex(fields=["title"], opclasses=["gin_trgm_ops"], name="tasks_title_trgm"),
+            # archive_done_tasks candidates
+            models.Index(fields=["done_at"], condition=models.Q(status="done"), name="tasks_done_at_idx"),
+            GinIndex(fields=["assignees"], name="tasks_assignees_gin"),
+            GinIndex(fields=["tags"], name="tasks_tags_gin"),
+        ]
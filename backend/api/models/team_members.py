@@ -26,6 +26,12 @@ class TeamMembers(models.Model):
     class Meta:
         db_table = "team_members"
         unique_together = ("workspaceId", "email")
+        indexes = [
+            models.Index(fields=["userId", "status"], name="team_members_user_status_idx"),
+            models.Index(fields=["workspaceId", "userId"], name="team_members_ws_user_idx"),
+            # invites waiting for the invitee to register
+            models.Index(fields=["email"], condition=models.Q(userId__isnull=True), name="team_members_unlinked_idx"),
+        ]
 
     def __str__(self):
         return f"{self.email} in {self.workspaceId.name}"
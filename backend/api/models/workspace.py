@@ -11,6 +11,8 @@ class Workspace(models.Model):
     name=models.CharField(max_length=100)
     description=models.CharField(max_length=1000)
     creator=models.ForeignKey(User, on_delete=models.CASCADE, related_name="workspace_created_by", null=True)
+    # bumped on every task/member/workspace write, read endpoints derive their ETag from it
+    version=models.BigIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
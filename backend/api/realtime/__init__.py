@@ -0,0 +1,48 @@
+import logging
+import threading
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Push channel to connected clients (api/realtime/asgi.py serves the connections). The broker
+# doing the fan-out is pluggable through REALTIME_BROKER, a dotted path to a BaseBroker
+# (api/realtime/base.py); the default keeps everything inside the process.
+
+logger = logging.getLogger(__name__)
+
+_broker = None
+_broker_lock = threading.Lock()
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(getattr(settings, "REALTIME_BROKER", "api.realtime.memory.InMemoryBroker"))()
+    return _broker
+
+def check_wsgi_broker():
+    # a WSGI process never holds a stream open, so with the in-process broker every board and
+    # notification push published from it reaches nobody
+    from api.realtime.memory import InMemoryBroker
+    if isinstance(get_broker(), InMemoryBroker):
+        logger.warning(
+            "Serving over WSGI with the in-process realtime broker (REALTIME_BROKER=%s): realtime "
+            "pushes are dropped. Serve Kanflow.asgi:application instead, or use a broker shared with the ASGI server.",
+            getattr(settings, "REALTIME_BROKER", "api.realtime.memory.InMemoryBroker"),
+        )
+        return False
+    return True
+
+def user_channel(user_id):
+    return f"user:{user_id}"
+
+def workspace_channel(workspace_id):
+    return f"workspace:{workspace_id}"
+
+def publish(channel, event, payload=None):
+    get_broker().publish(channel, {"event": event, "payload": payload})
+
+def publish_on_commit(channel, event, payload=None):
+    # nothing goes out for writes that end up rolled back
+    transaction.on_commit(lambda: publish(channel, event, payload))
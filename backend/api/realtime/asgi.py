@@ -0,0 +1,230 @@
+import asyncio
+import uuid
+from http.cookies import CookieError, SimpleCookie
+from urllib.parse import parse_qs
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from api.middlewares.auth_middleware import verify_access_token
+from api.realtime import get_broker, user_channel, workspace_channel
+from api.utils.user_utils import is_accepted_member
+from api.utils.token_cache import token_cache
+from api.utils.renderers import FastJSONRenderer
+
+# Long-lived push connections, served in front of the django ASGI app (Kanflow/asgi.py) so an
+# idle subscriber costs a couple of asyncio tasks instead of a worker thread. Each endpoint
+# comes as server-sent events and as a websocket, same messages on both:
+#   {"event": "ready"}          once subscribed; refetch anything that may have been missed
+#   {"event": ..., "payload": ...}  as published to the channel (api/realtime/__init__.py)
+#   {"event": "resync"}         this client fell behind and lost messages, refetch
+#   {"event": "revoked"}        access was lost meanwhile (checked every heartbeat), then closed
+# plus a heartbeat every REALTIME_HEARTBEAT_SECONDS (an SSE comment / {"event": "ping"}).
+# Browsers can't put headers on EventSource/WebSocket, so besides "Authorization: Bearer" the
+# access token is also taken from the access_token cookie. Never from the query string, that
+# would put a bearer token into access logs, proxy logs and browser history.
+
+_renderer = FastJSONRenderer()
+
+READY = {"event": "ready"}
+PING = {"event": "ping"}
+REVOKED = {"event": "revoked"}
+
+def _headers(scope):
+    return {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope.get("headers", [])}
+
+def _token(scope, headers):
+    authorization = headers.get("authorization", "")
+    if authorization.startswith("Bearer "):
+        return authorization[len("Bearer "):]
+    try:
+        cookie = SimpleCookie(headers.get("cookie", ""))
+    except CookieError:
+        return None
+    return cookie["access_token"].value if "access_token" in cookie else None
+
+async def _authenticate(scope, headers):
+    # -> (user id, None) or (None, (message, http status))
+    token = _token(scope, headers)
+    if not token:
+        return None, ("Auth token missing", 400)
+    # a token seen before is answered from memory, only new ones need a thread for the db
+    cached = token_cache.get(token)
+    if cached is None:
+        cached, error = await sync_to_async(verify_access_token)(token)
+        if error:
+            return None, error
+    return cached.sub, None
+
+def _allowed_origin(headers):
+    origin = headers.get("origin")
+    return origin if origin in getattr(settings, "CORS_ALLOWED_ORIGINS", []) else None
+
+async def _wait_disconnect(receive, kind):
+    while True:
+        message = await receive()
+        if message["type"] == f"{kind}.disconnect":
+            return
+
+async def _relay(subscription, receive, kind, send_message, still_allowed):
+    # forwards messages until the client goes away; send_message(None) sends a heartbeat
+    heartbeat = getattr(settings, "REALTIME_HEARTBEAT_SECONDS", 25)
+    disconnect = asyncio.ensure_future(_wait_disconnect(receive, kind))
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(subscription.get())
+            done, _ = await asyncio.wait({pending, disconnect}, timeout=heartbeat, return_when=asyncio.FIRST_COMPLETED)
+            if disconnect in done:
+                return
+            if pending in done:
+                message, pending = pending.result(), None
+                await send_message(message)
+            elif not await still_allowed():
+                await send_message(REVOKED)
+                return
+            else:
+                await send_message(None)
+    finally:
+        for task in (pending, disconnect):
+            if task is not None:
+                task.cancel()
+        subscription.close()
+
+async def _send_json(send, status, body, headers=()):
+    await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json"), *headers]})
+    await send({"type": "http.response.body", "body": _renderer.render(body)})
+
+def _recheck(resolve_channel, scope, user_id):
+    async def still_allowed():
+        return (await resolve_channel(scope, user_id))[1] is None
+    return still_allowed
+
+def sse_endpoint(resolve_channel):
+    # resolve_channel(scope, user_id) -> (channel, None) or (None, (message, http status))
+    async def endpoint(scope, receive, send):
+        headers = _headers(scope)
+        origin = _allowed_origin(headers)
+        cors = [(b"access-control-allow-origin", origin.encode()), (b"access-control-allow-credentials", b"true")] if origin else []
+        cors.append((b"vary", b"Origin"))
+        if scope["method"] == "OPTIONS":
+            await send({"type": "http.response.start", "status": 204, "headers": [
+                *cors, (b"access-control-allow-methods", b"GET"), (b"access-control-allow-headers", b"authorization"),
+            ]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        if scope["method"] != "GET":
+            await _send_json(send, 405, {"success": False, "message": "Method not allowed"}, cors)
+            return
+        user_id, error = await _authenticate(scope, headers)
+        if not error:
+            channel, error = await resolve_channel(scope, user_id)
+        if error:
+            message, status = error
+            await _send_json(send, status, {"success": False, "message": message}, cors)
+            return
+
+        # subscribed before anything is sent, nothing published from here on can be missed
+        subscription = get_broker().subscribe(channel)
+        await send({"type": "http.response.start", "status": 200, "headers": [
+            (b"content-type", b"text/event-stream"), (b"cache-control", b"no-cache"), (b"x-accel-buffering", b"no"), *cors,
+        ]})
+
+        async def send_message(message):
+            if message is None:
+                chunk = b": ping\n\n"
+            else:
+                payload = message.get("payload")
+                data = b"null" if payload is None else _renderer.render(payload)
+                chunk = b"event: " + message["event"].encode() + b"\ndata: " + data + b"\n\n"
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+        await send({"type": "http.response.body", "body": b"retry: 3000\n", "more_body": True})
+        await send_message(READY)
+        try:
+            await _relay(subscription, receive, "http", send_message, _recheck(resolve_channel, scope, user_id))
+        finally:
+            try:
+                await send({"type": "http.response.body", "body": b""})
+            except Exception:
+                pass
+    return endpoint
+
+def websocket_endpoint(resolve_channel):
+    async def endpoint(scope, receive, send):
+        if (await receive())["type"] != "websocket.connect":
+            return
+        headers = _headers(scope)
+        # the cookie would ride along on a cross-site page's socket too
+        if headers.get("origin") and not _allowed_origin(headers):
+            await send({"type": "websocket.close", "code": 4403})
+            return
+        user_id, error = await _authenticate(scope, headers)
+        if not error:
+            channel, error = await resolve_channel(scope, user_id)
+        if error:
+            await send({"type": "websocket.close", "code": 4000 + error[1]})
+            return
+
+        subscription = get_broker().subscribe(channel)
+        await send({"type": "websocket.accept"})
+
+        async def send_message(message):
+            await send({"type": "websocket.send", "text": _renderer.render(message or PING).decode()})
+
+        await send_message(READY)
+        try:
+            await _relay(subscription, receive, "websocket", send_message, _recheck(resolve_channel, scope, user_id))
+        finally:
+            try:
+                await send({"type": "websocket.close", "code": 1000})
+            except Exception:
+                pass
+    return endpoint
+
+async def _own_notifications(scope, user_id):
+    return user_channel(user_id), None
+
+async def _workspace_board(scope, user_id):
+    # ?workspaceId=, same membership rule as the task endpoints
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    try:
+        workspace_id = uuid.UUID(query["workspaceId"][0])
+    except (KeyError, ValueError):
+        return None, ("workspaceId is required", 400)
+    if not await sync_to_async(is_accepted_member)(user_id, workspace_id):
+        return None, ("User not authorized to get the data!", 401)
+    return workspace_channel(workspace_id), None
+
+ROUTES = {
+    "http": {
+        "/api/notifications/stream/": sse_endpoint(_own_notifications),
+        "/api/tasks/stream/": sse_endpoint(_workspace_board),
+    },
+    "websocket": {
+        "/ws/notifications/": websocket_endpoint(_own_notifications),
+        "/ws/board/": websocket_endpoint(_workspace_board),
+    },
+}
+
+class RealtimeRouter:
+    # ASGI app: realtime endpoints here, everything else to the django app
+    def __init__(self, django_app):
+        self.django_app = django_app
+
+    async def __call__(self, scope, receive, send):
+        endpoint = ROUTES.get(scope["type"], {}).get(scope.get("path"))
+        if endpoint is not None:
+            return await endpoint(scope, receive, send)
+        if scope["type"] == "websocket":
+            await receive()
+            await send({"type": "websocket.close", "code": 4404})
+            return
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        return await self.django_app(scope, receive, send)
@@ -0,0 +1,25 @@
+# What a realtime broker has to provide. Channels are plain strings ("user:<id>", ...) and
+# messages plain JSON-able dicts; delivery is best effort, at most once, in publish order per
+# channel. Subscribers that fall behind don't block publishers: their backlog is dropped and
+# their next get() returns a "resync" message so the client refetches instead.
+
+class Subscription:
+    async def get(self):
+        # next message for this subscriber, waits for one
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+class BaseBroker:
+    def subscribe(self, channel):
+        # called from the event loop serving the connection
+        raise NotImplementedError
+
+    def publish(self, channel, message):
+        # callable from any thread (sync views run off the event loop), never blocks on subscribers
+        raise NotImplementedError
+
+    def has_subscribers(self, channel):
+        # lets publishers skip building messages nobody listens to; unknown means True
+        return True
@@ -0,0 +1,80 @@
+import threading
+import time
+from django.conf import settings
+from django.db import transaction
+from api.realtime import get_broker, publish, workspace_channel
+
+# Board events on the workspace's "workspace:<id>" channel. Changes are collected for
+# REALTIME_BOARD_COALESCE_MS after the first one, so a burst of edits (a bulk request, a
+# column rebalance, someone dragging cards around) goes out as a single frame:
+#   tasks.changed  payload: {"workspaceId", "upserted": [task ids], "deleted": [task ids], "by": [user ids]}
+#                  or, past REALTIME_BOARD_MAX_IDS ids, {"workspaceId", "full": true, "by": [...]}
+# Clients pull the rows through tasks/changes/ with the sync cursor they already hold (or
+# refetch the board on "full"); "by" lets the author's own tab skip its echo.
+
+CHANGED = "tasks.changed"
+
+class BoardChanges:
+    def __init__(self):
+        self._pending = {}
+        self._wake = threading.Condition()
+        self._thread = None
+
+    def add(self, workspace_id, upserted=(), deleted=(), by=None):
+        workspace_id = str(workspace_id)
+        # nobody watching this board, nothing to collect
+        if not get_broker().has_subscribers(workspace_channel(workspace_id)):
+            return
+        window = getattr(settings, "REALTIME_BOARD_COALESCE_MS", 150) / 1000
+        with self._wake:
+            entry = self._pending.get(workspace_id)
+            if entry is None:
+                entry = self._pending[workspace_id] = {
+                    "due": time.monotonic() + window, "upserted": set(), "deleted": set(), "by": set(),
+                }
+            # the last thing that happened to a task wins
+            for task_id in map(str, upserted):
+                entry["deleted"].discard(task_id)
+                entry["upserted"].add(task_id)
+            for task_id in map(str, deleted):
+                entry["upserted"].discard(task_id)
+                entry["deleted"].add(task_id)
+            if by:
+                entry["by"].add(str(by))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="board-changes", daemon=True)
+                self._thread.start()
+            self._wake.notify()
+
+    def _due(self):
+        # -> entries whose window closed, waiting until there are some
+        with self._wake:
+            while True:
+                now = time.monotonic()
+                ready = [workspace_id for workspace_id, entry in self._pending.items() if entry["due"] <= now]
+                if ready:
+                    return [(workspace_id, self._pending.pop(workspace_id)) for workspace_id in ready]
+                timeout = min((entry["due"] for entry in self._pending.values()), default=None)
+                self._wake.wait(None if timeout is None else timeout - now)
+
+    def _run(self):
+        while True:
+            for workspace_id, entry in self._due():
+                max_ids = getattr(settings, "REALTIME_BOARD_MAX_IDS", 200)
+                payload = {"workspaceId": workspace_id, "by": sorted(entry["by"])}
+                if len(entry["upserted"]) + len(entry["deleted"]) > max_ids:
+                    payload["full"] = True
+                else:
+                    payload.update(upserted=sorted(entry["upserted"]), deleted=sorted(entry["deleted"]))
+                try:
+                    publish(workspace_channel(workspace_id), CHANGED, payload)
+                except Exception as e:
+                    print("Board change publish failed : ", e)
+
+board_changes = BoardChanges()
+
+def push_board_changes(workspace_id, upserted=(), deleted=(), by=None):
+    # queued once the write commits, nothing goes out for a rolled back one
+    upserted, deleted = list(upserted), list(deleted)
+    if upserted or deleted:
+        transaction.on_commit(lambda: board_changes.add(workspace_id, upserted, deleted, by))
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from collections import defaultdict
+from django.conf import settings
+from api.realtime.base import BaseBroker, Subscription
+
+# Fan-out inside one process: every subscriber owns a bounded asyncio queue on its event loop
+# and publishers hand messages over with call_soon_threadsafe. Enough for a single ASGI
+# server process (and tests); several processes need a broker they all share.
+
+RESYNC = {"event": "resync"}
+
+class MemorySubscription(Subscription):
+    def __init__(self, broker, channel, maxsize):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def deliver(self, message):
+        # runs on self.loop
+        if self.queue.full():
+            self.overflowed = True
+        else:
+            self.queue.put_nowait(message)
+
+    async def get(self):
+        if self.overflowed:
+            self.overflowed = False
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            return RESYNC
+        return await self.queue.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+class InMemoryBroker(BaseBroker):
+    def __init__(self):
+        self._channels = defaultdict(set)
+        self._lock = threading.Lock()
+        self.maxsize = getattr(settings, "REALTIME_QUEUE_SIZE", 100)
+
+    def subscribe(self, channel):
+        subscription = MemorySubscription(self, channel, self.maxsize)
+        with self._lock:
+            self._channels[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def has_subscribers(self, channel):
+        return channel in self._channels
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                # its loop is gone, the connection went with it
+                self.unsubscribe(subscription)
@@ -0,0 +1,29 @@
+from django.db import transaction
+from api.models.notifications import Notifications
+from api.serializers.notification_serializer import NOTIFICATION_PROJECTION
+from api.realtime import get_broker, publish, publish_on_commit, user_channel
+
+# Notification events pushed to their recipient's "user:<id>" channel:
+#   notification.created / notification.updated  payload: the row as get_all_notfications lists it
+#   notifications.changed                        no payload, several rows changed, refetch
+
+CREATED = "notification.created"
+UPDATED = "notification.updated"
+CHANGED = "notifications.changed"
+
+def _push(event, notification_ids):
+    rows = NOTIFICATION_PROJECTION.values(Notifications.objects.filter(notification_id__in=notification_ids))
+    for row in NOTIFICATION_PROJECTION.serialize(rows):
+        publish(user_channel(row["toUser"]), event, row)
+
+def push_notifications(event, notifications):
+    # notifications: saved instances; only the ones whose recipient is connected get read back
+    broker = get_broker()
+    ids = [n.notification_id for n in notifications if n.toUser_id and broker.has_subscribers(user_channel(n.toUser_id))]
+    if ids:
+        transaction.on_commit(lambda: _push(event, ids))
+
+def push_notifications_changed(*user_ids):
+    for user_id in user_ids:
+        if user_id:
+            publish_on_commit(user_channel(user_id), CHANGED)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from api.models.notifications import Notifications
+from api.serializers.projection import Projection
 
 class NotificationSerializer(serializers.ModelSerializer):
     name = serializers.SerializerMethodField()
@@ -34,4 +35,11 @@ class NotificationSerializer(serializers.ModelSerializer):
         return obj.workspaceId.name if obj.workspaceId else None
 
     def get_senderEmail(self, obj):
-        return obj.fromUser.email if obj.fromUser else None
\ No newline at end of file
+        return obj.fromUser.email if obj.fromUser else None
+
+NOTIFICATION_PROJECTION = Projection(NotificationSerializer, {
+    "name": "fromUser__name",
+    "message_content": "messageId__content",
+    "workspace_name": "workspaceId__name",
+    "senderEmail": "fromUser__email",
+})
@@ -1,12 +1,21 @@
 from rest_framework import serializers
 from api.models.tasks import Tasks
+from api.models.archived_tasks import ArchivedTasks
+from api.serializers.projection import Projection
 
 class TaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tasks
-        exclude = ['workspaceId', 'description']
+        exclude = ['workspaceId', 'description', 'search_vector', 'done_at']
 
 class TaskSerializerDetailed(serializers.ModelSerializer):
     class Meta:
         model = Tasks
-        exclude = ['workspaceId']
\ No newline at end of file
+        exclude = ['workspaceId', 'search_vector']
+
+class ArchivedTaskSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ArchivedTasks
+        exclude = ['workspaceId']
+
+TASK_PROJECTION = Projection(TaskSerializer)
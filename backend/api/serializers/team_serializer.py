@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from api.models.team_members import TeamMembers
+from api.serializers.projection import Projection
 
 class TeamSerializer(serializers.ModelSerializer):
     name = serializers.SerializerMethodField()
@@ -8,4 +9,6 @@ class TeamSerializer(serializers.ModelSerializer):
         fields=['member_id','userId','email','status','privilege','updated_at','name']
     
     def get_name(self, obj):
-        return obj.userId.name if obj.userId else None
\ No newline at end of file
+        return obj.userId.name if obj.userId else None
+
+TEAM_PROJECTION = Projection(TeamSerializer, {"name": "userId__name"})
@@ -2,7 +2,7 @@ from rest_framework import serializers
 from api.models.workspace import Workspace
 
 class WorkspaceSerializer(serializers.ModelSerializer):
-    creator = serializers.UUIDField(source='creator.userId', read_only=True)
+    creator = serializers.UUIDField(source='creator_id', read_only=True)
     class Meta:
         model = Workspace
         fields = ['workspaceId', 'name', 'description', 'creator']
@@ -0,0 +1,44 @@
+import uuid
+from datetime import date
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from api.models.tasks import Tasks
+from api.models.team_members import TeamMembers
+from api.models.user import User
+from api.models.workspace import Workspace
+from api.utils.jwt_utils import generate_token
+from api.utils.token_cache import token_cache
+
+def make_user(name=None):
+    name = name or f"user-{uuid.uuid4().hex[:8]}"
+    return User.objects.create(name=name, email=f"{name}@example.com", password="x")
+
+def add_member(workspace, user, privilege="user", status="accepted"):
+    return TeamMembers.objects.create(userId=user, email=user.email, workspaceId=workspace, privilege=privilege, status=status)
+
+def make_board():
+    # -> (admin, member, workspace), both accepted members
+    admin, member = make_user(), make_user()
+    workspace = Workspace.objects.create(name="Board", description="Test board", creator=admin)
+    add_member(workspace, admin, privilege="admin")
+    add_member(workspace, member)
+    return admin, member, workspace
+
+def make_task(workspace, creator, **fields):
+    fields = {
+        "title": "Task", "description": "Description", "dueDate": date(2026, 1, 1),
+        "priority": "medium", "status": "todo", **fields,
+    }
+    return Tasks.objects.create(workspaceId=workspace, created_by=creator, **fields)
+
+def client_for(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION="Bearer " + generate_token(user.userId)["access_token"])
+    return client
+
+class ApiTestCase(TestCase):
+    def setUp(self):
+        # memberships, rollups and job records live in the cache, which outlives rolled back rows
+        cache.clear()
+        token_cache.clear()
@@ -0,0 +1,69 @@
+import datetime
+import jwt
+from unittest import mock
+from django.test import SimpleTestCase
+from api.tests.helpers import ApiTestCase, client_for, make_user
+from api.utils.jwt_utils import JWT_ALGORITHM, JWT_SECRET, generate_token
+from api.utils.token_cache import Principal, TokenCache, token_cache
+
+NOW = 1_800_000_000.0
+
+class TokenCacheTests(SimpleTestCase):
+    def cache_at(self, now, **kwargs):
+        patcher = mock.patch("api.utils.token_cache.time.time", return_value=now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return TokenCache(**{"max_entries": 10, "max_ttl": 300, **kwargs})
+
+    def test_entry_never_outlives_the_token(self):
+        cache = self.cache_at(NOW)
+        cache.set("token", "sub", NOW + 10, None)
+        self.assertIsNotNone(cache.get("token"))
+        with mock.patch("api.utils.token_cache.time.time", return_value=NOW + 10):
+            self.assertIsNone(cache.get("token"))
+        # gone for good, not just hidden
+        self.assertIsNone(cache.get("token"))
+
+    def test_entry_is_bounded_by_the_ttl(self):
+        cache = self.cache_at(NOW)
+        cache.set("token", "sub", NOW + 3600, None)
+        with mock.patch("api.utils.token_cache.time.time", return_value=NOW + 299):
+            self.assertIsNotNone(cache.get("token"))
+        with mock.patch("api.utils.token_cache.time.time", return_value=NOW + 300):
+            self.assertIsNone(cache.get("token"))
+
+    def test_least_recently_used_entry_goes_first(self):
+        cache = self.cache_at(NOW, max_entries=2)
+        cache.set("a", "a", NOW + 60, None)
+        cache.set("b", "b", NOW + 60, None)
+        cache.get("a")
+        cache.set("c", "c", NOW + 60, None)
+        self.assertEqual([token for token in "abc" if cache.get(token)], ["a", "c"])
+
+class AccessTokenTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = make_user()
+
+    def test_verified_token_is_reused(self):
+        client = client_for(self.user)
+        self.assertEqual(client.get("/api/workspace/get_all_workspaces/").status_code, 200)
+        token = client._credentials["HTTP_AUTHORIZATION"].split(" ")[1]
+        cached = token_cache.get(token)
+        self.assertEqual((cached.sub, cached.principal.email), (str(self.user.userId), self.user.email))
+        # the user row isn't read again to authenticate
+        with mock.patch("api.middlewares.auth_middleware.decode_token") as decode:
+            self.assertEqual(client.get("/api/workspace/get_all_workspaces/").status_code, 200)
+        decode.assert_not_called()
+
+    def test_cached_token_is_refused_once_expired(self):
+        # cached while it was valid, the way the middleware stores it: bounded by its own exp
+        exp = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=1)
+        token = jwt.encode({"sub": str(self.user.userId), "type": "access", "exp": exp}, JWT_SECRET, algorithm=JWT_ALGORITHM)
+        token_cache.set(token, str(self.user.userId), exp.timestamp(), Principal(self.user.userId, self.user.name, self.user.email))
+        response = self.client.get("/api/workspace/get_all_workspaces/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(response.status_code, 401)
+
+    def test_refresh_token_is_not_an_access_token(self):
+        token = generate_token(self.user.userId)["refresh_token"]
+        self.assertEqual(self.client.get("/api/workspace/get_all_workspaces/", HTTP_AUTHORIZATION=f"Bearer {token}").status_code, 401)
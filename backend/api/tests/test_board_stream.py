@@ -0,0 +1,85 @@
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.test import SimpleTestCase, override_settings
+from api.realtime import check_wsgi_broker, get_broker, workspace_channel
+from api.realtime.board import BoardChanges
+from api.tests.helpers import client_for, make_board, make_task, make_user
+from api.tests.test_realtime import RealtimeTestCase, http_scope
+
+@override_settings(REALTIME_BOARD_COALESCE_MS=300, REALTIME_BOARD_MAX_IDS=5)
+class BoardStreamTests(RealtimeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.tasks = [make_task(self.workspace, self.admin, title=f"Task {i}") for i in range(3)]
+        self.outsider = make_user()
+        self.client = client_for(self.member)
+
+    def board(self, user):
+        return http_scope("/api/tasks/stream/", [("authorization", f"Bearer {self.token(user)}")], query=f"workspaceId={self.workspace.workspaceId}".encode())
+
+    def write(self, url, body):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(url, {"workspaceId": str(self.workspace.workspaceId), **body}, format="json")
+
+    async def test_only_members_can_watch(self):
+        self.assertEqual(await self.refused(self.board(self.outsider)), (401, "User not authorized to get the data!"))
+        scope = http_scope("/api/tasks/stream/", [("authorization", f"Bearer {self.token(self.member)}")])
+        self.assertEqual(await self.refused(scope), (400, "workspaceId is required"))
+
+    @override_settings(REALTIME_HEARTBEAT_SECONDS=0.05)
+    async def test_removed_member_is_cut_off(self):
+        async with self.open(self.board(self.member)) as (communicator, start):
+            self.assertEqual(start["status"], 200)
+            self.assertEqual(await self.events(communicator, 1), [("ready", None)])
+            await sync_to_async(lambda: client_for(self.admin).post("/api/team_members/remove_member/", {
+                "workspaceId": str(self.workspace.workspaceId), "email": self.member.email,
+            }, format="json"))()
+            self.assertEqual(await self.events(communicator, 1), [("revoked", None)])
+            # the stream ends after it
+            self.assertFalse((await communicator.receive_output(5)).get("more_body"))
+
+    async def test_burst_of_writes_is_one_frame(self):
+        async with self.open(self.board(self.admin)) as (communicator, _):
+            await self.events(communicator, 1)
+            doomed, edited = self.tasks[0], self.tasks[1]
+            await sync_to_async(self.write)("/api/tasks/bulk/", {"operations": [
+                {"op": "update", "task_id": str(doomed.task_id), "title": "Edited first"},
+                {"op": "update", "task_id": str(edited.task_id), "title": "Edited"},
+            ]})
+            deleted = await sync_to_async(self.write)("/api/tasks/delete_task/", {"taskId": str(doomed.task_id)})
+            self.assertEqual(deleted.status_code, 200)
+            [(event, payload)] = await self.events(communicator, 1)
+            self.assertEqual(event, "tasks.changed")
+            # the delete came last, it wins over the earlier update
+            self.assertEqual(payload, {
+                "workspaceId": str(self.workspace.workspaceId), "by": [str(self.member.userId)],
+                "upserted": [str(edited.task_id)], "deleted": [str(doomed.task_id)],
+            })
+            self.assertTrue(await communicator.receive_nothing(0.2))
+
+    async def test_large_burst_asks_for_a_refetch(self):
+        async with self.open(self.board(self.admin)) as (communicator, _):
+            await self.events(communicator, 1)
+            await sync_to_async(self.write)("/api/tasks/bulk/", {"operations": [
+                {"op": "create", "title": f"New {i}", "description": "d", "dueDate": "2026-02-01", "priority": "low", "status": "todo"}
+                for i in range(6)
+            ]})
+            [(event, payload)] = await self.events(communicator, 1)
+            self.assertEqual(payload, {"workspaceId": str(self.workspace.workspaceId), "by": [str(self.member.userId)], "full": True})
+
+    def test_unwatched_boards_collect_nothing(self):
+        changes = BoardChanges()
+        self.assertFalse(get_broker().has_subscribers(workspace_channel(self.workspace.workspaceId)))
+        changes.add(self.workspace.workspaceId, [self.tasks[0].task_id])
+        self.assertEqual(changes._pending, {})
+        self.assertIsNone(changes._thread)
+
+class WsgiBrokerCheckTests(SimpleTestCase):
+    def test_in_process_broker_is_reported_under_wsgi(self):
+        with self.assertLogs("api.realtime", "WARNING") as logs:
+            self.assertFalse(check_wsgi_broker())
+        self.assertIn("Kanflow.asgi:application", logs.output[0])
+        # a broker shared between processes gets pushes from WSGI workers to the ASGI server
+        with mock.patch("api.realtime._broker", object()), self.assertNoLogs("api.realtime"):
+            self.assertTrue(check_wsgi_broker())
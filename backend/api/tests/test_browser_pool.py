@@ -0,0 +1,99 @@
+import asyncio
+from types import SimpleNamespace
+from django.test import SimpleTestCase
+from api.utils.browser_pool import BrowserPool
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def close(self):
+        pass
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+class BrowserPoolTests(SimpleTestCase):
+    # the pool's own event loop logic, with stand-ins for playwright's browsers
+    def pool(self, size=1, max_jobs=3):
+        pool = BrowserPool(size=size, max_jobs=max_jobs)
+        self.launched = []
+
+        async def launch():
+            browser = FakeBrowser()
+            self.launched.append(browser)
+            return browser
+
+        pool._playwright = SimpleNamespace(chromium=SimpleNamespace(launch=launch))
+        pool._slots, pool._idle = asyncio.Semaphore(size), []
+        return pool
+
+    def test_warm_browsers_are_reused_up_to_max_jobs(self):
+        pool = self.pool(max_jobs=2)
+
+        async def job(context):
+            return context.browser
+
+        async def scenario():
+            return [await pool._run(job, 5, {}) for _ in range(3)]
+
+        first, second, third = asyncio.run(scenario())
+        self.assertIs(first, second)
+        self.assertTrue(first.closed)
+        self.assertIsNot(third, first)
+        self.assertEqual(len(self.launched), 2)
+
+    def test_failed_and_timed_out_jobs_give_their_slot_back(self):
+        pool = self.pool(size=1)
+
+        async def broken(context):
+            raise ValueError("render failed")
+
+        async def stuck(context):
+            await asyncio.sleep(10)
+
+        async def fine(context):
+            return "pdf"
+
+        async def scenario():
+            with self.assertRaises(ValueError):
+                await pool._run(broken, 5, {})
+            with self.assertRaises(asyncio.TimeoutError):
+                await pool._run(stuck, 0.05, {})
+            # a single slot, this would hang if either of the above kept it
+            return await asyncio.wait_for(pool._run(fine, 5, {}), 1)
+
+        self.assertEqual(asyncio.run(scenario()), "pdf")
+        # browsers that failed a job aren't trusted with the next one
+        self.assertEqual([browser.closed for browser in self.launched], [True, True, False])
+
+    def test_at_most_size_jobs_run_at_once(self):
+        pool = self.pool(size=2)
+        running, peak = 0, 0
+
+        async def job(context):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async def scenario():
+            await asyncio.gather(*(pool._run(job, 5, {}) for _ in range(6)))
+
+        asyncio.run(scenario())
+        self.assertEqual(peak, 2)
+        self.assertEqual(len(self.launched), 2)
@@ -0,0 +1,99 @@
+from django.test import override_settings
+from api.models.task_tombstones import TaskTombstones
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+from api.utils.versioning import get_workspace_version
+
+NEW_TASK = {"title": "New", "description": "d", "dueDate": "2026-02-01", "priority": "low", "status": "todo"}
+
+class BulkTaskTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.other_workspace = make_board()[2]
+        self.client = client_for(self.member)
+        self.keep, self.move, self.drop = (make_task(self.workspace, self.admin, title=f"Task {i}") for i in range(3))
+
+    def bulk(self, operations):
+        return self.client.post("/api/tasks/bulk/", {"workspaceId": str(self.workspace.workspaceId), "operations": operations}, format="json")
+
+    def assertUntouched(self):
+        self.assertEqual(Tasks.objects.filter(workspaceId=self.workspace).count(), 3)
+        self.assertEqual(Tasks.objects.get(task_id=self.move.task_id).version, 1)
+        self.assertFalse(TaskTombstones.objects.exists())
+
+    def test_applies_every_operation(self):
+        version = get_workspace_version(self.workspace.workspaceId)
+        response = self.bulk([
+            {"op": "create", **NEW_TASK},
+            {"op": "update", "task_id": str(self.move.task_id), "status": "done", "version": 1},
+            {"op": "delete", "task_id": str(self.drop.task_id)},
+        ])
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()["payload"]
+        self.assertEqual(payload["summary"], {"created": 1, "updated": 1, "deleted": 1})
+        created, updated, deleted = payload["results"]
+        self.assertEqual(created["task"]["title"], "New")
+        self.assertTrue(Tasks.objects.filter(task_id=created["task_id"], created_by=self.member).exists())
+        self.assertEqual(updated["task"]["status"], "done")
+        self.assertEqual((deleted["op"], deleted["success"], deleted["task_id"]), ("delete", True, str(self.drop.task_id)))
+
+        moved = Tasks.objects.get(task_id=self.move.task_id)
+        self.assertEqual((moved.status, moved.version), ("done", 2))
+        # a card changing column lands at the bottom of the new one
+        self.assertTrue(moved.rank)
+        self.assertFalse(Tasks.objects.filter(task_id=self.drop.task_id).exists())
+        self.assertTrue(TaskTombstones.objects.filter(task_id=self.drop.task_id).exists())
+        self.assertGreater(get_workspace_version(self.workspace.workspaceId), version)
+
+    def test_invalid_item_applies_nothing(self):
+        response = self.bulk([
+            {"op": "create", **NEW_TASK},
+            {"op": "update", "task_id": str(self.move.task_id), "priority": "urgent"},
+            {"op": "rename"},
+            {"op": "delete", "task_id": "not-a-uuid"},
+        ])
+        self.assertEqual(response.status_code, 400)
+        results = response.json()["payload"]["results"]
+        self.assertEqual([r["success"] for r in results], [True, False, False, False])
+        self.assertEqual(results[1]["message"], "Invalid priority")
+        self.assertUntouched()
+
+    def test_unknown_or_foreign_task_applies_nothing(self):
+        foreign = make_task(self.other_workspace, self.admin)
+        for task_id in (str(foreign.task_id), "00000000-0000-0000-0000-000000000000"):
+            with self.subTest(task_id=task_id):
+                response = self.bulk([
+                    {"op": "update", "task_id": str(self.move.task_id), "title": "Changed"},
+                    {"op": "delete", "task_id": task_id},
+                ])
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["payload"]["results"][1]["message"], "Task not found")
+                self.assertUntouched()
+        self.assertTrue(Tasks.objects.filter(task_id=foreign.task_id).exists())
+
+    def test_stale_version_conflicts(self):
+        Tasks.objects.filter(task_id=self.move.task_id).update(version=3)
+        response = self.bulk([
+            {"op": "delete", "task_id": str(self.drop.task_id)},
+            {"op": "update", "task_id": str(self.move.task_id), "title": "Changed", "version": 1},
+        ])
+        self.assertEqual(response.status_code, 409)
+        conflict = response.json()["payload"]["results"][1]
+        self.assertEqual((conflict["success"], conflict["current_version"]), (False, 3))
+        self.assertTrue(Tasks.objects.filter(task_id=self.drop.task_id).exists())
+        self.assertEqual(Tasks.objects.get(task_id=self.move.task_id).title, "Task 1")
+
+    def test_rejects_malformed_requests(self):
+        task_id = str(self.keep.task_id)
+        with override_settings(TASK_BULK_MAX_OPERATIONS=2):
+            self.assertEqual(self.bulk([{"op": "delete", "task_id": task_id}] * 3).status_code, 400)
+        self.assertEqual(self.bulk([]).status_code, 400)
+        self.assertEqual(self.bulk({"op": "delete"}).status_code, 400)
+        response = self.bulk([{"op": "update", "task_id": task_id, "title": "x"}, {"op": "delete", "task_id": task_id}])
+        self.assertEqual(response.json()["payload"]["results"][1]["message"], "Task referenced more than once")
+
+        outsider = client_for(make_user())
+        response = outsider.post("/api/tasks/bulk/", {"workspaceId": str(self.workspace.workspaceId), "operations": [{"op": "delete", "task_id": task_id}]}, format="json")
+        self.assertEqual(response.status_code, 401)
+        self.assertTrue(Tasks.objects.filter(task_id=task_id).exists())
@@ -0,0 +1,103 @@
+import gzip
+import uuid
+from datetime import date, timedelta
+import msgpack
+from django.test import SimpleTestCase, override_settings
+from api.models.notifications import Notifications
+from api.serializers.notification_serializer import NOTIFICATION_PROJECTION
+from api.serializers.task_serializer import TASK_PROJECTION
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task
+from api.utils.columnar import EPOCH, EPOCH_DAY, columnar
+
+COLUMNAR = "application/vnd.kanflow.columnar+msgpack"
+
+def decode(value, kind):
+    # the client side of api/utils/columnar.py, back to the JSON forms
+    if kind == "uuid":
+        return str(uuid.UUID(bytes=value))
+    if kind == "uuid_list":
+        return [str(uuid.UUID(bytes=v)) for v in value]
+    if kind == "datetime":
+        return (EPOCH + timedelta(microseconds=value)).isoformat().replace("+00:00", "Z")
+    if kind == "date":
+        return date.fromordinal(value + EPOCH_DAY).isoformat()
+
+def rows(table, kinds):
+    columns, dictionaries = table["columns"], table["dictionaries"]
+    out = []
+    for i in range(table["count"]):
+        row = {}
+        for key, values in columns.items():
+            value = values[i]
+            if value is not None and key in dictionaries:
+                value = dictionaries[key][value]
+            elif value is not None and key in kinds:
+                value = decode(value, kinds[key])
+            row[key] = value
+        out.append(row)
+    return out
+
+class ColumnarLayoutTests(SimpleTestCase):
+    def test_unknown_choices_and_nulls_round_trip(self):
+        data = [{"status": "todo", "id": None}, {"status": "someday", "id": "0b7e8a4c-1f7f-4d8e-9a55-3b1a2f6e2c11"}, {"status": None, "id": None}]
+        table = columnar(data, ["status", "id"], {"id": "uuid"}, {"status": ["todo", "done"]})
+        self.assertEqual(table["dictionaries"]["status"], ["todo", "done", "someday"])
+        self.assertEqual(table["columns"]["status"], [0, 2, None])
+        self.assertEqual(rows(table, {"id": "uuid"}), data)
+
+class ColumnarListingTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        for i in range(6):
+            make_task(self.workspace, self.admin, title=f"Task {i}", status=["todo", "done", "blocked"][i % 3],
+                      assignees=[self.member.userId] if i % 2 else [], tags=["bug"] if i % 3 else [])
+        for _ in range(2):
+            Notifications.objects.create(fromUser=self.admin, toUser=self.member, workspaceId=self.workspace, type="info", reaction=None)
+
+    def board(self, **headers):
+        return self.client.post("/api/tasks/get_all_tasks/", {"workspaceId": str(self.workspace.workspaceId)}, format="json", **headers)
+
+    def test_board_round_trips_to_the_json_listing(self):
+        expected = self.board().json()["payload"]
+        response = self.board(HTTP_ACCEPT=COLUMNAR)
+        self.assertEqual(response["Content-Type"], COLUMNAR)
+        payload = msgpack.unpackb(response.content)["payload"]
+        self.assertEqual(rows(payload["tasks"], TASK_PROJECTION.kinds), expected["tasks"])
+        self.assertEqual({u["userId"]: u for u in rows(payload["users"], {"userId": "uuid"})}, expected["users"])
+
+    def test_notifications_round_trip(self):
+        expected = self.client.get("/api/notifications/get_all_notfications/").json()["payload"]["notifications"]
+        response = self.client.get("/api/notifications/get_all_notfications/", HTTP_ACCEPT=COLUMNAR)
+        payload = msgpack.unpackb(response.content)["payload"]
+        self.assertEqual(rows(payload["notifications"], NOTIFICATION_PROJECTION.kinds), expected)
+
+    @override_settings(COLUMNAR_GZIP_MIN_BYTES=0)
+    def test_gzipped_when_the_client_takes_it(self):
+        plain = self.board(HTTP_ACCEPT=COLUMNAR)
+        self.assertNotIn("Content-Encoding", plain)
+        zipped = self.board(HTTP_ACCEPT=COLUMNAR, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(zipped["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", zipped["Vary"])
+        plain, unzipped = msgpack.unpackb(plain.content), msgpack.unpackb(gzip.decompress(zipped.content))
+        plain["payload"].pop("sync_cursor"), unzipped["payload"].pop("sync_cursor")
+        self.assertEqual(unzipped, plain)
+
+    @override_settings(COLUMNAR_GZIP_MIN_BYTES=0)
+    def test_gzipped_body_has_its_own_tag(self):
+        plain = self.board(HTTP_ACCEPT=COLUMNAR)["ETag"]
+        zipped = self.board(HTTP_ACCEPT=COLUMNAR, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+        self.assertEqual(zipped, plain[:-1] + '-gzip"')
+        # either tag revalidates the version, the 304 echoes the one the client holds
+        for etag in (plain, zipped):
+            with self.subTest(etag=etag):
+                response = self.board(HTTP_ACCEPT=COLUMNAR, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual((response.status_code, response["ETag"]), (304, etag))
+
+    @override_settings(COLUMNAR_GZIP_MIN_BYTES=0)
+    def test_refused_codings_are_honoured(self):
+        for header, zipped in (("gzip;q=0, br", False), ("br, *;q=0", False), ("identity, *;q=0.5", True), ("GZIP; Q=0.8", True)):
+            with self.subTest(header=header):
+                response = self.board(HTTP_ACCEPT=COLUMNAR, HTTP_ACCEPT_ENCODING=header)
+                self.assertEqual(response.get("Content-Encoding") == "gzip", zipped)
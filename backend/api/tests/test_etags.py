@@ -0,0 +1,70 @@
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+
+class ConditionalReadTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        make_task(self.workspace, self.admin)
+        self.client = client_for(self.admin)
+        self.body = {"workspaceId": str(self.workspace.workspaceId)}
+
+    def board(self, **headers):
+        return self.client.post("/api/tasks/get_all_tasks/", self.body, format="json", **headers)
+
+    def test_unchanged_board_is_not_modified(self):
+        etag = self.board()["ETag"]
+        # membership is cached by now: a poll of an idle board is the version lookup alone
+        with self.assertNumQueries(1):
+            response = self.board(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(response.content)
+
+    def test_weak_and_wildcard_validators_match(self):
+        etag = self.board()["ETag"]
+        self.assertEqual(self.board(HTTP_IF_NONE_MATCH=f'"other", W/{etag}').status_code, 304)
+        self.assertEqual(self.board(HTTP_IF_NONE_MATCH="*").status_code, 304)
+        self.assertEqual(self.board(HTTP_IF_NONE_MATCH='"other"').status_code, 201)
+
+    def test_task_write_changes_the_tag(self):
+        etag = self.board()["ETag"]
+        self.client.post("/api/tasks/create_task/", {
+            **self.body, "title": "New", "description": "d", "dueDate": "2026-01-01", "priority": "low", "status": "todo",
+        }, format="json")
+        response = self.board(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 201)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.json()["payload"]["tasks"]), 2)
+
+    def test_filters_are_part_of_the_tag(self):
+        etag = self.board()["ETag"]
+        response = self.client.post("/api/tasks/get_all_tasks/", {**self.body, "status": "done"}, format="json", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 201)
+
+    def test_members_tag_follows_member_writes(self):
+        url = "/api/team_members/all_team_members/"
+        etag = self.client.post(url, self.body, format="json")["ETag"]
+        self.assertEqual(self.client.post(url, self.body, format="json", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.client.post("/api/team_members/remove_member/", {**self.body, "email": self.member.email}, format="json")
+        response = self.client.post(url, self.body, format="json", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["payload"]["in_team"]), 1)
+
+    def test_workspace_tags_follow_workspace_writes(self):
+        etag = self.client.post("/api/workspace/get_workspace/", self.body, format="json")["ETag"]
+        list_etag = self.client.get("/api/workspace/get_all_workspaces/")["ETag"]
+        self.assertEqual(self.client.get("/api/workspace/get_all_workspaces/", HTTP_IF_NONE_MATCH=list_etag).status_code, 304)
+        self.client.post("/api/workspace/update_workspace_name/", {**self.body, "workspaceNewName": "Renamed"}, format="json")
+        response = self.client.post("/api/workspace/get_workspace/", self.body, format="json", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["payload"]["name"], "Renamed")
+        self.assertEqual(self.client.get("/api/workspace/get_all_workspaces/", HTTP_IF_NONE_MATCH=list_etag).status_code, 200)
+
+    def test_outsiders_get_no_validator(self):
+        etag = self.board()["ETag"]
+        outsider = client_for(make_user())
+        for url in ("/api/tasks/get_all_tasks/", "/api/team_members/all_team_members/", "/api/workspace/get_workspace/"):
+            with self.subTest(url=url):
+                response = outsider.post(url, self.body, format="json", HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 401)
+                self.assertNotIn("ETag", response)
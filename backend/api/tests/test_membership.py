@@ -0,0 +1,53 @@
+from api.models.team_members import TeamMembers
+from api.models.notifications import Notifications
+from api.tests.helpers import ApiTestCase, add_member, client_for, make_board, make_user
+from api.utils.user_utils import get_membership, is_accepted_member
+
+class MembershipCacheTests(ApiTestCase):
+    # every write to a membership has to drop the cached copy, or access outlives it
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.admin_client = client_for(self.admin)
+        self.body = {"workspaceId": str(self.workspace.workspaceId)}
+
+    def can_open_board(self, user):
+        response = client_for(user).post("/api/workspace/get_workspace/", self.body, format="json")
+        self.assertIn(response.status_code, (200, 401))
+        return response.status_code == 200
+
+    def test_removed_member_is_refused(self):
+        self.assertTrue(self.can_open_board(self.member))
+        response = self.admin_client.post("/api/team_members/remove_member/", {**self.body, "email": self.member.email}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.can_open_board(self.member))
+
+    def test_privilege_changes_apply_at_once(self):
+        rename = {**self.body, "workspaceNewName": "Renamed"}
+        member_client = client_for(self.member)
+        self.assertEqual(member_client.post("/api/workspace/update_workspace_name/", rename, format="json").status_code, 401)
+        self.admin_client.post("/api/team_members/change_privilege/", {**self.body, "privilege": "admin", "roleChangeEmail": self.member.email}, format="json")
+        self.assertEqual(member_client.post("/api/workspace/update_workspace_name/", rename, format="json").status_code, 200)
+        self.admin_client.post("/api/team_members/change_privilege/", {**self.body, "privilege": "user", "roleChangeEmail": self.member.email}, format="json")
+        self.assertEqual(member_client.post("/api/workspace/update_workspace_name/", rename, format="json").status_code, 401)
+
+    def test_accepted_invite_grants_access(self):
+        invited = make_user()
+        add_member(self.workspace, invited, status="pending")
+        notification = Notifications.objects.create(fromUser=self.admin, toUser=invited, to_email=invited.email, workspaceId=self.workspace, type="request")
+        self.assertFalse(self.can_open_board(invited))
+        response = client_for(invited).post("/api/notifications/accept_reject_workspace_invite/", {
+            **self.body, "reaction": "accepted", "notification_id": str(notification.notification_id),
+        }, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.can_open_board(invited))
+
+    def test_invite_replaces_a_cached_non_membership(self):
+        outsider = make_user()
+        self.assertIsNone(get_membership(outsider.userId, self.workspace.workspaceId))
+        response = self.admin_client.post("/api/workspace/invite_team_member/", {
+            **self.body, "team_members": [{"email": outsider.email, "privilege": "user", "status": "pending"}],
+        }, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_membership(outsider.userId, self.workspace.workspaceId).status, TeamMembers.Status.PENDING)
+        self.assertFalse(is_accepted_member(outsider.userId, self.workspace.workspaceId))
@@ -0,0 +1,100 @@
+from django.test import override_settings
+from api.models.message import Message
+from api.models.notifications import Notifications
+from api.models.team_members import TeamMembers
+from api.tests.helpers import ApiTestCase, add_member, client_for, make_board, make_user
+
+class BulkNotificationTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, _, self.workspace = make_board()
+        self.other_admin, _, self.other_workspace = make_board()
+        self.user = make_user()
+        self.client = client_for(self.user)
+        self.infos = [self.notify(type="info", reaction=None) for _ in range(3)]
+        self.invites = [self.invite(self.workspace, self.admin), self.invite(self.other_workspace, self.other_admin)]
+        # someone else's inbox, never touched by this user's requests
+        self.foreign = Notifications.objects.create(fromUser=self.admin, toUser=self.admin, type="info", reaction=None)
+
+    def notify(self, **fields):
+        message = Message.objects.create(content="Hello")
+        return Notifications.objects.create(fromUser=self.admin, toUser=self.user, workspaceId=self.workspace, messageId=message, **fields)
+
+    def invite(self, workspace, admin):
+        add_member(workspace, self.user, status="pending")
+        return Notifications.objects.create(fromUser=admin, toUser=self.user, to_email=self.user.email, workspaceId=workspace, type="request")
+
+    def post(self, url, **data):
+        return self.client.post(f"/api/notifications/{url}/", data, format="json")
+
+    def ids(self, *notifications):
+        return [str(n.notification_id) for n in notifications]
+
+    def unread(self):
+        return self.client.get("/api/notifications/unread_count/").json()["payload"]["unread"]
+
+    def test_mark_read_by_id_and_all(self):
+        self.assertEqual(self.unread(), 5)
+        response = self.post("mark_read", notification_ids=self.ids(*self.infos[:2], self.foreign))
+        self.assertEqual(response.json()["payload"], {"updated": 2, "unread": 3})
+        self.assertFalse(Notifications.objects.get(notification_id=self.foreign.notification_id).is_read)
+
+        # already read ones don't count as updated
+        self.assertEqual(self.post("mark_read", all=True).json()["payload"], {"updated": 3, "unread": 0})
+        self.assertEqual(self.unread(), 0)
+        self.assertFalse(Notifications.objects.get(notification_id=self.foreign.notification_id).is_read)
+
+    def test_dismissed_notifications_leave_the_inbox(self):
+        response = self.post("dismiss", notification_ids=self.ids(self.infos[0]))
+        self.assertEqual(response.json()["payload"], {"updated": 1, "unread": 4})
+        listing = self.client.get("/api/notifications/get_all_notfications/").json()["payload"]["notifications"]
+        self.assertNotIn(str(self.infos[0].notification_id), [n["notification_id"] for n in listing])
+        self.assertEqual(len(listing), 4)
+        self.assertEqual(self.post("dismiss", notification_ids=self.ids(self.infos[0])).json()["payload"]["updated"], 0)
+
+    def test_accepting_invites_joins_the_workspaces(self):
+        board = {"workspaceId": str(self.workspace.workspaceId)}
+        self.assertEqual(self.client.post("/api/workspace/get_workspace/", board, format="json").status_code, 401)
+
+        response = self.post("respond_to_invites", reaction="accepted", all=True)
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()["payload"]
+        self.assertEqual((payload["updated"], payload["memberships"], payload["unread"]), (2, 2, 3))
+        self.assertEqual(payload["workspaceIds"], sorted(str(w.workspaceId) for w in (self.workspace, self.other_workspace)))
+        self.assertEqual(set(TeamMembers.objects.filter(userId=self.user).values_list("status", flat=True)), {"accepted"})
+        self.assertEqual(set(Notifications.objects.filter(type="request").values_list("reaction", flat=True)), {"accepted"})
+        # the membership cached by the refused read above is gone
+        self.assertEqual(self.client.post("/api/workspace/get_workspace/", board, format="json").status_code, 200)
+
+        # answered invites can't be answered again
+        self.assertEqual(self.post("respond_to_invites", reaction="rejected", all=True).json()["payload"]["updated"], 0)
+        self.assertEqual(TeamMembers.objects.get(userId=self.user, workspaceId=self.workspace).status, "accepted")
+
+    def test_rejecting_one_invite(self):
+        response = self.post("respond_to_invites", reaction="rejected", notification_ids=self.ids(self.invites[0], *self.infos))
+        self.assertEqual((response.json()["payload"]["updated"], response.json()["payload"]["memberships"]), (1, 1))
+        statuses = dict(TeamMembers.objects.filter(userId=self.user).values_list("workspaceId", "status"))
+        self.assertEqual(statuses, {self.workspace.workspaceId: "rejected", self.other_workspace.workspaceId: "pending"})
+        # info notifications aren't invites, they stay unread
+        self.assertEqual(Notifications.objects.filter(notification_id__in=[n.notification_id for n in self.infos], is_read=True).count(), 0)
+
+    def test_mark_single_notification_read_is_scoped_to_the_recipient(self):
+        response = self.post("mark_notification_read", notification_id=str(self.foreign.notification_id))
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Notifications.objects.get(notification_id=self.foreign.notification_id).is_read)
+        self.assertEqual(self.post("mark_notification_read", notification_id=str(self.infos[0].notification_id)).status_code, 200)
+        self.assertEqual(self.unread(), 4)
+
+    def test_rejects_bad_input(self):
+        with override_settings(NOTIFICATION_BULK_MAX_IDS=2):
+            self.assertEqual(self.post("mark_read", notification_ids=self.ids(*self.infos)).status_code, 400)
+        for url, data in (
+            ("mark_read", {}),
+            ("dismiss", {"notification_ids": ["nope"]}),
+            ("respond_to_invites", {"all": True}),
+            ("respond_to_invites", {"reaction": "pending", "all": True}),
+            ("respond_to_invites", {"reaction": "accepted"}),
+        ):
+            with self.subTest(url=url, data=data):
+                self.assertEqual(self.post(url, **data).status_code, 400)
+        self.assertEqual(self.unread(), 5)
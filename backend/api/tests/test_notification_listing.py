@@ -0,0 +1,97 @@
+from datetime import timedelta
+from django.test import override_settings
+from django.utils import timezone
+from api.models.notifications import Notifications
+from api.models.team_members import TeamMembers
+from api.tests.helpers import ApiTestCase, add_member, client_for, make_board, make_user
+
+class NotificationListingTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, _, self.workspace = make_board()
+        self.user = make_user()
+        self.client = client_for(self.user)
+        now = timezone.now()
+        # three of them share a timestamp, the id has to break the tie
+        self.recent = [self.notify(is_read=i % 2 == 0, created_at=now - timedelta(minutes=min(i, 2))) for i in range(5)]
+        # someone else's inbox
+        self.notify(toUser=self.admin)
+
+    def notify(self, **fields):
+        fields = {"fromUser": self.admin, "toUser": self.user, "workspaceId": self.workspace, "type": "info", "reaction": None, **fields}
+        created_at = fields.pop("created_at", None)
+        notification = Notifications.objects.create(**fields)
+        if created_at:
+            Notifications.objects.filter(notification_id=notification.notification_id).update(created_at=created_at)
+        return notification
+
+    def age(self, days):
+        return timezone.now() - timedelta(days=days)
+
+    def listing(self, **params):
+        response = self.client.get("/api/notifications/get_all_notfications/", params)
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()["payload"]
+        return [row["notification_id"] for row in payload["notifications"]], payload["next_cursor"]
+
+    def unread(self):
+        return self.client.get("/api/notifications/unread_count/").json()["payload"]["unread"]
+
+    def expected(self):
+        rows = Notifications.objects.filter(notification_id__in=[n.notification_id for n in self.recent])
+        return [str(i) for i in rows.order_by("-created_at", "-notification_id").values_list("notification_id", flat=True)]
+
+    def test_pages_walk_the_whole_listing_once(self):
+        everything, cursor = self.listing()
+        self.assertIsNone(cursor)
+        self.assertEqual(everything, self.expected())
+
+        pages, cursor = [], None
+        while True:
+            ids, cursor = self.listing(limit=2, **({"cursor": cursor} if cursor else {}))
+            pages.append(ids)
+            if not cursor:
+                break
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), everything)
+
+    def test_rows_written_between_pages_do_not_shift_them(self):
+        first, cursor = self.listing(limit=2)
+        self.notify()
+        rest, _ = self.listing(limit=10, cursor=cursor)
+        self.assertEqual(first + rest, self.expected())
+
+    @override_settings(NOTIFICATIONS_PAGE_MAX=3)
+    def test_limit_is_capped_and_checked(self):
+        self.assertEqual(len(self.listing(limit=50)[0]), 3)
+        for params in ({"limit": "0"}, {"limit": "many"}, {"cursor": "garbage"}, {"type": "spam"}, {"is_read": "maybe"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get("/api/notifications/get_all_notfications/", params).status_code, 400)
+
+    def test_filters(self):
+        invite = self.notify(type="request", reaction="pending")
+        self.assertEqual(self.listing(type="request")[0], [str(invite.notification_id)])
+        unread, _ = self.listing(is_read="false")
+        self.assertEqual(len(unread), 3)
+        self.assertIn(str(invite.notification_id), unread)
+
+    @override_settings(NOTIFICATIONS_WINDOW_DAYS=30)
+    def test_old_rows_only_show_while_they_are_pending_invites(self):
+        self.notify(created_at=self.age(60))
+        self.notify(type="request", reaction="accepted", created_at=self.age(60))
+        invite = self.notify(type="request", reaction="pending", created_at=self.age(60))
+        membership = add_member(self.workspace, self.user, status="pending")
+        TeamMembers.objects.filter(pk=membership.pk).update(created_at=self.age(60))
+
+        ids, _ = self.listing()
+        self.assertEqual(ids, self.expected() + [str(invite.notification_id)])
+        self.assertEqual(len(self.listing(all="true")[0]), 8)
+        self.assertEqual(self.unread(), 3)
+
+    def test_unread_count_follows_reads(self):
+        self.assertEqual(self.unread(), 2)
+        self.notify()
+        self.assertEqual(self.unread(), 3)
+        Notifications.objects.filter(toUser=self.user).update(is_read=True)
+        self.assertEqual(self.unread(), 0)
+        self.assertEqual(client_for(self.admin).get("/api/notifications/unread_count/").json()["payload"]["unread"], 1)
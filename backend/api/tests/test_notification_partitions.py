@@ -0,0 +1,67 @@
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from api.models.notifications import Notifications
+from api.tests.helpers import ApiTestCase, make_board
+from api.utils.partitions import DEFAULT_PARTITION, add_months, ensure_partition, list_partitions, month_start, partition_name
+
+class NotificationPartitionTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.this_month = month_start(timezone.now().astimezone(dt_timezone.utc).date())
+
+    def notification_in(self, month):
+        notification = Notifications.objects.create(fromUser=self.admin, toUser=self.member, type="info", reaction=None)
+        created_at = datetime(month.year, month.month, 15, tzinfo=dt_timezone.utc)
+        Notifications.objects.filter(notification_id=notification.notification_id).update(created_at=created_at)
+        return notification
+
+    def rows_in(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM "{table}"')
+            return cursor.fetchone()[0]
+
+    def manage(self, *args):
+        # rows written by this test still have deferred fk checks queued, a partition with
+        # pending trigger events can't be dropped; outside a test the command runs on its own
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        out = StringIO()
+        call_command("manage_notification_partitions", *args, stdout=out)
+        return out.getvalue()
+
+    def test_upcoming_months_are_created_and_take_their_rows_along(self):
+        far = add_months(self.this_month, 6)
+        notification = self.notification_in(far)
+        self.assertEqual(self.rows_in(DEFAULT_PARTITION), 1)
+
+        out = self.manage("--ahead", "6")
+        self.assertIn(f"Created partition for {far:%Y-%m}", out)
+        self.assertIn(partition_name(far), list_partitions().values())
+        self.assertEqual((self.rows_in(partition_name(far)), self.rows_in(DEFAULT_PARTITION)), (1, 0))
+        self.assertTrue(Notifications.objects.filter(notification_id=notification.notification_id).exists())
+        # nothing left to do the second time
+        self.assertNotIn("Created", self.manage("--ahead", "6"))
+
+    def test_expired_months_are_dropped_or_archived(self):
+        dropped, archived = add_months(self.this_month, -14), add_months(self.this_month, -13)
+        ensure_partition(dropped)
+        old = self.notification_in(dropped)
+        self.assertIn(f"Dropped {partition_name(dropped)}", self.manage("--retention-months", "12", "--ahead", "0"))
+        self.assertFalse(Notifications.objects.filter(notification_id=old.notification_id).exists())
+
+        ensure_partition(archived)
+        self.notification_in(archived)
+        self.assertIn(f"Archived {partition_name(archived)}", self.manage("--retention-months", "12", "--ahead", "0", "--archive"))
+        self.assertNotIn(archived, list_partitions())
+        # detached, not deleted
+        self.assertEqual(self.rows_in(f"archived_{partition_name(archived)}"), 1)
+        recent = self.notification_in(self.this_month)
+        self.assertTrue(Notifications.objects.filter(notification_id=recent.notification_id).exists())
+
+    def test_rows_outside_every_month_are_reported(self):
+        self.notification_in(add_months(self.this_month, -60))
+        self.assertIn(f"1 notifications sit in {DEFAULT_PARTITION}", self.manage("--ahead", "0"))
@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import time
+from django.test import SimpleTestCase, override_settings
+from api.utils import pdf_cache
+
+class PdfCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        settings = override_settings(PDF_CACHE_DIR=self.directory, PDF_CACHE_MAX_BYTES=250, PDF_EXPORT_TIMEOUT=30)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def age(self, path, seconds):
+        past = time.time() - seconds
+        os.utime(path, (past, past))
+
+    def test_fingerprint_follows_the_board_state(self):
+        key = pdf_cache.fingerprint("w1", 3, "native")
+        self.assertEqual(key, pdf_cache.fingerprint("w1", 3, "native"))
+        self.assertNotEqual(key, pdf_cache.fingerprint("w1", 4, "native"))
+        self.assertNotEqual(key, pdf_cache.fingerprint("w1", 3, "browser"))
+        self.assertNotEqual(key, pdf_cache.fingerprint("w2", 3, "native"))
+
+    def test_put_then_get(self):
+        self.assertIsNone(pdf_cache.get("a"))
+        path = pdf_cache.put("a", b"%PDF a")
+        self.assertEqual(pdf_cache.get("a"), path)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"%PDF a")
+        self.assertEqual(os.listdir(self.directory), ["a.pdf"])
+
+    def test_least_recently_used_go_past_the_limit(self):
+        for key, seconds in (("old", 300), ("used", 200), ("recent", 100)):
+            self.age(pdf_cache.put(key, b"x" * 100), seconds)
+        # a hit refreshes the entry
+        pdf_cache.get("used")
+        # "old" and "recent" have to go to get back under 250 bytes, the new one stays
+        new = pdf_cache.put("new", b"x" * 100)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["new.pdf", "used.pdf"])
+        self.assertEqual(pdf_cache.get("new"), new)
+
+    def test_entry_being_stored_is_kept_even_when_too_big(self):
+        pdf_cache.put("small", b"x" * 100)
+        pdf_cache.put("huge", b"x" * 1000)
+        self.assertEqual(os.listdir(self.directory), ["huge.pdf"])
+
+    def test_orphaned_temp_files_are_removed(self):
+        orphan = os.path.join(self.directory, "orphan.tmp")
+        writing = os.path.join(self.directory, "writing.tmp")
+        for path in (orphan, writing):
+            with open(path, "wb") as f:
+                f.write(b"partial")
+        self.age(orphan, 60)
+        pdf_cache.evict()
+        self.assertEqual(os.listdir(self.directory), ["writing.tmp"])
@@ -0,0 +1,98 @@
+import shutil
+import tempfile
+import threading
+from datetime import date
+from unittest import mock
+from django.test import override_settings
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+from api.utils import pdf_jobs
+
+PDF = b"%PDF-1.4 board"
+
+class PdfJobTests(ApiTestCase):
+    # renders are replaced, what's under test is the queueing around them
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        settings = override_settings(PDF_CACHE_DIR=directory)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.render = self.patch("api.utils.pdf_jobs.render_board_pdf", return_value=PDF)
+        self.admin, self.member, self.workspace = make_board()
+        self.task = make_task(self.workspace, self.admin)
+        self.client = client_for(self.member)
+
+    def patch(self, target, **kwargs):
+        patcher = mock.patch(target, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def submit(self, workspace=None, client=None):
+        workspace = workspace or self.workspace
+        return (client or self.client).post("/api/tasks/export-pdf/jobs/", {"workspaceId": str(workspace.workspaceId)}, format="json")
+
+    def finish(self, response):
+        self.assertEqual(response.status_code, 202)
+        return pdf_jobs.wait_for_job(response.json()["payload"]["job_id"], 5)
+
+    def test_job_runs_and_its_file_downloads(self):
+        job = self.finish(self.submit())
+        self.assertEqual(job["status"], pdf_jobs.DONE)
+        status = self.client.get("/api/tasks/export-pdf/jobs/status/", {"job_id": job["job_id"]})
+        self.assertEqual(status.json()["payload"]["status"], "done")
+        download = self.client.get("/api/tasks/export-pdf/jobs/download/", {"job_id": job["job_id"]})
+        self.assertEqual(download.status_code, 200)
+        self.assertEqual(b"".join(download.streaming_content), PDF)
+
+    def test_same_board_state_is_rendered_once(self):
+        job = self.finish(self.submit())
+        again = self.submit()
+        self.assertEqual(again.json()["payload"]["job_id"], job["job_id"])
+        self.assertEqual(self.render.call_count, 1)
+
+        # a board write is a new state, and a new render
+        self.client.post("/api/tasks/update_task/", {"task_id": str(self.task.task_id), "title": "Changed"}, format="json")
+        self.assertNotEqual(self.finish(self.submit())["job_id"], job["job_id"])
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_next_day_renders_again(self):
+        # the header prints the export date, yesterday's file can't be handed out today
+        today = self.patch("api.utils.pdf_cache.date")
+        today.today.return_value = date(2026, 3, 1)
+        job = self.finish(self.submit())
+        today.today.return_value = date(2026, 3, 2)
+        self.assertNotEqual(self.finish(self.submit())["job_id"], job["job_id"])
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_slots_are_given_back_after_success_and_failure(self):
+        self.patch("api.utils.pdf_jobs._slots", new=threading.BoundedSemaphore(1))
+        release = threading.Event()
+        self.render.side_effect = lambda *args: release.wait(5) and PDF
+        other = make_board()
+        other_client = client_for(other[1])
+
+        running = self.submit()
+        self.assertEqual(running.status_code, 202)
+        # the only slot is taken, other boards are turned away meanwhile
+        self.assertEqual(self.submit(other[2], other_client).status_code, 503)
+        release.set()
+        self.finish(running)
+
+        self.render.side_effect = RuntimeError("renderer crashed")
+        with self.assertLogs("api.utils.pdf_jobs", "ERROR"):
+            failed = self.finish(self.submit(other[2], other_client))
+        self.assertEqual((failed["status"], failed["error"]), (pdf_jobs.FAILED, "PDF generation failed"))
+
+        self.render.side_effect = None
+        # a failed job isn't handed out again, and its slot is free for the retry
+        retry = self.finish(self.submit(other[2], other_client))
+        self.assertEqual(retry["status"], pdf_jobs.DONE)
+        self.assertNotEqual(retry["job_id"], failed["job_id"])
+
+    def test_jobs_are_only_visible_to_members(self):
+        job = self.finish(self.submit())
+        outsider = client_for(make_user())
+        self.assertEqual(self.submit(client=outsider).status_code, 401)
+        self.assertEqual(outsider.get("/api/tasks/export-pdf/jobs/status/", {"job_id": job["job_id"]}).status_code, 401)
+        self.assertEqual(outsider.get("/api/tasks/export-pdf/jobs/download/", {"job_id": job["job_id"]}).status_code, 401)
@@ -0,0 +1,103 @@
+import re
+import zlib
+from django.test import SimpleTestCase
+from api.tests.helpers import ApiTestCase, add_member, make_board, make_task, make_user
+from api.utils.pdf_board import CONTINUED, LEADING, PADDING, _height, _paginate, render_native_board_pdf
+from api.utils.pdf_writer import PdfDocument, text_width, truncate, winansi, wrap
+
+def objects(pdf):
+    # object number -> body, found through the xref table like a viewer would
+    xref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", pdf)[1])
+    assert pdf[xref:].startswith(b"xref\n")
+    count = int(re.match(rb"xref\n0 (\d+)\n", pdf[xref:])[1])
+    rows = pdf[xref:].split(b"\n")[2:2 + count]
+    found = {}
+    for number, row in enumerate(rows[1:], start=1):
+        offset = int(row[:10])
+        match = re.match(rb"%d 0 obj\n(.*?)\nendobj\n" % number, pdf[offset:], re.S)
+        assert match, f"object {number} isn't at offset {offset}"
+        found[number] = match[1]
+    return found
+
+def page_text(pdf):
+    streams = [zlib.decompress(body.split(b"stream\n", 1)[1].rsplit(b"\nendstream", 1)[0]) for body in objects(pdf).values() if b"/FlateDecode" in body]
+    return [b" ".join(re.findall(rb"\((.*?)\) Tj", stream)).decode("cp1252") for stream in streams]
+
+class TextLayoutTests(SimpleTestCase):
+    def test_word_wider_than_the_column_is_cut(self):
+        word = "Supercalifragilisticexpialidocious" * 2
+        lines = wrap(f"see {word} here", 60, 8)
+        self.assertTrue(all(text_width(line, 8) <= 60 for line in lines))
+        self.assertEqual("".join(lines).replace(" ", ""), f"see{word}here")
+        self.assertGreater(len(lines), 3)
+
+    def test_wrap_breaks_on_spaces_and_keeps_paragraphs(self):
+        self.assertEqual(wrap("one two three", 1000, 8), ["one two three"])
+        self.assertEqual(wrap("one two\nthree", 1000, 8), ["one two", "three"])
+        lines = wrap("alpha beta gamma delta", text_width("gamma delta", 8), 8)
+        self.assertEqual(lines, ["alpha beta", "gamma delta"])
+
+    def test_truncate_fits_with_an_ellipsis(self):
+        self.assertEqual(truncate("short", 100, 8), "short")
+        cut = truncate("a rather long board name that will not fit", 60, 8, bold=True)
+        self.assertTrue(cut.endswith("..."))
+        self.assertLessEqual(text_width(cut, 8, True), 60)
+
+    def test_winansi_falls_back_for_what_cp1252_lacks(self):
+        self.assertEqual(winansi("Café — “done” €5"), "Café — “done” €5")
+        self.assertEqual(winansi("Zażółć gęślą"), "Zazólc gesla")
+        self.assertEqual(winansi("Привет 🚀\tok"), "?????? ? ok")
+        self.assertEqual(winansi("東京"), "??")
+
+class PdfDocumentTests(SimpleTestCase):
+    def test_xref_offsets_point_at_their_objects(self):
+        document = PdfDocument(title="Board (ünï)")
+        for i in range(3):
+            document.new_page().text(10, 10, f"Page {i} (with parens) \\ and 🚀", 8)
+        pdf = document.render()
+        self.assertTrue(pdf.startswith(b"%PDF-1.4\n"))
+        found = objects(pdf)
+        self.assertEqual(len(found), 5 + 2 * 3)
+        self.assertIn(b"/Count 3", found[2])
+        self.assertIn(b"/Title (Board \\(\xfcn\xef\\))", found[5])
+        self.assertEqual(page_text(pdf)[1], "Page 1 \\(with parens\\) \\\\ and ?")
+
+class PaginationTests(SimpleTestCase):
+    def card(self, line_count, size=7):
+        return [(f"line {i}", size, False, "#000000") for i in range(line_count)]
+
+    def test_cards_fill_pages_in_order(self):
+        cards = [self.card(3) for _ in range(10)]
+        pages = _paginate(cards, 120, 200)
+        self.assertEqual([card for page in pages for card in page], cards)
+        for page, space in zip(pages, [120] + [200] * len(pages)):
+            self.assertLessEqual(sum(_height(card) for card in page), space)
+
+    def test_card_that_fits_a_page_moves_whole(self):
+        small, big = self.card(2), self.card(15)
+        pages = _paginate([small, big], 80, 200)
+        self.assertEqual(pages, [[small], [big]])
+
+    def test_card_taller_than_a_page_is_continued(self):
+        tall = self.card(60)
+        pages = _paginate([tall], 150, 150)
+        parts = [page[0] for page in pages if page]
+        self.assertGreater(len(parts), 2)
+        self.assertNotEqual(parts[0][0], CONTINUED)
+        self.assertTrue(all(part[0] == CONTINUED for part in parts[1:]))
+        self.assertEqual([line for part in parts for line in part if line != CONTINUED], tall)
+        self.assertTrue(all(_height(part) <= 150 for part in parts))
+
+class NativeBoardPdfTests(ApiTestCase):
+    def test_board_renders_from_the_database(self):
+        admin, member, workspace = make_board()
+        add_member(workspace, make_user("Zoë"))
+        for i in range(40):
+            make_task(workspace, admin, title=f"Card {i}", status=["todo", "done"][i % 2], description="Words " * 40, assignees=[member.userId])
+        pdf = render_native_board_pdf(workspace.workspaceId)
+        text = page_text(pdf)
+        self.assertGreater(len(text), 1)
+        self.assertIn("Board", text[0])
+        self.assertIn("Zoë", text[0])
+        self.assertIn("Card 0", " ".join(text))
+        self.assertIn(f"Page {len(text)} of {len(text)}", text[-1])
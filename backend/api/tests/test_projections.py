@@ -0,0 +1,50 @@
+import json
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from api.models.message import Message
+from api.models.notifications import Notifications
+from api.models.tasks import Tasks
+from api.models.team_members import TeamMembers
+from api.serializers.notification_serializer import NOTIFICATION_PROJECTION, NotificationSerializer
+from api.serializers.task_serializer import TASK_PROJECTION, TaskSerializer
+from api.serializers.team_serializer import TEAM_PROJECTION, TeamSerializer
+from api.tests.helpers import ApiTestCase, add_member, make_board, make_task, make_user
+from api.utils.renderers import FastJSONRenderer
+
+class ProjectionParityTests(ApiTestCase):
+    # the projections stand in for these serializers on the list endpoints, down to the byte
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        make_task(self.workspace, self.admin, title="Plain")
+        make_task(
+            self.workspace, self.member, title="Ünïcode 🚀 line\u2028sep", description='quotes " and \\ and </script>',
+            assignees=[self.admin.userId, self.member.userId], tags=["bug", "ünï"], priority="high", status="in_review", rank="V",
+        )
+        make_task(self.workspace, None, title="Nobody's")
+        add_member(self.workspace, make_user(), status="pending")
+        TeamMembers.objects.create(email="outside@example.com", workspaceId=self.workspace)
+        message = Message.objects.create(content="Join ✨ us")
+        Notifications.objects.create(fromUser=self.admin, toUser=self.member, workspaceId=self.workspace, messageId=message, type="request")
+        Notifications.objects.create(fromUser=self.admin, to_email="outside@example.com", type="info", reaction=None, is_read=True)
+
+    def assertSameOutput(self, projection, serializer_class, queryset):
+        queryset = queryset.order_by("pk")
+        expected = serializer_class(queryset, many=True).data
+        actual = projection.serialize(projection.values(queryset))
+        # DRF hands back UUID objects for relations, they only agree once rendered
+        self.assertEqual(json.loads(FastJSONRenderer().render(actual)), json.loads(JSONRenderer().render(expected)))
+        self.assertEqual(FastJSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_tasks(self):
+        self.assertSameOutput(TASK_PROJECTION, TaskSerializer, Tasks.objects.all())
+
+    def test_team_members(self):
+        self.assertSameOutput(TEAM_PROJECTION, TeamSerializer, TeamMembers.objects.all())
+
+    def test_notifications(self):
+        self.assertSameOutput(NOTIFICATION_PROJECTION, NotificationSerializer, Notifications.objects.all())
+
+    def test_datetimes_follow_the_current_timezone(self):
+        with timezone.override("Asia/Kolkata"):
+            self.assertSameOutput(TASK_PROJECTION, TaskSerializer, Tasks.objects.all())
@@ -0,0 +1,117 @@
+import asyncio
+import contextlib
+import json
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.test import override_settings
+from api.realtime import get_broker, user_channel
+from api.realtime.asgi import RealtimeRouter
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_user
+from api.utils.jwt_utils import generate_token
+
+async def django_app(scope, receive, send):
+    # stands in for the django app behind the router
+    await send({"type": "http.response.start", "status": 299, "headers": []})
+    await send({"type": "http.response.body", "body": b"django"})
+
+def http_scope(path, headers=(), method="GET", query=b""):
+    return {"type": "http", "method": method, "path": path, "query_string": query, "headers": [
+        (name.encode(), value.encode()) for name, value in headers
+    ]}
+
+class RealtimeTestCase(ApiTestCase):
+    def token(self, user):
+        return generate_token(user.userId)["access_token"]
+
+    @contextlib.asynccontextmanager
+    async def open(self, scope):
+        # -> (communicator, first message sent back); the client disconnects on the way out
+        kind = "http" if scope["type"] == "http" else "websocket"
+        communicator = ApplicationCommunicator(RealtimeRouter(django_app), scope)
+        await communicator.send_input({"type": "http.request" if kind == "http" else "websocket.connect"})
+        try:
+            yield communicator, await communicator.receive_output(5)
+        finally:
+            await communicator.send_input({"type": f"{kind}.disconnect"})
+            with contextlib.suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await communicator.wait(5)
+
+    async def events(self, communicator, count):
+        # -> the next count SSE events as (name, data), skipping comments and the retry field
+        found = []
+        while len(found) < count:
+            chunk = (await communicator.receive_output(5))["body"].decode()
+            for block in filter(None, chunk.split("\n\n")):
+                fields = dict(line.split(": ", 1) for line in block.split("\n") if line.startswith(("event:", "data:")))
+                if "event" in fields:
+                    found.append((fields["event"], json.loads(fields["data"])))
+        return found
+
+    async def refused(self, scope):
+        async with self.open(scope) as (communicator, start):
+            body = await communicator.receive_output(5)
+        return start["status"], json.loads(body["body"])["message"]
+
+class NotificationStreamTests(RealtimeTestCase):
+    url = "/api/notifications/stream/"
+
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.invitee = make_user()
+
+    def invite(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            client_for(self.admin).post("/api/workspace/invite_team_member/", {
+                "workspaceId": str(self.workspace.workspaceId),
+                "team_members": [{"email": self.invitee.email, "privilege": "user", "status": "pending"}],
+            }, format="json")
+
+    async def test_connection_needs_a_valid_token(self):
+        self.assertEqual(await self.refused(http_scope(self.url)), (400, "Auth token missing"))
+        self.assertEqual(await self.refused(http_scope(self.url, [("authorization", "Bearer nope")])), (401, "Invalid token"))
+
+    async def test_token_in_the_query_string_is_ignored(self):
+        query = f"token={self.token(self.invitee)}".encode()
+        self.assertEqual(await self.refused(http_scope(self.url, query=query)), (400, "Auth token missing"))
+
+    async def test_invite_is_pushed_to_the_connected_invitee(self):
+        async with self.open(http_scope(self.url, [("cookie", f"access_token={self.token(self.invitee)}")])) as (communicator, start):
+            self.assertEqual(start["status"], 200)
+            self.assertIn((b"content-type", b"text/event-stream"), start["headers"])
+            self.assertEqual(await self.events(communicator, 1), [("ready", None)])
+
+            await sync_to_async(self.invite)()
+            [(event, row)] = await self.events(communicator, 1)
+        self.assertEqual(event, "notification.created")
+        self.assertEqual((row["type"], row["toUser"], row["workspace_name"]), ("request", str(self.invitee.userId), "Board"))
+
+    async def test_channels_are_per_user(self):
+        async with self.open(http_scope(self.url, [("authorization", f"Bearer {self.token(self.member)}")])) as (communicator, _):
+            await self.events(communicator, 1)
+            get_broker().publish(user_channel(self.invitee.userId), {"event": "notifications.changed", "payload": None})
+            get_broker().publish(user_channel(self.member.userId), {"event": "notifications.changed", "payload": None})
+            self.assertEqual(await self.events(communicator, 1), [("notifications.changed", None)])
+            self.assertTrue(await communicator.receive_nothing(0.1))
+
+    async def test_websocket_gets_the_same_messages(self):
+        scope = {"type": "websocket", "path": "/ws/notifications/", "query_string": b"", "headers": [
+            (b"cookie", f"access_token={self.token(self.member)}".encode()),
+        ]}
+        async with self.open(scope) as (communicator, accepted):
+            self.assertEqual(accepted["type"], "websocket.accept")
+            self.assertEqual(json.loads((await communicator.receive_output(5))["text"]), {"event": "ready"})
+            get_broker().publish(user_channel(self.member.userId), {"event": "notifications.changed", "payload": None})
+            self.assertEqual(json.loads((await communicator.receive_output(5))["text"]), {"event": "notifications.changed", "payload": None})
+
+    @override_settings(CORS_ALLOWED_ORIGINS=["https://app.example.com"])
+    async def test_cross_site_websocket_is_refused(self):
+        scope = {"type": "websocket", "path": "/ws/notifications/", "query_string": b"", "headers": [
+            (b"origin", b"https://evil.example.com"), (b"cookie", f"access_token={self.token(self.member)}".encode()),
+        ]}
+        async with self.open(scope) as (_, closed):
+            self.assertEqual(closed, {"type": "websocket.close", "code": 4403})
+
+    async def test_other_paths_reach_django(self):
+        async with self.open(http_scope("/api/workspace/get_all_workspaces/")) as (_, start):
+            self.assertEqual(start["status"], 299)
@@ -0,0 +1,53 @@
+import json
+from django.test import SimpleTestCase, override_settings
+from api.models.notifications import Notifications
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task
+from api.utils.renderers import FastJSONRenderer
+from api.utils.streaming import streaming_json_response
+
+def body(response):
+    return b"".join(response.streaming_content) if response.streaming else response.content
+
+class StreamingEncoderTests(SimpleTestCase):
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    def test_same_bytes_as_the_renderer(self):
+        rows = [{"id": i, "title": f"Row {i} ünï", "tags": ["a", "b"], "due": None} for i in range(5)]
+        seen = []
+        def rows_iter():
+            for row in rows:
+                seen.append(row["id"])
+                yield row
+        # the callable runs after the rows went by, so it sees all of them
+        streamed = streaming_json_response({"rows": rows_iter(), "count": lambda: len(seen), "empty": iter([]), "next": None})
+        expected = {"rows": rows, "count": 5, "empty": [], "next": None}
+        self.assertEqual(body(streamed), FastJSONRenderer().render(expected))
+
+class StreamedListingTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        for i in range(7):
+            make_task(self.workspace, self.admin if i % 2 else self.member, title=f"Task {i}", assignees=[self.member.userId] if i % 3 else [])
+        for _ in range(3):
+            Notifications.objects.create(fromUser=self.admin, toUser=self.member, workspaceId=self.workspace, type="info", reaction=None)
+
+    @override_settings(STREAM_CHUNK_SIZE=3)
+    def test_streamed_board_matches_the_buffered_one(self):
+        data = {"workspaceId": str(self.workspace.workspaceId)}
+        buffered = self.client.post("/api/tasks/get_all_tasks/", data, format="json")
+        streamed = self.client.post("/api/tasks/get_all_tasks/", {**data, "stream": True}, format="json")
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed.status_code, buffered.status_code)
+        buffered, streamed = json.loads(body(buffered)), json.loads(body(streamed))
+        # the sync cursor is a timestamp, everything else has to agree
+        buffered["payload"].pop("sync_cursor"), streamed["payload"].pop("sync_cursor")
+        self.assertEqual(streamed, buffered)
+        self.assertEqual(len(streamed["payload"]["tasks"]), 7)
+
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    def test_streamed_notifications_match_the_buffered_ones(self):
+        buffered = self.client.get("/api/notifications/get_all_notfications/")
+        streamed = self.client.get("/api/notifications/get_all_notfications/", {"stream": "true"})
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(body(streamed), body(buffered))
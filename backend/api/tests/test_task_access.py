@@ -0,0 +1,56 @@
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, add_member, client_for, make_board, make_task, make_user
+
+NEW_TASK = {"title": "New", "description": "d", "dueDate": "2026-02-01", "priority": "low", "status": "todo"}
+
+class TaskAccessTests(ApiTestCase):
+    # outsiders and members still pending get the same 401, before anything is parsed or written
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.task = make_task(self.workspace, self.admin, title="Original")
+        self.pending = make_user()
+        add_member(self.workspace, self.pending, status="pending")
+        self.refused = [client_for(make_user()), client_for(self.pending)]
+
+    def post(self, client, url, **data):
+        return client.post(f"/api/tasks/{url}/", data, format="json")
+
+    def test_create_needs_an_accepted_member(self):
+        for client in self.refused:
+            response = self.post(client, "create_task", workspaceId=str(self.workspace.workspaceId), **NEW_TASK)
+            self.assertEqual(response.status_code, 401)
+            # refused before validation, a bad body doesn't tell them more
+            self.assertEqual(self.post(client, "create_task", workspaceId=str(self.workspace.workspaceId)).status_code, 401)
+        self.assertEqual(Tasks.objects.count(), 1)
+        response = self.post(client_for(self.member), "create_task", workspaceId=str(self.workspace.workspaceId), **NEW_TASK)
+        self.assertEqual(response.status_code, 201)
+
+    def test_update_needs_a_member_of_the_tasks_workspace(self):
+        # being a member somewhere else doesn't count
+        elsewhere = make_board()[1]
+        for client in [*self.refused, client_for(elsewhere)]:
+            self.assertEqual(self.post(client, "update_task", task_id=str(self.task.task_id), title="Hijacked").status_code, 401)
+            self.assertEqual(self.post(client, "update_task", task_id=str(self.task.task_id), priority="urgent").status_code, 401)
+        task = Tasks.objects.get(task_id=self.task.task_id)
+        self.assertEqual((task.title, task.version), ("Original", 1))
+        self.assertEqual(self.post(client_for(self.member), "update_task", task_id=str(self.task.task_id), title="Renamed").status_code, 200)
+
+    def test_delete_needs_a_member_of_the_tasks_workspace(self):
+        for client in self.refused:
+            self.assertEqual(self.post(client, "delete_task", taskId=str(self.task.task_id)).status_code, 401)
+        self.assertTrue(Tasks.objects.filter(task_id=self.task.task_id).exists())
+        self.assertEqual(self.post(client_for(self.member), "delete_task", taskId=str(self.task.task_id)).status_code, 200)
+        self.assertFalse(Tasks.objects.filter(task_id=self.task.task_id).exists())
+
+    def test_detail_is_scoped_to_the_checked_workspace(self):
+        # a member of one board can't read another board's task by naming their own workspace
+        other_admin, _, other_workspace = make_board()
+        secret = make_task(other_workspace, other_admin, title="Secret")
+        client = client_for(self.member)
+        response = self.post(client, "detail_task", workspaceId=str(self.workspace.workspaceId), task_id=str(secret.task_id))
+        self.assertEqual(response.json(), {"success": False, "message": "Task doesnt exist", "payload": {}})
+        response = self.post(client, "detail_task", workspaceId=str(self.workspace.workspaceId), task_id=str(self.task.task_id))
+        self.assertEqual(response.json()["payload"]["task_detail"]["title"], "Original")
+        response = self.post(client_for(make_user()), "detail_task", workspaceId=str(self.workspace.workspaceId), task_id=str(self.task.task_id))
+        self.assertFalse(response.json()["success"])
@@ -0,0 +1,44 @@
+from datetime import date, timedelta
+from django.utils import timezone
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+from api.utils.analytics import compute_board_analytics
+
+class TaskAnalyticsTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        self.body = {"workspaceId": str(self.workspace.workspaceId)}
+        a, m = self.admin.userId, self.member.userId
+        # a Wednesday: the week runs until the Monday after
+        self.today = date(2026, 1, 7)
+        make_task(self.workspace, self.admin, status="todo", priority="high", dueDate=date(2026, 1, 1), assignees=[a, m])
+        make_task(self.workspace, self.admin, status="done", priority="high", dueDate=date(2026, 1, 1), assignees=[a])
+        make_task(self.workspace, self.admin, status="blocked", priority="low", dueDate=date(2026, 1, 9))
+        make_task(self.workspace, self.admin, status="todo", priority="low", dueDate=date(2026, 1, 12), assignees=[m])
+        make_task(make_board()[2], self.admin, status="todo", dueDate=date(2026, 1, 1))
+
+    def test_rollup_values(self):
+        analytics = compute_board_analytics(self.workspace.workspaceId, self.today)
+        self.assertEqual((analytics["total"], analytics["overdue"], analytics["due_this_week"]), (4, 1, 1))
+        self.assertEqual(analytics["by_status"], {"todo": 2, "in_progress": 0, "blocked": 1, "in_review": 0, "done": 1})
+        self.assertEqual(analytics["by_priority"], {"high": 2, "medium": 0, "low": 2})
+        self.assertEqual(analytics["by_assignee"], {str(self.admin.userId): 2, str(self.member.userId): 2})
+        self.assertEqual(analytics["unassigned"], 1)
+
+    def test_rollup_is_cached_until_the_board_changes(self):
+        first = self.client.post("/api/tasks/analytics/", self.body, format="json").json()["payload"]
+        self.assertEqual(first["total"], 4)
+        # written behind the api's back: the board version didn't move, the cached rollup stands
+        Tasks.objects.filter(workspaceId=self.workspace, status="blocked").update(status="done")
+        self.assertEqual(self.client.post("/api/tasks/analytics/", self.body, format="json").json()["payload"], first)
+
+        self.client.post("/api/tasks/create_task/", {
+            **self.body, "title": "New", "description": "d", "dueDate": str(timezone.localdate() + timedelta(days=30)), "priority": "medium", "status": "todo",
+        }, format="json")
+        fresh = self.client.post("/api/tasks/analytics/", self.body, format="json").json()["payload"]
+        self.assertEqual((fresh["total"], fresh["by_status"]["done"], fresh["by_priority"]["medium"]), (5, 2, 1))
+
+    def test_outsiders_are_refused(self):
+        self.assertEqual(client_for(make_user()).post("/api/tasks/analytics/", self.body, format="json").status_code, 401)
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from api.models.archived_tasks import ArchivedTasks
+from api.models.task_tombstones import TaskTombstones
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+from api.utils.task_sync import issue_sync_cursor
+from api.utils.versioning import get_workspace_version
+
+class TaskArchiveTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        self.body = {"workspaceId": str(self.workspace.workspaceId)}
+        self.long_ago = timezone.now() - timedelta(days=120)
+        self.old_done = [make_task(self.workspace, self.admin, title=f"Shipped {i}", status="done", tags=["release"] if i else []) for i in range(3)]
+        Tasks.objects.filter(task_id__in=[t.task_id for t in self.old_done]).update(done_at=self.long_ago, created_at=self.long_ago)
+        self.recent_done = make_task(self.workspace, self.admin, title="Just shipped", status="done")
+        self.active = make_task(self.workspace, self.admin, title="Active")
+
+    def archive(self):
+        out = StringIO()
+        call_command("archive_done_tasks", "--days", "90", "--batch-size", "2", "--pause", "0", stdout=out)
+        return out.getvalue()
+
+    def test_done_at_follows_the_status(self):
+        self.assertIsNotNone(Tasks.objects.get(task_id=self.recent_done.task_id).done_at)
+        self.assertIsNone(Tasks.objects.get(task_id=self.active.task_id).done_at)
+        self.client.post("/api/tasks/update_task/", {"task_id": str(self.recent_done.task_id), "status": "todo"}, format="json")
+        self.assertIsNone(Tasks.objects.get(task_id=self.recent_done.task_id).done_at)
+
+    def test_only_long_done_tasks_are_archived(self):
+        version = get_workspace_version(self.workspace.workspaceId)
+        self.assertIn("Archived 3 tasks in 2 batches", self.archive())
+        old_ids = {t.task_id for t in self.old_done}
+        self.assertEqual(set(ArchivedTasks.objects.values_list("task_id", flat=True)), old_ids)
+        self.assertEqual(set(Tasks.objects.values_list("task_id", flat=True)), {self.recent_done.task_id, self.active.task_id})
+        self.assertEqual(set(TaskTombstones.objects.values_list("task_id", flat=True)), old_ids)
+        self.assertGreater(get_workspace_version(self.workspace.workspaceId), version)
+        # nothing left to do the second time round
+        self.assertIn("Archived 0 tasks", self.archive())
+
+    def test_archive_listing(self):
+        self.archive()
+        response = self.client.post("/api/tasks/archive/", {**self.body, "limit": 2}, format="json")
+        self.assertEqual(response.status_code, 200)
+        first = response.json()["payload"]
+        rest = self.client.post("/api/tasks/archive/", {**self.body, "limit": 2, "cursor": first["next_cursor"]}, format="json").json()["payload"]
+        titles = [t["title"] for t in first["tasks"] + rest["tasks"]]
+        self.assertEqual(sorted(titles), ["Shipped 0", "Shipped 1", "Shipped 2"])
+        self.assertIsNone(rest["next_cursor"])
+        self.assertIn(str(self.admin.userId), first["users"])
+
+        by_tag = self.client.post("/api/tasks/archive/", {**self.body, "tag": "release"}, format="json").json()["payload"]["tasks"]
+        self.assertEqual(sorted(t["title"] for t in by_tag), ["Shipped 1", "Shipped 2"])
+        by_title = self.client.post("/api/tasks/archive/", {**self.body, "q": "PPED 0"}, format="json").json()["payload"]["tasks"]
+        self.assertEqual([t["title"] for t in by_title], ["Shipped 0"])
+
+    @override_settings(TASK_SYNC_OVERLAP_SECONDS=0)
+    def test_restore_puts_tasks_back_on_the_board(self):
+        self.archive()
+        cursor = issue_sync_cursor()
+        task = self.old_done[0]
+        missing = "00000000-0000-0000-0000-000000000000"
+        response = self.client.post("/api/tasks/archive/restore/", {**self.body, "task_ids": [str(task.task_id), missing]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()["payload"]
+        self.assertEqual([t["task_id"] for t in payload["tasks"]], [str(task.task_id)])
+        self.assertEqual(payload["missing"], [missing])
+
+        restored = Tasks.objects.get(task_id=task.task_id)
+        self.assertEqual((restored.title, restored.status, restored.version), ("Shipped 0", "done", 2))
+        self.assertEqual(restored.created_at, self.long_ago)
+        # the done clock restarts, the next pass leaves it alone
+        self.assertGreater(restored.done_at, timezone.now() - timedelta(minutes=1))
+        self.assertGreater(restored.rank, Tasks.objects.get(task_id=self.recent_done.task_id).rank)
+        self.assertFalse(ArchivedTasks.objects.filter(task_id=task.task_id).exists())
+
+        changes = self.client.post("/api/tasks/changes/", {**self.body, "cursor": cursor}, format="json").json()["payload"]
+        self.assertEqual([t["task_id"] for t in changes["tasks"]], [str(task.task_id)])
+        self.assertEqual(changes["deleted"], [])
+
+    def test_rejects_bad_input_and_outsiders(self):
+        for data in ({}, {"task_ids": ["nope"]}):
+            with self.subTest(data=data):
+                self.assertEqual(self.client.post("/api/tasks/archive/restore/", {**self.body, **data}, format="json").status_code, 400)
+        outsider = client_for(make_user())
+        self.assertEqual(outsider.post("/api/tasks/archive/", self.body, format="json").status_code, 401)
+        response = outsider.post("/api/tasks/archive/restore/", {**self.body, "task_ids": [str(self.active.task_id)]}, format="json")
+        self.assertEqual(response.status_code, 401)
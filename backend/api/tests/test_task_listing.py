@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+from django.utils import timezone
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+from api.utils.pagination import encode_cursor
+from api.views.tasks_view import TASK_ORDERINGS
+
+class TaskListingTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        statuses = Tasks.Status.values
+        now = timezone.now()
+        self.tasks = []
+        for i in range(13):
+            self.tasks.append(make_task(
+                self.workspace, self.admin if i % 2 else self.member,
+                title=f"Task {i}", status=statuses[i % len(statuses)], priority=Tasks.Priority.values[i % 3],
+                dueDate=date(2026, 1, 1) + timedelta(days=i % 4),
+                assignees=[self.member.userId] if i % 3 == 0 else [], tags=["bug"] if i % 4 == 0 else ["feature"],
+            ))
+        # ties on every sort key but the last, pages must still neither repeat nor skip a row
+        Tasks.objects.filter(task_id__in=[t.task_id for t in self.tasks[:6]]).update(created_at=now, updated_at=now)
+
+    def list_tasks(self, **data):
+        return self.client.post("/api/tasks/get_all_tasks/", {"workspaceId": str(self.workspace.workspaceId), **data}, format="json")
+
+    def ids(self, response):
+        return [task["task_id"] for task in response.json()["payload"]["tasks"]]
+
+    def test_cursor_pages_match_the_full_listing_for_every_ordering(self):
+        for ordering in TASK_ORDERINGS:
+            with self.subTest(ordering=ordering):
+                everything = self.ids(self.list_tasks(order_by=ordering))
+                self.assertEqual(len(everything), len(self.tasks))
+
+                paged, cursor, pages = [], None, 0
+                while True:
+                    response = self.list_tasks(order_by=ordering, limit=4, **({"cursor": cursor} if cursor else {}))
+                    self.assertEqual(response.status_code, 201)
+                    page = self.ids(response)
+                    self.assertLessEqual(len(page), 4)
+                    paged += page
+                    pages += 1
+                    cursor = response.json()["payload"]["next_cursor"]
+                    if not cursor:
+                        break
+                self.assertEqual(paged, everything)
+                self.assertEqual(pages, 4)
+
+    def test_orderings_sort_on_their_keys(self):
+        rows = self.list_tasks(order_by="due").json()["payload"]["tasks"]
+        self.assertEqual([row["dueDate"] for row in rows], sorted(row["dueDate"] for row in rows))
+        rows = self.list_tasks(order_by="-created").json()["payload"]["tasks"]
+        self.assertEqual([row["created_at"] for row in rows], sorted((row["created_at"] for row in rows), reverse=True))
+
+    def test_filters(self):
+        def matching(predicate):
+            return sorted(str(t.task_id) for t in self.tasks if predicate(t))
+
+        cases = [
+            ({"status": ["todo", "done"]}, lambda t: t.status in ("todo", "done")),
+            ({"priority": "high"}, lambda t: t.priority == "high"),
+            ({"assignee": str(self.member.userId)}, lambda t: self.member.userId in t.assignees),
+            ({"tag": "bug"}, lambda t: "bug" in t.tags),
+            ({"created_by": str(self.admin.userId)}, lambda t: t.created_by_id == self.admin.userId),
+            ({"due_from": "2026-01-02", "due_to": "2026-01-03"}, lambda t: date(2026, 1, 2) <= t.dueDate <= date(2026, 1, 3)),
+        ]
+        for data, predicate in cases:
+            with self.subTest(filters=data):
+                self.assertEqual(sorted(self.ids(self.list_tasks(**data))), matching(predicate))
+
+    def test_filters_apply_across_pages(self):
+        first = self.list_tasks(status="todo", limit=1)
+        second = self.list_tasks(status="todo", limit=1, cursor=first.json()["payload"]["next_cursor"])
+        self.assertEqual({t["status"] for t in first.json()["payload"]["tasks"] + second.json()["payload"]["tasks"]}, {"todo"})
+        self.assertNotEqual(self.ids(first), self.ids(second))
+
+    def test_rejects_bad_input(self):
+        cursor = self.list_tasks(limit=2).json()["payload"]["next_cursor"]
+        for data in (
+            {"order_by": "title"},
+            {"status": "someday"},
+            {"assignee": "not-a-uuid"},
+            {"due_from": "01/02/2026"},
+            {"limit": 0},
+            {"cursor": "garbage"},
+            # a cursor only resumes the ordering it was issued for
+            {"order_by": "due", "cursor": cursor},
+            {"cursor": encode_cursor("created", ["2026-01-01T00:00:00+00:00"])},
+        ):
+            with self.subTest(data=data):
+                self.assertEqual(self.list_tasks(**data).status_code, 400)
+
+    def test_only_members_can_list(self):
+        response = client_for(make_user()).post("/api/tasks/get_all_tasks/", {"workspaceId": str(self.workspace.workspaceId)}, format="json")
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,181 @@
+import random
+import threading
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+from api.utils.ranking import even_ranks, rank_between, rebalance_column
+from api.utils.versioning import get_workspace_version
+
+class RankKeyTests(SimpleTestCase):
+    def test_rank_between_sorts_between_its_bounds(self):
+        rng = random.Random(7)
+        keys = even_ranks(5)
+        for _ in range(300):
+            keys.sort()
+            i = rng.randrange(len(keys) + 1)
+            before = keys[i - 1] if i else ""
+            after = keys[i] if i < len(keys) else None
+            key = rank_between(before, after)
+            self.assertLess(before, key)
+            if after is not None:
+                self.assertLess(key, after)
+            self.assertFalse(key.endswith("0"))
+            keys.append(key)
+        self.assertEqual(len(set(keys)), len(keys))
+
+    def test_appending_keeps_keys_short(self):
+        key = ""
+        for _ in range(1000):
+            key = rank_between(key, None)
+        self.assertLessEqual(len(key), 4)
+
+    def test_even_ranks_are_sorted_and_distinct(self):
+        for count in (1, 2, 61, 62, 500):
+            with self.subTest(count=count):
+                ranks = even_ranks(count)
+                self.assertEqual(len(ranks), count)
+                self.assertEqual(ranks, sorted(set(ranks)))
+                self.assertTrue(all(ranks))
+
+    def test_rejects_unordered_bounds(self):
+        for before, after in (("V", "V"), ("W", "V"), ("V0", None)):
+            with self.subTest(before=before, after=after):
+                with self.assertRaises(ValueError):
+                    rank_between(before, after)
+
+class MoveTaskTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        self.todo = [make_task(self.workspace, self.admin, title=f"Todo {i}", rank=rank) for i, rank in enumerate(even_ranks(4))]
+        self.done = [make_task(self.workspace, self.admin, title=f"Done {i}", status="done", rank=rank) for i, rank in enumerate(even_ranks(2))]
+
+    def move(self, task, **data):
+        data = {key: str(value.task_id) if isinstance(value, Tasks) else value for key, value in data.items()}
+        return self.client.post("/api/tasks/move_task/", {"task_id": str(task.task_id), **data}, format="json")
+
+    def column(self, status):
+        return list(Tasks.objects.filter(workspaceId=self.workspace, status=status).order_by("rank", "task_id").values_list("title", flat=True))
+
+    def test_move_between_neighbours_rewrites_one_row(self):
+        version = get_workspace_version(self.workspace.workspaceId)
+        before = dict(Tasks.objects.values_list("task_id", "version"))
+        response = self.move(self.todo[3], prev_task_id=self.todo[0], next_task_id=self.todo[1])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column("todo"), ["Todo 0", "Todo 3", "Todo 1", "Todo 2"])
+        after = dict(Tasks.objects.values_list("task_id", "version"))
+        self.assertEqual([task_id for task_id in after if after[task_id] != before[task_id]], [self.todo[3].task_id])
+        self.assertGreater(get_workspace_version(self.workspace.workspaceId), version)
+
+    def test_one_sided_moves(self):
+        self.move(self.todo[2], next_task_id=self.todo[0])
+        self.assertEqual(self.column("todo"), ["Todo 2", "Todo 0", "Todo 1", "Todo 3"])
+        self.move(self.todo[0], prev_task_id=self.todo[3])
+        self.assertEqual(self.column("todo"), ["Todo 2", "Todo 1", "Todo 3", "Todo 0"])
+
+    def test_move_to_another_column(self):
+        response = self.move(self.todo[1], status="done", prev_task_id=self.done[0])
+        self.assertEqual(response.json()["payload"]["status"], "done")
+        self.assertEqual(self.column("done"), ["Done 0", "Todo 1", "Done 1"])
+        # no neighbours given, the card goes to the bottom
+        self.move(self.todo[0], status="done")
+        self.assertEqual(self.column("done"), ["Done 0", "Todo 1", "Done 1", "Todo 0"])
+        self.assertEqual(self.column("todo"), ["Todo 2", "Todo 3"])
+
+    def test_rejects_bad_moves(self):
+        cases = [
+            ({"prev_task_id": "nope"}, 400),
+            ({"status": "someday"}, 400),
+            # a neighbour from another column
+            ({"prev_task_id": self.done[0]}, 400),
+            # neighbours the wrong way round, or the same card twice: no rebalance fixes those
+            ({"prev_task_id": self.todo[1], "next_task_id": self.todo[0]}, 400),
+            ({"prev_task_id": self.todo[1], "next_task_id": self.todo[1]}, 400),
+        ]
+        with mock.patch("api.views.tasks_view.wait_for_rebalance") as wait:
+            for data, code in cases:
+                with self.subTest(data=data):
+                    self.assertEqual(self.move(self.todo[3], **data).status_code, code)
+        wait.assert_not_called()
+        self.assertEqual(self.column("todo"), ["Todo 0", "Todo 1", "Todo 2", "Todo 3"])
+        response = client_for(make_user()).post("/api/tasks/move_task/", {"task_id": str(self.todo[0].task_id)}, format="json")
+        self.assertEqual(response.status_code, 401)
+
+    def test_rebalance_respaces_the_column_as_a_change(self):
+        Tasks.objects.filter(task_id=self.todo[0].task_id).update(rank="V")
+        Tasks.objects.filter(task_id=self.todo[1].task_id).update(rank="V" + "1" * 30)
+        stale = dict(Tasks.objects.filter(status="todo").values_list("task_id", "updated_at"))
+        version = get_workspace_version(self.workspace.workspaceId)
+
+        rebalance_column(self.workspace.workspaceId, "todo")
+        rows = list(Tasks.objects.filter(status="todo").order_by("rank", "task_id"))
+        self.assertEqual([row.rank for row in rows], even_ranks(4))
+        self.assertTrue(all(row.version == 2 and row.updated_at > stale[row.task_id] for row in rows))
+        self.assertEqual({row.version for row in Tasks.objects.filter(status="done")}, {1})
+        self.assertGreater(get_workspace_version(self.workspace.workspaceId), version)
+
+    def test_tied_neighbours_conflict_when_the_rebalancer_is_busy(self):
+        Tasks.objects.filter(task_id__in=[self.todo[0].task_id, self.todo[1].task_id]).update(rank="V")
+        with mock.patch("api.views.tasks_view.wait_for_rebalance", return_value=False) as wait:
+            response = self.move(self.todo[3], prev_task_id=self.todo[0], next_task_id=self.todo[1])
+        self.assertEqual(response.status_code, 409)
+        wait.assert_called_once()
+        self.assertEqual(Tasks.objects.get(task_id=self.todo[3].task_id).version, 1)
+
+class TiedRankMoveTests(TransactionTestCase):
+    # the rebalancer commits on its own connection, so this can't run inside a test transaction
+    def setUp(self):
+        cache.clear()
+        self.admin, self.member, self.workspace = make_board()
+        self.tasks = [make_task(self.workspace, self.admin, title=f"Todo {i}", rank=rank) for i, rank in enumerate(["V", "V", "k"])]
+
+    def test_move_between_tied_neighbours_rebalances_then_moves(self):
+        first, second = sorted(self.tasks[:2], key=lambda task: task.task_id)
+        response = client_for(self.member).post("/api/tasks/move_task/", {
+            "task_id": str(self.tasks[2].task_id), "prev_task_id": str(first.task_id), "next_task_id": str(second.task_id),
+        }, format="json")
+        self.assertEqual(response.status_code, 200)
+        rows = list(Tasks.objects.order_by("rank", "task_id"))
+        self.assertEqual([row.task_id for row in rows], [first.task_id, self.tasks[2].task_id, second.task_id])
+        self.assertEqual(len({row.rank for row in rows}), 3)
+        # respaced by the rebalancer, then moved as a single-row write
+        self.assertEqual([row.version for row in rows], [2, 3, 2])
+
+class RebalanceRaceTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin, self.member, self.workspace = make_board()
+        self.tasks = [make_task(self.workspace, self.admin, title=f"Todo {i}", rank=rank) for i, rank in enumerate("VWXY")]
+
+    def test_move_waits_for_a_running_rebalance(self):
+        locked, release = threading.Event(), threading.Event()
+
+        def respace(count):
+            # the rebalancer holds the column locks from here until it commits
+            locked.set()
+            release.wait(5)
+            return even_ranks(count)
+
+        def rebalance():
+            try:
+                rebalance_column(self.workspace.workspaceId, "todo")
+            finally:
+                connection.close()
+
+        with mock.patch("api.utils.ranking.even_ranks", side_effect=respace):
+            rebalancer = threading.Thread(target=rebalance)
+            rebalancer.start()
+            self.assertTrue(locked.wait(5))
+            threading.Timer(0.2, release.set).start()
+            # ranked against the respaced neighbours, not the ones read before the rebalance committed
+            response = client_for(self.member).post("/api/tasks/move_task/", {
+                "task_id": str(self.tasks[3].task_id), "prev_task_id": str(self.tasks[0].task_id), "next_task_id": str(self.tasks[1].task_id),
+            }, format="json")
+            rebalancer.join(5)
+        self.assertEqual(response.status_code, 200)
+        titles = list(Tasks.objects.order_by("rank", "task_id").values_list("title", flat=True))
+        self.assertEqual(titles, ["Todo 0", "Todo 3", "Todo 1", "Todo 2"])
@@ -0,0 +1,44 @@
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+
+class TaskSearchTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        self.in_title = make_task(self.workspace, self.admin, title="Kanban board polish", description="Spacing")
+        self.in_description = make_task(self.workspace, self.admin, title="Release notes", description="Mention the kanban changes")
+        self.in_tags = make_task(self.workspace, self.admin, title="Triage", tags=["kanban"])
+        make_task(self.workspace, self.admin, title="Unrelated", description="Nothing to see")
+        # same words on another board
+        make_task(make_board()[2], self.admin, title="Kanban board polish")
+
+    def search(self, q, **data):
+        response = self.client.post("/api/tasks/search/", {"workspaceId": str(self.workspace.workspaceId), "q": q, **data}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return [task["task_id"] for task in response.json()["payload"]["tasks"]]
+
+    def test_title_and_tags_rank_above_descriptions(self):
+        ids = self.search("kanban")
+        self.assertEqual(set(ids), {str(t.task_id) for t in (self.in_title, self.in_description, self.in_tags)})
+        self.assertEqual(ids[-1], str(self.in_description.task_id))
+
+    def test_prefixes_and_every_term_match(self):
+        self.assertEqual(self.search("kanb"), self.search("kanban"))
+        self.assertEqual(self.search("kanban polish"), [str(self.in_title.task_id)])
+        self.assertEqual(self.search("kanban", limit=1), [self.search("kanban")[0]])
+
+    def test_search_vector_follows_edits(self):
+        self.client.post("/api/tasks/update_task/", {"task_id": str(self.in_title.task_id), "title": "Swimlane layout"}, format="json")
+        self.assertEqual(self.search("swimlane"), [str(self.in_title.task_id)])
+        self.assertNotIn(str(self.in_title.task_id), self.search("polish"))
+
+    def test_results_come_best_first(self):
+        tasks = self.client.post("/api/tasks/search/", {"workspaceId": str(self.workspace.workspaceId), "q": "kanban"}, format="json").json()["payload"]["tasks"]
+        scores = [task["score"] for task in tasks]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_rejects_empty_queries_and_outsiders(self):
+        body = {"workspaceId": str(self.workspace.workspaceId)}
+        self.assertEqual(self.client.post("/api/tasks/search/", {**body, "q": " !? "}, format="json").status_code, 400)
+        self.assertEqual(client_for(make_user()).post("/api/tasks/search/", {**body, "q": "kanban"}, format="json").status_code, 401)
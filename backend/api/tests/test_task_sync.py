@@ -0,0 +1,72 @@
+from datetime import timedelta
+from django.test import override_settings
+from django.utils import timezone
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task, make_user
+from api.utils.task_sync import issue_sync_cursor
+
+@override_settings(TASK_SYNC_OVERLAP_SECONDS=0)
+class TaskSyncTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        self.tasks = [make_task(self.workspace, self.admin, title=f"Task {i}") for i in range(3)]
+        # the board as the client last saw it
+        Tasks.objects.filter(workspaceId=self.workspace).update(updated_at=timezone.now() - timedelta(hours=1))
+        self.cursor = issue_sync_cursor(timezone.now() - timedelta(minutes=30))
+
+    def changes(self, cursor=None):
+        response = self.client.post("/api/tasks/changes/", {"workspaceId": str(self.workspace.workspaceId), "cursor": cursor or self.cursor}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["payload"]
+
+    def test_board_hands_out_a_cursor_with_nothing_new_behind_it(self):
+        board = self.client.post("/api/tasks/get_all_tasks/", {"workspaceId": str(self.workspace.workspaceId)}, format="json")
+        payload = self.changes(board.json()["payload"]["sync_cursor"])
+        self.assertEqual((payload["reset"], payload["tasks"], payload["deleted"]), (False, [], []))
+
+    def test_only_tasks_written_after_the_cursor_come_back(self):
+        task = self.tasks[0]
+        self.client.post("/api/tasks/update_task/", {"task_id": str(task.task_id), "title": "Renamed"}, format="json")
+        payload = self.changes()
+        self.assertEqual([t["task_id"] for t in payload["tasks"]], [str(task.task_id)])
+        self.assertEqual(payload["tasks"][0]["title"], "Renamed")
+        self.assertEqual(payload["deleted"], [])
+
+        # the next cursor starts where this sync ended
+        self.assertEqual(self.changes(payload["next_cursor"])["tasks"], [])
+
+    def test_deletes_come_back_as_tombstones(self):
+        task = self.tasks[1]
+        self.client.post("/api/tasks/delete_task/", {"taskId": str(task.task_id)}, format="json")
+        payload = self.changes()
+        self.assertEqual(payload["tasks"], [])
+        self.assertEqual(payload["deleted"], [str(task.task_id)])
+
+    def test_a_task_deleted_and_brought_back_is_a_change(self):
+        task = self.tasks[2]
+        self.client.post("/api/tasks/delete_task/", {"taskId": str(task.task_id)}, format="json")
+        make_task(self.workspace, self.admin, task_id=task.task_id, title="Back again")
+        payload = self.changes()
+        self.assertEqual([t["task_id"] for t in payload["tasks"]], [str(task.task_id)])
+        self.assertEqual(payload["deleted"], [])
+
+    def test_old_cursor_resets(self):
+        payload = self.changes(issue_sync_cursor(timezone.now() - timedelta(days=31)))
+        self.assertTrue(payload["reset"])
+        self.assertEqual(payload["tasks"], [])
+        self.assertTrue(payload["next_cursor"])
+
+    @override_settings(TASK_SYNC_MAX_CHANGES=2)
+    def test_too_many_changes_reset(self):
+        Tasks.objects.filter(workspaceId=self.workspace).update(title="Bulk", updated_at=timezone.now())
+        self.assertTrue(self.changes()["reset"])
+
+    def test_rejects_bad_cursors_and_outsiders(self):
+        body = {"workspaceId": str(self.workspace.workspaceId)}
+        for cursor in ("", "garbage"):
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.post("/api/tasks/changes/", {**body, "cursor": cursor}, format="json").status_code, 400)
+        response = client_for(make_user()).post("/api/tasks/changes/", {**body, "cursor": self.cursor}, format="json")
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,40 @@
+from datetime import timedelta
+from django.utils import timezone
+from api.tests.helpers import ApiTestCase, add_member, client_for, make_board, make_task, make_user
+from api.utils.task_sync import issue_sync_cursor
+
+class TaskUsersTests(ApiTestCase):
+    # cards carry user ids, every response listing them brings those users along once
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.bystander = make_user()
+        add_member(self.workspace, self.bystander)
+        self.client = client_for(self.member)
+        self.body = {"workspaceId": str(self.workspace.workspaceId)}
+        self.assigned = make_task(self.workspace, self.admin, title="Assigned", assignees=[self.member.userId, self.admin.userId])
+        self.own = make_task(self.workspace, self.member, title="Standalone")
+        self.expected = {
+            str(user.userId): {"userId": str(user.userId), "name": user.name, "email": user.email}
+            for user in (self.admin, self.member)
+        }
+
+    def test_board_listing(self):
+        payload = self.client.post("/api/tasks/get_all_tasks/", self.body, format="json").json()["payload"]
+        self.assertEqual(payload["users"], self.expected)
+
+    def test_a_page_only_carries_its_own_users(self):
+        payload = self.client.post("/api/tasks/get_all_tasks/", {**self.body, "created_by": str(self.member.userId)}, format="json").json()["payload"]
+        self.assertEqual(payload["users"], {str(self.member.userId): self.expected[str(self.member.userId)]})
+
+    def test_task_detail(self):
+        payload = self.client.post("/api/tasks/detail_task/", {**self.body, "task_id": str(self.assigned.task_id)}, format="json").json()["payload"]
+        self.assertEqual(payload["task_detail"]["title"], "Assigned")
+        self.assertEqual(payload["users"], self.expected)
+
+    def test_search_and_changes(self):
+        payload = self.client.post("/api/tasks/search/", {**self.body, "q": "standalone"}, format="json").json()["payload"]
+        self.assertEqual(payload["users"], {str(self.member.userId): self.expected[str(self.member.userId)]})
+        cursor = issue_sync_cursor(timezone.now() - timedelta(minutes=5))
+        payload = self.client.post("/api/tasks/changes/", {**self.body, "cursor": cursor}, format="json").json()["payload"]
+        self.assertEqual(payload["users"], self.expected)
@@ -0,0 +1,58 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models.tasks import Tasks
+from api.tests.helpers import ApiTestCase, client_for, make_board, make_task
+from api.utils.versioning import get_workspace_version
+
+class UpdateTaskTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin, self.member, self.workspace = make_board()
+        self.client = client_for(self.member)
+        self.task = make_task(self.workspace, self.admin, title="Original", tags=["bug"], rank="V")
+
+    def update(self, **data):
+        return self.client.post("/api/tasks/update_task/", {"task_id": str(self.task.task_id), **data}, format="json")
+
+    def test_writes_the_changed_fields_and_bumps_the_version(self):
+        version = get_workspace_version(self.workspace.workspaceId)
+        response = self.update(title="Renamed", priority="medium", version=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.json()["payload"]["title"], response.json()["payload"]["version"]), ("Renamed", 2))
+        task = Tasks.objects.get(task_id=self.task.task_id)
+        self.assertEqual((task.title, task.version, task.tags), ("Renamed", 2, ["bug"]))
+        self.assertGreater(task.updated_at, self.task.updated_at)
+        self.assertGreater(get_workspace_version(self.workspace.workspaceId), version)
+
+    def test_unchanged_values_are_not_a_write(self):
+        version = get_workspace_version(self.workspace.workspaceId)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.update(title="Original", priority="medium", tags=["bug"], version=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q["sql"] for q in queries if not q["sql"].startswith("SELECT")])
+        task = Tasks.objects.get(task_id=self.task.task_id)
+        self.assertEqual((task.version, task.updated_at), (1, self.task.updated_at))
+        self.assertEqual(get_workspace_version(self.workspace.workspaceId), version)
+
+    def test_status_change_moves_the_card_to_the_bottom(self):
+        make_task(self.workspace, self.admin, status="done", rank="k")
+        response = self.update(status="done")
+        self.assertEqual(response.json()["payload"]["status"], "done")
+        self.assertGreater(response.json()["payload"]["rank"], "k")
+
+    def test_stale_version_conflicts_with_the_current_task(self):
+        self.update(title="Theirs", version=1)
+        response = self.update(title="Mine", version=1)
+        self.assertEqual(response.status_code, 409)
+        current = response.json()["payload"]["task"]
+        self.assertEqual((current["title"], current["version"]), ("Theirs", 2))
+        self.assertEqual(Tasks.objects.get(task_id=self.task.task_id).title, "Theirs")
+        # retried on top of the version it was shown
+        self.assertEqual(self.update(title="Mine", version=current["version"]).status_code, 200)
+
+    def test_rejects_bad_input(self):
+        for data in ({"version": "two"}, {"priority": "urgent"}, {"dueDate": "tomorrow"}, {"tags": ["x" * 21]}):
+            with self.subTest(data=data):
+                self.assertEqual(self.update(**data).status_code, 400)
+        self.assertEqual(self.client.post("/api/tasks/update_task/", {}, format="json").status_code, 400)
+        self.assertEqual(Tasks.objects.get(task_id=self.task.task_id).version, 1)
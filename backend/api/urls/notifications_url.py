@@ -1,8 +1,12 @@
 from django.urls import path
-from api.views.notifications_view import get_all_notfications,mark_notification_read,accept_reject_workspace_invite
+from api.views.notifications_view import get_all_notfications,unread_notifications_count,mark_notifications_read,dismiss_notifications,respond_to_invites,mark_notification_read,accept_reject_workspace_invite
 
 urlpatterns=[
     path('get_all_notfications/',get_all_notfications,name="get_all_notfications"),
+    path('unread_count/',unread_notifications_count,name="unread_notifications_count"),
     path('mark_notification_read/',mark_notification_read,name="mark_notification_read"),
     path('accept_reject_workspace_invite/',accept_reject_workspace_invite,name="accept_reject_workspace_invite"),
+    path('mark_read/',mark_notifications_read,name="mark_notifications_read"),
+    path('dismiss/',dismiss_notifications,name="dismiss_notifications"),
+    path('respond_to_invites/',respond_to_invites,name="respond_to_invites"),
 ]
\ No newline at end of file
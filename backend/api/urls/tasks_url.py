@@ -1,5 +1,5 @@
 from django.urls import path
-from api.views.tasks_view import create_task, update_task, delete_task, get_all_tasks, detail_task, export_pdf
+from api.views.tasks_view import create_task, update_task, delete_task, get_all_tasks, detail_task, export_pdf, get_task_changes, bulk_tasks, move_task, search_tasks, task_analytics, archived_tasks, restore_archived_tasks, submit_pdf_export, pdf_export_status, download_pdf_export
 
 urlpatterns=[
     path('create_task/', create_task, name="delete_task"),
@@ -7,5 +7,15 @@ urlpatterns=[
     path('delete_task/', delete_task, name="delete_task"),
     path('get_all_tasks/', get_all_tasks, name="get_all_tasks"),
     path('detail_task/', detail_task, name="detail_task"),
-    path('export-pdf/', export_pdf, name="export_pdf")
+    path('changes/', get_task_changes, name="get_task_changes"),
+    path('bulk/', bulk_tasks, name="bulk_tasks"),
+    path('move_task/', move_task, name="move_task"),
+    path('search/', search_tasks, name="search_tasks"),
+    path('analytics/', task_analytics, name="task_analytics"),
+    path('archive/', archived_tasks, name="archived_tasks"),
+    path('archive/restore/', restore_archived_tasks, name="restore_archived_tasks"),
+    path('export-pdf/', export_pdf, name="export_pdf"),
+    path('export-pdf/jobs/', submit_pdf_export, name="submit_pdf_export"),
+    path('export-pdf/jobs/status/', pdf_export_status, name="pdf_export_status"),
+    path('export-pdf/jobs/download/', download_pdf_export, name="download_pdf_export")
 ]
\ No newline at end of file
@@ -0,0 +1,67 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from api.models.tasks import Tasks
+
+# One pass over the board: every grouping the dashboard needs comes out of the same scan.
+# Assignees are unnested so a task counts once for each of its assignees, COUNT(DISTINCT)
+# keeps the per status/priority/total numbers from being multiplied by that join.
+BOARD_ANALYTICS_SQL = """
+SELECT
+    GROUPING(t.status) AS g_status,
+    GROUPING(t.priority) AS g_priority,
+    GROUPING(a.assignee) AS g_assignee,
+    t.status,
+    t.priority,
+    a.assignee,
+    COUNT(DISTINCT t.task_id) AS total,
+    COUNT(DISTINCT t.task_id) FILTER (WHERE t."dueDate" < %(today)s AND t.status <> %(done)s) AS overdue,
+    COUNT(DISTINCT t.task_id) FILTER (
+        WHERE t."dueDate" >= %(today)s AND t."dueDate" < %(week_end)s AND t.status <> %(done)s
+    ) AS due_this_week
+FROM tasks t
+LEFT JOIN LATERAL unnest(t.assignees) AS a(assignee) ON true
+WHERE t."workspaceId_id" = %(workspace_id)s
+GROUP BY GROUPING SETS ((t.status), (t.priority), (a.assignee), ())
+"""
+
+def compute_board_analytics(workspace_id, today):
+    week_end = today + timedelta(days=7 - today.weekday())
+    params = {"workspace_id": str(workspace_id), "today": today, "week_end": week_end, "done": Tasks.Status.DONE}
+    with connection.cursor() as cursor:
+        cursor.execute(BOARD_ANALYTICS_SQL, params)
+        rows = cursor.fetchall()
+
+    analytics = {
+        "total": 0,
+        "overdue": 0,
+        "due_this_week": 0,
+        "by_status": {status: 0 for status in Tasks.Status.values},
+        "by_priority": {priority: 0 for priority in Tasks.Priority.values},
+        "by_assignee": {},
+        "unassigned": 0,
+    }
+    for g_status, g_priority, g_assignee, status, priority, assignee, total, overdue, due_this_week in rows:
+        if not g_status:
+            analytics["by_status"][status] = total
+        elif not g_priority:
+            analytics["by_priority"][priority] = total
+        elif not g_assignee:
+            if assignee is None:
+                analytics["unassigned"] = total
+            else:
+                analytics["by_assignee"][str(assignee)] = total
+        else:
+            analytics.update(total=total, overdue=overdue, due_this_week=due_this_week)
+    return analytics
+
+def board_analytics(workspace_id, version, today):
+    # the workspace version is part of the key, so any task write invalidates the rollup;
+    # the date is too, overdue/due-this-week move with the calendar
+    key = f"analytics:{workspace_id}:{version}:{today.isoformat()}"
+    analytics = cache.get(key)
+    if analytics is None:
+        analytics = compute_board_analytics(workspace_id, today)
+        cache.set(key, analytics, getattr(settings, "ANALYTICS_CACHE_TTL", 3600))
+    return analytics
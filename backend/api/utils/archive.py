@@ -0,0 +1,60 @@
+from collections import defaultdict
+from django.db import transaction
+from api.models.archived_tasks import ArchivedTasks
+from api.models.tasks import Tasks
+from api.utils.ranking import append_ranks
+from api.utils.task_sync import record_tombstones
+from api.utils.versioning import bump_workspace_version
+from api.realtime.board import push_board_changes
+
+# columns carried between tasks and archived_tasks
+ARCHIVED_FIELDS = [
+    "task_id", "assignees", "tags", "created_by_id", "title", "description", "dueDate",
+    "created_at", "updated_at", "workspaceId_id", "priority", "status", "version",
+]
+
+def archive_batch(cutoff, batch_size):
+    # one short transaction per batch; rows somebody is editing right now are skipped, not waited on
+    with transaction.atomic():
+        tasks = list(
+            Tasks.objects.select_for_update(skip_locked=True)
+            .filter(status=Tasks.Status.DONE, done_at__lt=cutoff)
+            .order_by("done_at").defer("search_vector")[:batch_size]
+        )
+        if not tasks:
+            return 0
+        ArchivedTasks.objects.bulk_create([
+            ArchivedTasks(**{field: getattr(task, field) for field in ARCHIVED_FIELDS}, done_at=task.done_at)
+            for task in tasks
+        ])
+        Tasks.objects.filter(task_id__in=[task.task_id for task in tasks]).delete()
+
+        # to synced clients an archived task is gone from the board
+        by_workspace = defaultdict(list)
+        for task in tasks:
+            by_workspace[task.workspaceId_id].append(task.task_id)
+        for workspace_id, task_ids in by_workspace.items():
+            record_tombstones(workspace_id, task_ids)
+            push_board_changes(workspace_id, deleted=task_ids)
+        bump_workspace_version(*by_workspace)
+    return len(tasks)
+
+def restore_tasks(workspace_id, task_ids):
+    # back to the bottom of their column; done_at restarts so the next pass doesn't take them again
+    with transaction.atomic():
+        archived = list(ArchivedTasks.objects.select_for_update().filter(workspaceId=workspace_id, task_id__in=task_ids))
+        if not archived:
+            return []
+        tasks = [Tasks(**{field: getattr(a, field) for field in ARCHIVED_FIELDS}) for a in archived]
+        for task in tasks:
+            task.version += 1
+        append_ranks(workspace_id, tasks)
+        created_at = {task.task_id: task.created_at for task in tasks}
+        Tasks.objects.bulk_create(tasks)
+        # bulk_create stamps auto_now_add fields with now(), put the real creation time back
+        for task in tasks:
+            task.created_at = created_at[task.task_id]
+        Tasks.objects.bulk_update(tasks, ["created_at"])
+        ArchivedTasks.objects.filter(task_id__in=[a.task_id for a in archived]).delete()
+        bump_workspace_version(workspace_id)
+    return tasks
@@ -0,0 +1,120 @@
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from django.conf import settings
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+# Long-lived headless Chromium shared by every request in the process. A background thread
+# runs one event loop that owns playwright and at most `size` browsers; request threads hand
+# it jobs through run() and block on the result. Each job gets a fresh browser context
+# (cookies and storage never carry over between users) on an already running browser.
+# Browsers that crashed, timed out mid-job or served `max_jobs` jobs are closed and relaunched
+# on demand. Started lazily, so each worker process gets its own after forking.
+
+class BrowserPool:
+    def __init__(self, size, max_jobs):
+        self.size = size
+        self.max_jobs = max_jobs
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self._loop
+            if async_playwright is None:
+                raise RuntimeError("playwright is not installed")
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._start(), loop).result(timeout=30)
+            except Exception:
+                loop.call_soon_threadsafe(loop.stop)
+                raise
+            self._loop, self._thread = loop, thread
+            return loop
+
+    async def _start(self):
+        self._playwright = await async_playwright().start()
+        self._slots = asyncio.Semaphore(self.size)
+        # warm browsers not running a job right now, as [browser, jobs served]
+        self._idle = []
+
+    async def _checkout(self):
+        while self._idle:
+            browser, jobs = self._idle.pop()
+            if browser.is_connected():
+                return browser, jobs
+        return await self._playwright.chromium.launch(), 0
+
+    async def _checkin(self, browser, jobs, healthy):
+        if healthy and browser.is_connected() and jobs < self.max_jobs:
+            self._idle.append((browser, jobs))
+            return
+        try:
+            await browser.close()
+        except Exception as e:
+            print("Closing pooled browser failed : ", e)
+
+    async def _run(self, job, timeout, context_options):
+        async with self._slots:
+            browser, jobs = await self._checkout()
+            healthy, context = False, None
+            try:
+                context = await browser.new_context(**context_options)
+                context.set_default_timeout(timeout * 1000)
+                result = await asyncio.wait_for(job(context), timeout)
+                healthy = True
+                return result
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        healthy = False
+                await self._checkin(browser, jobs + 1, healthy)
+
+    def run(self, job, timeout, queue_timeout, **context_options):
+        # job: async callable taking a BrowserContext. Raises TimeoutError when the job doesn't
+        # get a browser within queue_timeout or doesn't finish within timeout once it has one.
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(self._run(job, timeout, context_options), loop)
+        try:
+            return future.result(timeout=timeout + queue_timeout)
+        except (concurrent.futures.TimeoutError, asyncio.TimeoutError):
+            future.cancel()
+            raise TimeoutError("Browser job timed out")
+
+    async def _stop(self):
+        for browser, _ in self._idle:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self._idle = []
+        await self._playwright.stop()
+
+    def shutdown(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result(timeout=10)
+            except Exception as e:
+                print("Stopping browser pool failed : ", e)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+browser_pool = BrowserPool(
+    size=getattr(settings, "PDF_BROWSER_POOL_SIZE", 2),
+    max_jobs=getattr(settings, "PDF_BROWSER_MAX_JOBS", 50),
+)
+atexit.register(browser_pool.shutdown)
@@ -0,0 +1,59 @@
+from datetime import date, datetime, timedelta, timezone
+
+# Columnar layout for big listings, sent as MessagePack (see ColumnarRenderer):
+#   {"count": n, "columns": {field: [value, ...]}, "dictionaries": {field: [choice, ...]}}
+# one array per field, in the serializer's field order, where
+#   - UUIDs are 16 raw bytes (lists of UUIDs are lists of those)
+#   - datetimes are integer microseconds since the unix epoch, UTC
+#   - dates are integer days since the unix epoch
+#   - choice fields hold indexes into dictionaries[field]
+# nulls stay null everywhere.
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+EPOCH_DAY = date(1970, 1, 1).toordinal()
+MICROSECOND = timedelta(microseconds=1)
+
+def _uuid(value):
+    return bytes.fromhex(value.replace("-", ""))
+
+def _uuid_list(values):
+    return [None if v is None else _uuid(v) for v in values]
+
+def _datetime(value):
+    # takes the serialized (DRF ISO 8601) form
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return (datetime.fromisoformat(value) - EPOCH) // MICROSECOND
+
+def _date(value):
+    return date.fromisoformat(value).toordinal() - EPOCH_DAY
+
+ENCODERS = {"uuid": _uuid, "uuid_list": _uuid_list, "datetime": _datetime, "date": _date}
+
+def columnar(rows, keys, kinds, choices=None):
+    # rows: serialized dicts; kinds: key -> one of ENCODERS; choices: key -> dictionary for enum columns
+    choices = choices or {}
+    columns, dictionaries = {}, {}
+    for key in keys:
+        values = [row[key] for row in rows]
+        if key in choices:
+            dictionary = list(choices[key])
+            index = {choice: i for i, choice in enumerate(dictionary)}
+            encoded = []
+            for value in values:
+                if value is not None and value not in index:
+                    # a value the model doesn't know anymore still has to round-trip
+                    index[value] = len(dictionary)
+                    dictionary.append(value)
+                encoded.append(None if value is None else index[value])
+            columns[key], dictionaries[key] = encoded, dictionary
+        elif key in kinds:
+            encode = ENCODERS[kinds[key]]
+            columns[key] = [None if value is None else encode(value) for value in values]
+        else:
+            columns[key] = values
+    return {"count": len(rows), "columns": columns, "dictionaries": dictionaries}
+
+def users_columnar(users):
+    # the {id: profile} side-table from user_utils.users_by_id
+    return columnar(list(users.values()), ["userId", "name", "email"], {"userId": "uuid"})
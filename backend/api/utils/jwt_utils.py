@@ -36,7 +36,7 @@ def generate_token(user_id):
         "refresh_token": refresh_token
     }
 
-def verify_token(token, token_type="access"):
+def decode_token(token, token_type="access"):
     try:
         payload = jwt.decode(
             token,
@@ -46,8 +46,14 @@ def verify_token(token, token_type="access"):
         )
         if payload["type"] != token_type:
             return None
-        return payload["sub"]
+        return payload
     except jwt.ExpiredSignatureError:
         return "expired"
     except jwt.InvalidTokenError:
         return None
+
+def verify_token(token, token_type="access"):
+    payload = decode_token(token, token_type)
+    if isinstance(payload, dict):
+        return payload["sub"]
+    return payload
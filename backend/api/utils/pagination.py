@@ -0,0 +1,73 @@
+import base64
+import json
+from functools import reduce
+from django.db.models import Q
+
+# Keyset ("seek") pagination. The cursor is an opaque token carrying the sort key of the
+# last row handed out, so fetching page N costs the same as fetching page 1.
+
+def encode_cursor(ordering_name, values):
+    raw = json.dumps({"o": ordering_name, "k": values}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(token, ordering_name):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError("Malformed cursor")
+    if not isinstance(data, dict) or data.get("o") != ordering_name or not isinstance(data.get("k"), list):
+        raise ValueError("Cursor does not match this listing")
+    return data["k"]
+
+def _after(ordering, values):
+    # (a, b, c) > (x, y, z)  ==>  a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+    clauses = []
+    for i, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        equal = {ordering[j].lstrip("-"): values[j] for j in range(i)}
+        clauses.append(Q(**equal, **{f"{name}__{lookup}": values[i]}))
+    return reduce(lambda a, b: a | b, clauses)
+
+def _sort_key(row, ordering):
+    key = []
+    for field in ordering:
+        name = field.lstrip("-")
+        value = row[name] if isinstance(row, dict) else getattr(row, name)
+        key.append(value.isoformat() if hasattr(value, "isoformat") else value)
+    return key
+
+# returns (rows, next_cursor); ordering must end in a unique column so the key is total.
+# works for both model instances and .values() rows
+def keyset_queryset(queryset, ordering, ordering_name, cursor=None):
+    # ordered listing resuming after cursor, without a page size (streamed responses)
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        values = decode_cursor(cursor, ordering_name)
+        if len(values) != len(ordering):
+            raise ValueError("Cursor does not match this listing")
+        queryset = queryset.filter(_after(ordering, values))
+    return queryset
+
+def paginate_keyset(queryset, ordering, ordering_name, cursor=None, limit=None):
+    queryset = keyset_queryset(queryset, ordering, ordering_name, cursor)
+    if not limit:
+        return list(queryset), None
+
+    rows = list(queryset[:limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(ordering_name, _sort_key(rows[-1], ordering))
+
+def parse_limit(value, default=None, maximum=500):
+    if value in (None, ""):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        limit = 0
+    if limit <= 0:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, maximum)
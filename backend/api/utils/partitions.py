@@ -0,0 +1,73 @@
+import re
+from datetime import date, datetime, timezone
+from django.db import connection, transaction
+
+# notifications is range partitioned by created_at, one partition per UTC month named
+# notifications_pYYYYMM, plus notifications_default catching anything outside them
+# (migration 0009). Partitions are created ahead of time and old ones dropped whole by
+# manage_notification_partitions.
+
+PARENT = "notifications"
+DEFAULT_PARTITION = "notifications_default"
+PARTITION_NAME = re.compile(r"^notifications_p(\d{4})(\d{2})$")
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(month):
+    return f"{PARENT}_p{month:%Y%m}"
+
+def _bounds(month):
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end = datetime.combine(add_months(month, 1), datetime.min.time(), tzinfo=timezone.utc)
+    return start, end
+
+def list_partitions():
+    # month -> partition name, for the monthly partitions currently attached
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s",
+            [PARENT],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = {}
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+def ensure_partition(month):
+    # built next to the table and attached, so rows that already fell into the default
+    # partition for that month move with it instead of blocking the attach
+    name = partition_name(month)
+    start, end = _bounds(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0]:
+            return False
+        cursor.execute(f'CREATE TABLE "{name}" (LIKE "{PARENT}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" WHERE created_at >= %s AND created_at < %s RETURNING *) '
+            f'INSERT INTO "{name}" SELECT * FROM moved',
+            [start, end],
+        )
+        cursor.execute(f"ALTER TABLE \"{PARENT}\" ATTACH PARTITION \"{name}\" FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')")
+    return True
+
+def retire_partition(name, archive=False):
+    # detaching is a catalog change, no row is touched; archived partitions stay around as
+    # plain tables (e.g. for pg_dump) until someone drops them
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{PARENT}" DETACH PARTITION "{name}"')
+        if archive:
+            cursor.execute(f'ALTER TABLE "{name}" RENAME TO "archived_{name}"')
+        else:
+            cursor.execute(f'DROP TABLE "{name}"')
@@ -0,0 +1,172 @@
+from collections import deque
+from datetime import date
+from api.models.tasks import Tasks
+from api.models.team_members import TeamMembers
+from api.models.workspace import Workspace
+from api.utils.pdf_writer import PdfDocument, text_width, truncate, wrap
+from api.utils.user_utils import users_by_id
+
+# The "native" PDF export engine: the board drawn straight from the database, no browser or
+# frontend involved. First page opens with the board name, members and per-status progress,
+# then the five columns sit side by side in rank order. A column that runs out of room
+# continues on the next page; a card taller than a whole page is split across pages.
+
+COLUMNS = [
+    ("todo", "TO DO", "#697283"),
+    ("in_progress", "IN PROGRESS", "#F0B000"),
+    ("blocked", "BLOCKED", "#fa2c36"),
+    ("in_review", "IN REVIEW", "#2B7FFF"),
+    ("done", "DONE", "#00C950"),
+]
+PRIORITY_COLORS = {"high": "#dc2626", "medium": "#ca8a04", "low": "#16a34a"}
+TEXT, BODY, MUTED, CARD = "#111827", "#374151", "#6b7280", "#f3f4f6"
+
+MARGIN = 28
+GAP = 8
+PADDING = 6
+LEADING = 1.35
+COLUMN_HEADER = 18
+FOOTER = 14
+CONTINUED = ("(continued)", 6, False, MUTED)
+
+def _lines(text, width, size, bold, color):
+    return [(line, size, bold, color) for line in wrap(text, width, size, bold)]
+
+def _height(lines):
+    return 2 * PADDING + sum(size * LEADING for _, size, _, _ in lines)
+
+def _card(task, names, width):
+    # a card is its list of (text, size, bold, color) lines
+    lines = []
+    tags = task["tags"]
+    if tags:
+        label = " ".join(f"#{tag}" for tag in tags[:5]) + (f" +{len(tags) - 5}" if len(tags) > 5 else "")
+        lines += _lines(label, width, 6, False, MUTED)
+    lines += _lines(task["title"], width, 8, True, TEXT)
+    lines.append((f"{task['priority'].upper()}   due {task['dueDate'].isoformat()}", 6.5, True, PRIORITY_COLORS.get(task["priority"], MUTED)))
+    description = task["description"].strip()
+    if description:
+        lines += _lines(description, width, 7, False, BODY)
+    assignees = [names[str(a)]["name"] for a in task["assignees"] if str(a) in names]
+    if assignees:
+        lines += _lines("Assignees: " + ", ".join(assignees), width, 6.5, False, MUTED)
+    return lines
+
+def _paginate(cards, first_space, space):
+    # -> one list of cards per page for a single column
+    pages, current, left = [], [], first_space
+    queue = deque(cards)
+    while queue:
+        lines = queue.popleft()
+        needed = _height(lines)
+        if needed <= left:
+            current.append(lines)
+            left -= needed + GAP
+            continue
+        if current and needed <= space:
+            # fits a page of its own, don't break it up
+            pages.append(current)
+            current, left = [], space
+            queue.appendleft(lines)
+            continue
+        fit, used = 0, 2 * PADDING
+        while fit < len(lines) and used + lines[fit][1] * LEADING <= left:
+            used += lines[fit][1] * LEADING
+            fit += 1
+        if fit:
+            current.append(lines[:fit])
+            queue.appendleft([CONTINUED, *lines[fit:]])
+        pages.append(current)
+        current, left = [], space
+    pages.append(current)
+    return pages
+
+def _draw_card(page, x, y, width, lines, color):
+    height = _height(lines)
+    page.rect(x, y, width, height, CARD)
+    page.rect(x, y, 2, height, color)
+    cursor = y + PADDING
+    for text, size, bold, text_color in lines:
+        page.text(x + PADDING + 2, cursor + size, text, size, text_color, bold)
+        cursor += size * LEADING
+    return height
+
+def _draw_header(page, workspace, members, counts, width):
+    page.text(MARGIN, MARGIN + 16, truncate(workspace["name"], width, 18, True), 18, TEXT, True)
+    y = MARGIN + 30
+    if workspace["description"].strip():
+        page.text(MARGIN, y, truncate(workspace["description"].strip(), width, 8), 8, MUTED)
+        y += 12
+    page.text(MARGIN, y, truncate("Members: " + (", ".join(members) or "-"), width, 8), 8, BODY)
+    y += 10
+    total, x = sum(counts.values()), MARGIN
+    page.rect(MARGIN, y, width, 6, "#e5e7eb")
+    for status, _, color in COLUMNS:
+        if total and counts[status]:
+            share = width * counts[status] / total
+            page.rect(x, y, share, 6, color)
+            x += share
+    y += 16
+    legend = "   ".join(f"{title} {counts[status]}" for status, title, _ in COLUMNS)
+    page.text(MARGIN, y, f"{legend}   |   {total} tasks   |   exported {date.today().isoformat()}", 7, MUTED)
+    return y + 12
+
+def build_board_pdf(workspace, members, tasks, names):
+    # workspace: {"name", "description"}; members: names; tasks: dicts in column order
+    document = PdfDocument(title=workspace["name"])
+    page_width, page_height = document.page_size
+    content_width = page_width - 2 * MARGIN
+    column_width = (content_width - GAP * (len(COLUMNS) - 1)) / len(COLUMNS)
+    line_width = column_width - 2 * PADDING - 2
+
+    by_status = {status: [] for status, _, _ in COLUMNS}
+    for task in tasks:
+        by_status.setdefault(task["status"], []).append(task)
+    counts = {status: len(by_status[status]) for status, _, _ in COLUMNS}
+
+    first = document.new_page()
+    body_top = _draw_header(first, workspace, members, counts, content_width) + COLUMN_HEADER
+    later_top = MARGIN + 14 + COLUMN_HEADER
+    bottom = page_height - MARGIN - FOOTER
+    columns = [
+        _paginate([_card(task, names, line_width) for task in by_status[status]], bottom - body_top, bottom - later_top)
+        for status, _, _ in COLUMNS
+    ]
+
+    page_count = max(len(pages) for pages in columns)
+    for number in range(page_count):
+        page = first if number == 0 else document.new_page()
+        top = body_top if number == 0 else later_top
+        if number:
+            page.text(MARGIN, MARGIN + 8, truncate(workspace["name"], content_width, 10, True), 10, TEXT, True)
+        for index, (status, title, color) in enumerate(COLUMNS):
+            x = MARGIN + index * (column_width + GAP)
+            page.rect(x, top - COLUMN_HEADER, 6, 6, color)
+            label = f"{title} ({counts[status]})" if number == 0 else f"{title} (cont.)"
+            page.text(x + 10, top - COLUMN_HEADER + 6, label, 8, TEXT, True)
+            cards = columns[index][number] if number < len(columns[index]) else []
+            if number == 0 and not cards:
+                page.text(x, top + 8, "No tasks", 7, MUTED)
+            y = top
+            for lines in cards:
+                y += _draw_card(page, x, y, column_width, lines, color) + GAP
+        footer = f"Page {number + 1} of {page_count}"
+        page.text(page_width - MARGIN - text_width(footer, 7), page_height - MARGIN, footer, 7, MUTED)
+    return document.render()
+
+def render_native_board_pdf(workspace_id):
+    workspace = Workspace.objects.filter(workspaceId=workspace_id).values("name", "description").first()
+    if workspace is None:
+        raise ValueError("Workspace not found")
+    tasks = list(
+        Tasks.objects.filter(workspaceId=workspace_id)
+        .order_by("rank", "created_at", "task_id")
+        .values("title", "description", "dueDate", "priority", "status", "tags", "assignees")
+    )
+    member_ids = list(
+        TeamMembers.objects.filter(workspaceId=workspace_id, status=TeamMembers.Status.ACCEPTED)
+        .order_by("created_at").values_list("userId", flat=True)
+    )
+    names = users_by_id({str(a) for task in tasks for a in task["assignees"]} | {str(m) for m in member_ids})
+    members = [names[str(m)]["name"] for m in member_ids if str(m) in names]
+    return build_board_pdf(workspace, members, tasks, names)
@@ -0,0 +1,78 @@
+import hashlib
+import os
+import tempfile
+import time
+from datetime import date
+from django.conf import settings
+
+# Rendered board PDFs on disk, one file per board state: the name is a hash of the workspace,
+# its version (bumped by every task, member and workspace write), the engine and the day (the
+# header prints the export date), so an unchanged board is rendered once a day and a changed
+# one can never be served stale.
+# Files are written aside and renamed into place, and the least recently used ones (by
+# mtime, refreshed on every hit) go once the directory grows past PDF_CACHE_MAX_BYTES.
+# Readers that already opened a file keep it even if it's evicted meanwhile. A write that was
+# interrupted leaves its .tmp file behind; those go once they're older than a render may take.
+
+# bump when the output of an engine changes, old entries then simply age out
+LAYOUT_REVISION = 1
+
+def cache_dir():
+    path = getattr(settings, "PDF_CACHE_DIR", "") or os.path.join(tempfile.gettempdir(), "kanflow-pdf")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def fingerprint(workspace_id, version, engine):
+    raw = f"{workspace_id}:{version}:{engine}:{date.today().isoformat()}:{LAYOUT_REVISION}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+def _path(key):
+    return os.path.join(cache_dir(), f"{key}.pdf")
+
+def get(key):
+    # -> path of the cached PDF, or None
+    path = _path(key)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+def put(key, pdf):
+    # -> path of the stored PDF
+    path = _path(key)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir(), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    evict(keep=path)
+    return path
+
+def evict(keep=None):
+    max_bytes = getattr(settings, "PDF_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+    orphaned_before = time.time() - getattr(settings, "PDF_EXPORT_TIMEOUT", 30)
+    entries = []
+    for entry in os.scandir(cache_dir()):
+        try:
+            if entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+            elif entry.name.endswith(".tmp") and entry.stat().st_mtime < orphaned_before:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
@@ -0,0 +1,140 @@
+import os
+from django.conf import settings
+from api.utils.browser_pool import browser_pool
+from api.utils.pdf_board import render_native_board_pdf
+
+# Board PDF export, by one of two engines:
+#   - "browser": the print view of the Next.js app rendered by a pooled headless browser
+#     (api/utils/browser_pool.py), looks exactly like the board on screen
+#   - "native": drawn from the database in pure python (api/utils/pdf_board.py), no browser
+#     or frontend needed and far cheaper
+# The browser engine waits for readiness, never sleeps on it: the page sets window.isPageReady
+# once its data is loaded, then layout is done when the document height holds still for a few
+# animation frames.
+
+ENGINES = ("browser", "native")
+
+# the board normally lives in fixed-height scroll containers, let everything grow instead
+PRINT_CSS = """
+#__next {
+    height: auto !important;
+    min-height: auto !important;
+    overflow: visible !important;
+}
+html, body {
+    height: auto !important;
+    min-height: 100vh !important;
+    overflow: visible !important;
+}
+main, .main, [role="main"] {
+    height: auto !important;
+    min-height: auto !important;
+    max-height: none !important;
+    overflow: visible !important;
+}
+.flex, .d-flex, [class*="flex"] {
+    height: auto !important;
+    min-height: auto !important;
+    max-height: none !important;
+}
+.grid, .d-grid, [class*="grid"] {
+    height: auto !important;
+    min-height: auto !important;
+    max-height: none !important;
+}
+.container, .container-fluid, [class*="container"] {
+    height: auto !important;
+    min-height: auto !important;
+    max-height: none !important;
+    overflow: visible !important;
+}
+.h-screen, .min-h-screen, .max-h-screen {
+    height: auto !important;
+    min-height: auto !important;
+    max-height: none !important;
+}
+.overflow-hidden, .overflow-x-hidden, .overflow-y-hidden {
+    overflow: visible !important;
+}
+[class*="board"], [class*="kanban"], [class*="task"] {
+    height: auto !important;
+    min-height: auto !important;
+    max-height: none !important;
+    overflow: visible !important;
+}
+[class*="card"], [class*="task"], [class*="item"] {
+    page-break-inside: avoid;
+    break-inside: avoid;
+}
+"""
+
+# resolves once scrollHeight has been the same for `frames` consecutive frames; scrolling to the
+# bottom and back gets anything rendered on scroll to show up first
+WAIT_FOR_STABLE_LAYOUT = """
+async (frames) => {
+    await document.fonts.ready;
+    const height = () => Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+    const nextFrame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+    let last = -1, stable = 0;
+    while (stable < frames) {
+        window.scrollTo(0, height());
+        await nextFrame();
+        window.scrollTo(0, 0);
+        await nextFrame();
+        const current = height();
+        stable = current === last ? stable + 1 : 0;
+        last = current;
+    }
+    return last;
+}
+"""
+
+def board_print_url(workspace_id):
+    base_url = getattr(settings, "FRONTEND_URL", "http://localhost:3000")
+    return f"{base_url}/workspace/{workspace_id}?print=true&secret={os.getenv('PRINT_SECRET')}"
+
+async def _render_board(context, url, cookies):
+    await context.add_cookies(cookies)
+    page = await context.new_page()
+    await page.goto(url, wait_until="domcontentloaded")
+    await page.wait_for_function("() => window.isPageReady === true")
+    await page.add_style_tag(content=PRINT_CSS)
+    content_height = await page.evaluate(WAIT_FOR_STABLE_LAYOUT, 3)
+    await page.set_viewport_size({"width": 1280, "height": max(content_height, 1024)})
+    # one more settle after the resize reflows the board
+    await page.evaluate(WAIT_FOR_STABLE_LAYOUT, 2)
+    return await page.pdf(
+        format="A4",
+        landscape=True,
+        print_background=True,
+        margin={"top": "0", "bottom": "0", "left": "0", "right": "0"},
+        prefer_css_page_size=True,
+        display_header_footer=False,
+    )
+
+def export_engine(requested=None):
+    # -> engine name, the PDF_EXPORT_ENGINE setting unless one is asked for; ValueError if unknown
+    engine = requested or getattr(settings, "PDF_EXPORT_ENGINE", "browser")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown PDF engine, expected one of: {', '.join(ENGINES)}")
+    return engine
+
+def render_board_pdf(workspace_id, access_token, engine="browser"):
+    # -> PDF bytes; TimeoutError when the pool is saturated or the page never becomes ready
+    if engine == "native":
+        return render_native_board_pdf(workspace_id)
+    cookies = [{
+        "name": "access_token",
+        "value": access_token,
+        "domain": "localhost",
+        "path": "/",
+        "httpOnly": False,
+        "secure": False
+    }]
+    url = board_print_url(workspace_id)
+    return browser_pool.run(
+        lambda context: _render_board(context, url, cookies),
+        timeout=getattr(settings, "PDF_EXPORT_TIMEOUT", 30),
+        queue_timeout=getattr(settings, "PDF_EXPORT_QUEUE_TIMEOUT", 30),
+        viewport={"width": 1280, "height": 1024},
+    )
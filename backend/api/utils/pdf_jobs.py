@@ -0,0 +1,115 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from api.utils import pdf_cache
+from api.utils.pdf_export import render_board_pdf
+
+# Background PDF exports. Job records live in the django cache (shared between workers when
+# the cache is), renders run on a small thread pool in the process that took the submission
+# and finished files land in the PDF cache (api/utils/pdf_cache.py). Submissions for a
+# workspace version (and engine) that already has a queued or running job get that job back,
+# ones whose PDF is already cached are done on the spot, without a render.
+
+QUEUED, RENDERING, DONE, FAILED = "queued", "rendering", "done", "failed"
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "PDF_EXPORT_WORKERS", 2), thread_name_prefix="pdf-export"
+)
+# queued + running jobs this process accepts before turning submissions away
+_slots = threading.BoundedSemaphore(getattr(settings, "PDF_EXPORT_MAX_PENDING", 20))
+
+def _ttl():
+    return getattr(settings, "PDF_JOB_TTL", 3600)
+
+def _job_key(job_id):
+    return f"pdf_job:{job_id}"
+
+def _state_key(workspace_id, version, engine):
+    return f"pdf_job_for:{workspace_id}:{version}:{engine}"
+
+def get_job(job_id):
+    return cache.get(_job_key(job_id)) if job_id else None
+
+def _save(job):
+    cache.set(_job_key(job["job_id"]), job, _ttl())
+
+def job_payload(job):
+    return {key: job[key] for key in ("job_id", "workspace_id", "version", "engine", "status", "error", "created_at", "finished_at")}
+
+def _stale(job):
+    # a job whose process died never finishes, stop handing it out after it certainly would have
+    limit = getattr(settings, "PDF_EXPORT_QUEUE_TIMEOUT", 30) + getattr(settings, "PDF_EXPORT_TIMEOUT", 30)
+    return job["status"] in (QUEUED, RENDERING) and time.time() - job["created_at"] > 2 * limit
+
+def _reusable(job, fingerprint):
+    # a job from another day rendered another export date
+    if job is None or job["fingerprint"] != fingerprint or job["status"] == FAILED or _stale(job):
+        return False
+    return job["status"] != DONE or pdf_cache.get(job["fingerprint"]) is not None
+
+def submit(workspace_id, version, access_token, engine):
+    # -> (job, created); job is None when this process already has a full queue
+    fingerprint = pdf_cache.fingerprint(workspace_id, version, engine)
+    existing = get_job(cache.get(_state_key(workspace_id, version, engine)))
+    if _reusable(existing, fingerprint):
+        return existing, False
+    job = {
+        "job_id": str(uuid.uuid4()), "workspace_id": str(workspace_id), "version": version,
+        "engine": engine, "status": QUEUED, "error": None, "created_at": time.time(), "finished_at": None,
+        "fingerprint": fingerprint,
+    }
+    if pdf_cache.get(job["fingerprint"]):
+        job.update(status=DONE, finished_at=job["created_at"])
+        _save(job)
+        cache.set(_state_key(workspace_id, version, engine), job["job_id"], _ttl())
+        return job, False
+    if not _slots.acquire(blocking=False):
+        return None, False
+    _save(job)
+    # another process may have registered the same state meanwhile, first one in wins
+    if not cache.add(_state_key(workspace_id, version, engine), job["job_id"], _ttl()):
+        existing = get_job(cache.get(_state_key(workspace_id, version, engine)))
+        if _reusable(existing, fingerprint):
+            cache.delete(_job_key(job["job_id"]))
+            _slots.release()
+            return existing, False
+        cache.set(_state_key(workspace_id, version, engine), job["job_id"], _ttl())
+    _executor.submit(_run, job, access_token)
+    return job, True
+
+def _run(job, access_token):
+    # the native engine reads the database from this thread
+    close_old_connections()
+    try:
+        job.update(status=RENDERING)
+        _save(job)
+        pdf = render_board_pdf(job["workspace_id"], access_token, job["engine"])
+        pdf_cache.put(job["fingerprint"], pdf)
+        job.update(status=DONE)
+    except TimeoutError:
+        job.update(status=FAILED, error="PDF generation timed out")
+    except Exception:
+        # nobody is waiting on this thread, the traceback only survives in the log
+        logger.exception("PDF export job %s for workspace %s failed", job["job_id"], job["workspace_id"])
+        job.update(status=FAILED, error="PDF generation failed")
+    finally:
+        job["finished_at"] = time.time()
+        _save(job)
+        _slots.release()
+        close_old_connections()
+
+def wait_for_job(job_id, timeout):
+    # for callers that still want the file in the same request; polls the (shared) record
+    deadline = time.monotonic() + timeout
+    while True:
+        job = get_job(job_id)
+        if job is None or job["status"] in (DONE, FAILED) or time.monotonic() >= deadline:
+            return job
+        time.sleep(0.1)
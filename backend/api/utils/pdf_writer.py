@@ -0,0 +1,196 @@
+import functools
+import unicodedata
+import zlib
+
+# Just enough PDF 1.4 to draw filled rectangles and text in the standard Helvetica fonts,
+# which every viewer has built in, so nothing gets embedded. Text goes through
+# WinAnsiEncoding; characters it can't hold fall back to their unaccented form or "?".
+# Coordinates are points from the top-left corner of the page, y growing downwards.
+
+# advance widths per 1000 units of font size, from the Adobe core font metrics (AFM)
+_ASCII = " !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~"
+_HELVETICA = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+# the punctuation outside ASCII that shows up in typed text
+_EXTRA = {"•": 350, "–": 556, "—": 1000, "…": 1000, "€": 556, "·": 278}
+_EXTRA_REGULAR = {"‘": 222, "’": 222, "“": 333, "”": 333}
+_EXTRA_BOLD = {"‘": 278, "’": 278, "“": 500, "”": 500}
+
+class _Widths(dict):
+    # char -> width; characters outside the table (accented letters, already winansi'd) are
+    # as wide as their base letter, looked up once and remembered
+    def __missing__(self, char):
+        base = unicodedata.normalize("NFKD", char)[:1]
+        width = self[base] if base != char and base in self else 556
+        self[char] = width
+        return width
+
+WIDTHS = {
+    False: _Widths({**dict(zip(_ASCII, _HELVETICA)), **_EXTRA, **_EXTRA_REGULAR}),
+    True: _Widths({**dict(zip(_ASCII, _HELVETICA_BOLD)), **_EXTRA, **_EXTRA_BOLD}),
+}
+# resource names in the page dictionaries
+FONTS = {False: ("F1", "Helvetica"), True: ("F2", "Helvetica-Bold")}
+
+A4_LANDSCAPE = (842, 595)
+
+# letters NFKD can't take apart
+_FALLBACK = {"ł": "l", "Ł": "L", "đ": "d", "Đ": "D", "ı": "i"}
+
+def _encodable(char):
+    try:
+        return ord(char) >= 32 and len(char.encode("cp1252")) == 1
+    except UnicodeEncodeError:
+        return False
+
+@functools.lru_cache(maxsize=4096)
+def _winansi_char(char):
+    if char in "\t\n\r":
+        return " "
+    if _encodable(char) and char not in _FALLBACK:
+        return char
+    base = _FALLBACK.get(char) or unicodedata.normalize("NFKD", char).encode("ascii", "ignore").decode()
+    return base if base and all(_encodable(c) for c in base) else "?"
+
+def winansi(text):
+    # -> text made only of characters the standard fonts can show
+    if text.isascii() and text.isprintable():
+        return text
+    return "".join(map(_winansi_char, text))
+
+def text_width(text, size, bold=False):
+    return sum(map(WIDTHS[bold].__getitem__, text)) * size / 1000
+
+def _fit(text, width, size, bold):
+    # longest prefix of text no wider than width
+    cut = len(text)
+    while cut and text_width(text[:cut], size, bold) > width:
+        cut -= 1
+    return cut
+
+def wrap(text, width, size, bold=False):
+    # greedy line breaking on spaces; words wider than a line are cut wherever they must be
+    lines = []
+    space = text_width(" ", size, bold)
+    for paragraph in text.replace("\r\n", "\n").split("\n"):
+        line, line_width = "", 0
+        for word in winansi(paragraph).split(" "):
+            word_width = text_width(word, size, bold)
+            if not line and word_width <= width:
+                line, line_width = word, word_width
+            elif line and line_width + space + word_width <= width:
+                line, line_width = f"{line} {word}", line_width + space + word_width
+            elif word_width <= width:
+                lines.append(line)
+                line, line_width = word, word_width
+            else:
+                # too long for any line, start it on this one
+                prefix = f"{line} " if line else ""
+                while text_width(prefix + word, size, bold) > width:
+                    cut = _fit(prefix + word, width, size, bold) - len(prefix)
+                    if cut <= 0 and prefix:
+                        lines.append(line)
+                        prefix = ""
+                        continue
+                    cut = max(cut, 1)
+                    lines.append(prefix + word[:cut])
+                    prefix, word = "", word[cut:]
+                line = prefix + word
+                line_width = text_width(line, size, bold)
+        lines.append(line)
+    return lines
+
+def truncate(text, width, size, bold=False):
+    text = winansi(text)
+    if text_width(text, size, bold) <= width:
+        return text
+    while text and text_width(text + "...", size, bold) > width:
+        text = text[:-1]
+    return text + "..."
+
+def _color(hex_color):
+    value = hex_color.lstrip("#")
+    return " ".join(f"{int(value[i:i + 2], 16) / 255:.3f}" for i in (0, 2, 4))
+
+def _literal(text):
+    raw = text.encode("cp1252", "replace")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+class Page:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._ops = []
+
+    def rect(self, x, y, width, height, color):
+        self._ops.append(f"{_color(color)} rg {x:.2f} {self.height - y - height:.2f} {width:.2f} {height:.2f} re f".encode())
+
+    def text(self, x, y, text, size, color="#000000", bold=False):
+        # y is the baseline
+        font = FONTS[bold][0]
+        self._ops.append(
+            f"BT /{font} {size:g} Tf {_color(color)} rg {x:.2f} {self.height - y:.2f} Td ".encode()
+            + _literal(winansi(text)) + b" Tj ET"
+        )
+
+    def content(self):
+        return b"\n".join(self._ops)
+
+class PdfDocument:
+    def __init__(self, page_size=A4_LANDSCAPE, title=""):
+        self.page_size = page_size
+        self.title = title
+        self.pages = []
+
+    def new_page(self):
+        page = Page(*self.page_size)
+        self.pages.append(page)
+        return page
+
+    def render(self):
+        # objects: 1 catalog, 2 page tree, 3/4 fonts, 5 info, then a page + its content per page
+        objects = [None] * 5
+        page_ids = []
+        for page in self.pages:
+            stream = zlib.compress(page.content(), 6)
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream) + stream + b"\nendstream")
+            objects.append(None)
+            page_ids.append(len(objects))
+        width, height = self.page_size
+        fonts = " ".join(f"/{name} {i + 3} 0 R" for i, (name, _) in enumerate(FONTS.values()))
+        for page_id in page_ids:
+            objects[page_id - 1] = (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
+                f"/Resources << /Font << {fonts} >> >> /Contents {page_id - 1} 0 R >>"
+            ).encode()
+        objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+        kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+        objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+        for i, (_, base_font) in enumerate(FONTS.values()):
+            objects[2 + i] = f"<< /Type /Font /Subtype /Type1 /BaseFont /{base_font} /Encoding /WinAnsiEncoding >>".encode()
+        objects[4] = b"<< /Title " + _literal(winansi(self.title)) + b" /Producer (Kanflow) >>"
+
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        return bytes(out)
@@ -0,0 +1,134 @@
+import threading
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from api.models.tasks import Tasks
+from api.utils.versioning import bump_workspace_version
+from api.realtime.board import push_board_changes
+
+# Cards are ordered inside a column by a lexicographic fractional rank: a base62 string
+# compared byte-wise (the column uses the "C" collation). There is always a key between
+# two others, so a drag only rewrites the card that moved.
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+def rank_between(before, after):
+    # before="" means start of the column, after=None means end; keys never end in "0"
+    before = before or ""
+    if after is not None and before >= after:
+        raise ValueError(f"{before!r} is not before {after!r}")
+    if before.endswith(DIGITS[0]) or (after and after.endswith(DIGITS[0])):
+        raise ValueError("Rank keys can't end in the zero digit")
+    if after is None and before:
+        return _increment(before)
+    return _midpoint(before, after)
+
+def _increment(key, width=4):
+    # appending is the common case, counting up in a fixed width keeps those keys short
+    digits = [DIGITS.index(c) for c in key.ljust(width, DIGITS[0])]
+    for i in range(len(digits) - 1, -1, -1):
+        if digits[i] < BASE - 1:
+            digits[i] += 1
+            return "".join(DIGITS[d] for d in digits).rstrip(DIGITS[0])
+        digits[i] = 0
+    return key + _midpoint("", None)
+
+def _midpoint(a, b):
+    if b:
+        # skip the common prefix, padding a with zeros
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else DIGITS[0]) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else BASE
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    if b and len(b) > 1:
+        return b[0]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+def even_ranks(count):
+    # count evenly spaced keys, as short as possible
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    step = BASE ** width / (count + 1)
+    ranks = []
+    for i in range(1, count + 1):
+        value, digits = int(step * i), []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        ranks.append("".join(reversed(digits)).rstrip(DIGITS[0]))
+    return ranks
+
+def append_ranks(workspace_id, tasks):
+    # gives every task a rank at the bottom of its (new) column, one grouped query for all columns
+    statuses = {task.status for task in tasks}
+    last = dict(
+        Tasks.objects.filter(workspaceId=workspace_id, status__in=statuses)
+        .values("status").annotate(last=Max("rank")).values_list("status", "last")
+    )
+    for task in tasks:
+        task.rank = rank_between(last.get(task.status) or "", None)
+        last[task.status] = task.rank
+        maybe_rebalance(workspace_id, task.status, task.rank)
+
+def rebalance_column(workspace_id, status):
+    # every respaced card is a real change: synced clients (tasks/changes/) and board ETags
+    # have to see the new ranks, or the next card they get sorts against stale ones
+    now = timezone.now()
+    with transaction.atomic():
+        tasks = list(
+            Tasks.objects.select_for_update().filter(workspaceId=workspace_id, status=status)
+            .order_by("rank", "task_id").only("task_id", "rank", "version")
+        )
+        # rows a move committed while this waited on their lock come back with the new rank but
+        # sorted by the old one, so the column is put back in order before it is respaced
+        tasks.sort(key=lambda task: (task.rank, task.task_id))
+        for task, rank in zip(tasks, even_ranks(len(tasks))):
+            task.rank = rank
+            task.version += 1
+            task.updated_at = now
+        Tasks.objects.bulk_update(tasks, ["rank", "version", "updated_at"], batch_size=1000)
+        bump_workspace_version(workspace_id)
+        push_board_changes(workspace_id, [task.task_id for task in tasks])
+
+# (workspace id, status) -> event set once that column's rebalance is over
+_rebalancing = {}
+_rebalancing_lock = threading.Lock()
+
+def _rebalance_in_background(workspace_id, status, done):
+    try:
+        rebalance_column(workspace_id, status)
+    except Exception as e:
+        print("Rank rebalance failed : ", e)
+    finally:
+        with _rebalancing_lock:
+            _rebalancing.pop((workspace_id, status), None)
+        done.set()
+        connection.close()
+
+def _start_rebalance(key):
+    # joins the rebalance already running for this column, if any
+    with _rebalancing_lock:
+        done = _rebalancing.get(key)
+        if done is None:
+            done = _rebalancing[key] = threading.Event()
+            threading.Thread(target=_rebalance_in_background, args=(*key, done), daemon=True).start()
+    return done
+
+def wait_for_rebalance(workspace_id, status):
+    # respaces the column on the background rebalancer; -> False if it didn't finish in time
+    timeout = getattr(settings, "TASK_RANK_REBALANCE_WAIT_SECONDS", 5)
+    return _start_rebalance((str(workspace_id), status)).wait(timeout)
+
+def maybe_rebalance(workspace_id, status, rank):
+    # keys only grow when cards keep getting dropped into the same gap, respace the column then
+    if len(rank) > getattr(settings, "TASK_RANK_REBALANCE_LENGTH", 24):
+        key = (str(workspace_id), status)
+        transaction.on_commit(lambda: _start_rebalance(key))
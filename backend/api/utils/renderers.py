@@ -0,0 +1,83 @@
+import gzip
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+class FastJSONRenderer(JSONRenderer):
+    # Same bytes as JSONRenderer (compact, unescaped unicode, U+2028/2029 escaped), through
+    # orjson when it is installed. Meant for payloads that are already plain JSON types,
+    # i.e. the projections in api/serializers/projection.py; anything else falls back.
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            # datetimes would come out as "+00:00" instead of DRF's "Z", let them fall back
+            ret = orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+class ColumnarRenderer(BaseRenderer):
+    # MessagePack, for views that lay their listings out with api/utils/columnar.py when
+    # request.accepted_renderer is this one. gzipped when the client takes it.
+    media_type = "application/vnd.kanflow.columnar+msgpack"
+    format = "columnar"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        request, response = renderer_context.get("request"), renderer_context.get("response")
+        if data is None:
+            # a 304 answers with the tag of the variant the client revalidated
+            if request is not None and response is not None and response.status_code == 304 and response.has_header("ETag"):
+                if gzip_etag(response["ETag"]) in request.headers.get("If-None-Match", ""):
+                    response["ETag"] = gzip_etag(response["ETag"])
+            return b""
+        body = msgpack.packb(data, use_bin_type=True)
+        if request is None or response is None:
+            return body
+        patch_vary_headers(response, ["Accept-Encoding"])
+        if accepts_gzip(request) and len(body) >= getattr(settings, "COLUMNAR_GZIP_MIN_BYTES", 1024):
+            response["Content-Encoding"] = "gzip"
+            body = gzip.compress(body, compresslevel=6)
+            # the gzipped bytes are another representation, they can't share the plain one's tag
+            if response.has_header("ETag"):
+                response["ETag"] = gzip_etag(response["ETag"])
+        return body
+
+def gzip_etag(etag):
+    # '"abc"' -> '"abc-gzip"'; api/utils/versioning.etag_matches takes either for the same version
+    return etag[:-1] + '-gzip"'
+
+def accepts_gzip(request):
+    # Accept-Encoding with its q-values, "gzip;q=0" is a refusal; "*" covers gzip when it isn't listed
+    weights = {}
+    for coding in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        name, *params = coding.split(";")
+        weight = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+    return weights.get("gzip", weights.get("*", 0)) > 0
+
+# renderers for the big listings; without msgpack installed asking for the columnar format is a 406
+LIST_RENDERERS = [FastJSONRenderer, BrowsableAPIRenderer, *([ColumnarRenderer] if msgpack else [])]
+
+def wants_columnar(request):
+    return request.accepted_renderer.format == ColumnarRenderer.format
@@ -0,0 +1,51 @@
+from collections.abc import Iterator
+from itertools import islice
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from api.utils.renderers import FastJSONRenderer
+
+# Incremental JSON for responses too big to build in memory. The body is byte-for-byte
+# what FastJSONRenderer would produce for the same data, except that:
+#   - iterators are written out as arrays, chunk by chunk, as they are consumed
+#   - callables are called once everything before them has been written (e.g. a side-table
+#     collected while the rows went by)
+
+_renderer = FastJSONRenderer()
+
+def stream_chunk_size():
+    return getattr(settings, "STREAM_CHUNK_SIZE", 2000)
+
+def _encode(value):
+    # the renderer turns a bare None into an empty body
+    return b"null" if value is None else _renderer.render(value)
+
+def _stream(value, chunk_size):
+    if isinstance(value, dict):
+        yield b"{"
+        for i, (key, item) in enumerate(value.items()):
+            yield (b"," if i else b"") + _encode(str(key)) + b":"
+            yield from _stream(item, chunk_size)
+        yield b"}"
+    elif isinstance(value, Iterator):
+        yield b"["
+        separator = b""
+        while chunk := list(islice(value, chunk_size)):
+            yield separator + _encode(chunk)[1:-1]
+            separator = b","
+        yield b"]"
+    elif callable(value):
+        yield from _stream(value(), chunk_size)
+    else:
+        yield _encode(value)
+
+def _guarded(chunks):
+    # headers are long gone by the time a row fails, all we can do is cut the body short
+    try:
+        yield from chunks
+    except Exception as e:
+        print("Streaming response failed : ", e)
+        raise
+
+def streaming_json_response(data, status=200, headers=None):
+    chunks = _guarded(_stream(data, stream_chunk_size()))
+    return StreamingHttpResponse(chunks, status=status, content_type="application/json", headers=headers)
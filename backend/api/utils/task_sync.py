@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.utils import timezone
+from api.models.task_tombstones import TaskTombstones
+from api.utils.pagination import encode_cursor, decode_cursor
+
+# A sync cursor is a server-side watermark. It is handed out slightly in the past so rows
+# from transactions that were still in flight when it was issued are re-sent, not skipped;
+# clients upsert by task_id so the overlap is harmless.
+
+def issue_sync_cursor(upper=None):
+    upper = upper or timezone.now()
+    overlap = timedelta(seconds=getattr(settings, "TASK_SYNC_OVERLAP_SECONDS", 2))
+    return encode_cursor("sync", [(upper - overlap).isoformat()])
+
+def read_sync_cursor(token):
+    try:
+        since = datetime.fromisoformat(decode_cursor(token, "sync")[0])
+    except (ValueError, IndexError, TypeError):
+        raise ValueError("Invalid sync cursor")
+    if timezone.is_naive(since):
+        raise ValueError("Invalid sync cursor")
+    return since
+
+def sync_cursor_expired(since):
+    # older than the tombstones we keep around, the client has to reload the board
+    retention = timedelta(days=getattr(settings, "TASK_TOMBSTONE_RETENTION_DAYS", 30))
+    return since < timezone.now() - retention
+
+def record_tombstones(workspace_id, task_ids):
+    now = timezone.now()
+    TaskTombstones.objects.bulk_create([
+        TaskTombstones(task_id=task_id, workspaceId_id=workspace_id, deleted_at=now) for task_id in task_ids
+    ])
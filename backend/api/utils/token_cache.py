@@ -0,0 +1,54 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from django.conf import settings
+
+# compact record of who the caller is, enough for most views without hitting the user table
+Principal = namedtuple("Principal", ["userId", "name", "email"])
+CachedToken = namedtuple("CachedToken", ["sub", "exp", "principal", "expires_at"])
+
+class TokenCache:
+    def __init__(self, max_entries, max_ttl):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token):
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, token, sub, exp, principal):
+        # never keep an entry past the token's own expiry
+        expires_at = min(float(exp), time.time() + self.max_ttl)
+        entry = CachedToken(sub=sub, exp=exp, principal=principal, expires_at=expires_at)
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+token_cache = TokenCache(
+    max_entries=getattr(settings, "AUTH_TOKEN_CACHE_SIZE", 10000),
+    max_ttl=getattr(settings, "AUTH_TOKEN_CACHE_TTL", 300),
+)
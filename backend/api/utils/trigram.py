@@ -0,0 +1,15 @@
+from django.db import connection
+
+# pg_trgm gives task search its typo tolerance. Some postgres builds don't ship it; on those
+# migrations 0006/0008 leave out the trigram indexes and search matches on full text only.
+
+_installed = None
+
+def trigram_installed():
+    # looked up once per process, installing the extension needs a migrate (and restart) anyway
+    global _installed
+    if _installed is None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            _installed = cursor.fetchone()[0]
+    return _installed
@@ -1,9 +1,70 @@
-
+import uuid
+from collections import namedtuple
+from django.conf import settings
+from django.core.cache import cache
 from api.models.team_members import TeamMembers
+from api.models.user import User
 
-def is_user_admin(user_id, workspace_id):
+Membership = namedtuple("Membership", ["status", "privilege"])
+
+# cached for users with no row at all, so repeated probes don't hit the db either
+_NOT_A_MEMBER = "none"
+
+def _membership_key(user_id, workspace_id):
+    return f"membership:{workspace_id}:{user_id}"
+
+def _normalize_id(value):
     try:
-        team_member = TeamMembers.objects.get(workspaceId=workspace_id, userId=user_id)
-        return team_member.privilege == "admin"
-    except TeamMembers.DoesNotExist:
-        return False
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+def get_membership(user_id, workspace_id):
+    user_id = _normalize_id(user_id)
+    workspace_id = _normalize_id(workspace_id)
+    if not user_id or not workspace_id:
+        return None
+
+    key = _membership_key(user_id, workspace_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return None if cached == _NOT_A_MEMBER else Membership(*cached)
+
+    row = TeamMembers.objects.filter(workspaceId=workspace_id, userId=user_id).values_list("status", "privilege").first()
+    cache.set(key, tuple(row) if row else _NOT_A_MEMBER, getattr(settings, "MEMBERSHIP_CACHE_TTL", 300))
+    return Membership(*row) if row else None
+
+def invalidate_membership(user_id, workspace_id):
+    user_id = _normalize_id(user_id)
+    workspace_id = _normalize_id(workspace_id)
+    if user_id and workspace_id:
+        cache.delete(_membership_key(user_id, workspace_id))
+
+def is_accepted_member(user_id, workspace_id):
+    membership = get_membership(user_id, workspace_id)
+    return membership is not None and membership.status == TeamMembers.Status.ACCEPTED
+
+def is_user_admin(user_id, workspace_id):
+    membership = get_membership(user_id, workspace_id)
+    return (
+        membership is not None
+        and membership.status == TeamMembers.Status.ACCEPTED
+        and membership.privilege == TeamMembers.Privilege.ADMIN
+    )
+
+def task_user_ids(task):
+    # everyone a serialized task references
+    user_ids = [str(user_id) for user_id in task["assignees"]]
+    if task["created_by"]:
+        user_ids.append(str(task["created_by"]))
+    return user_ids
+
+def task_users(tasks):
+    # id -> profile for every assignee and creator on the page (serialized tasks), cards reference it by id
+    return users_by_id({user_id for task in tasks for user_id in task_user_ids(task)})
+
+def users_by_id(user_ids):
+    if not user_ids:
+        return {}
+    users = User.objects.filter(userId__in=user_ids).values("userId", "name", "email")
+    return {str(user["userId"]): {**user, "userId": str(user["userId"])} for user in users}
@@ -0,0 +1,31 @@
+import hashlib
+import json
+from django.db.models import F
+from rest_framework.response import Response
+from rest_framework import status as drf_status
+from api.models.workspace import Workspace
+
+def bump_workspace_version(*workspace_ids):
+    workspace_ids = [w for w in workspace_ids if w]
+    if workspace_ids:
+        Workspace.objects.filter(workspaceId__in=workspace_ids).update(version=F("version") + 1)
+
+def get_workspace_version(workspace_id):
+    # None when the workspace doesn't exist
+    return Workspace.objects.filter(workspaceId=workspace_id).values_list("version", flat=True).first()
+
+def make_etag(*parts):
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+def etag_matches(request, etag):
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    # If-None-Match always uses the weak comparison
+    # and a gzipped body's tag (api/utils/renderers.py) revalidates the same version
+    candidates = [c.strip().removeprefix("W/").replace('-gzip"', '"') for c in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+def not_modified(etag):
+    return Response(status=drf_status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -1,27 +1,113 @@
-from rest_framework.decorators import api_view
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+from rest_framework.decorators import api_view, renderer_classes
 from rest_framework.response import Response
 from rest_framework import status as drf_status
 from api.middlewares.auth_middleware import jwt_authentication
-from api.models.notifications import Notifications
+from api.models.notifications import Notifications, Type, Reaction
 from api.models.user import User
-from api.serializers.notification_serializer import NotificationSerializer
+from api.serializers.notification_serializer import NOTIFICATION_PROJECTION
+from api.utils.renderers import LIST_RENDERERS, wants_columnar
+from api.utils.streaming import streaming_json_response, stream_chunk_size
+from api.utils.pagination import paginate_keyset, keyset_queryset, parse_limit
 from api.models.team_members import TeamMembers
+from api.utils.user_utils import invalidate_membership
+from api.utils.versioning import bump_workspace_version
+from api.realtime.notifications import push_notifications, push_notifications_changed, UPDATED as NOTIFICATION_UPDATED
+
+NOTIFICATION_ORDERING = ["-created_at", "-notification_id"]
+NOTIFICATION_CHOICES = {"type": Type.values, "reaction": Reaction.values}
+
+def filter_notifications(notifications, params):
+    for field, choices in NOTIFICATION_CHOICES.items():
+        value = params.get(field)
+        if value:
+            if value not in choices:
+                raise ValueError(f"Invalid {field}")
+            notifications = notifications.filter(**{field: value})
+    is_read = params.get('is_read')
+    if is_read:
+        if is_read not in ("true", "false"):
+            raise ValueError("is_read must be true or false")
+        notifications = notifications.filter(is_read=is_read == "true")
+    return notifications
+
+# an invite's notification and its team_members row are written in the same request, in
+# either order, so the row's created_at tells within this margin when the invite went out
+INVITE_MARGIN = timedelta(minutes=1)
+
+def windowed_notifications(notifications, user_id):
+    # recent months only so the planner prunes old partitions; invites still waiting
+    # for an answer are kept whatever their age. -> the parts to union
+    cutoff = timezone.now() - timedelta(days=getattr(settings, "NOTIFICATIONS_WINDOW_DAYS", 90))
+    parts = [notifications.filter(created_at__gte=cutoff)]
+    # the pending memberships (a small indexed lookup) bound how far back old invites can sit,
+    # and without any nothing older than the window is read at all
+    oldest = TeamMembers.objects.filter(
+        userId=user_id, status=TeamMembers.Status.PENDING, created_at__lt=cutoff + INVITE_MARGIN
+    ).aggregate(oldest=Min("created_at"))["oldest"]
+    if oldest is not None:
+        parts.append(notifications.filter(
+            created_at__gte=oldest - INVITE_MARGIN, created_at__lt=cutoff, type=Type.REQUEST, reaction=Reaction.PENDING
+        ))
+    return parts
 
 @api_view(['GET'])
+@renderer_classes(LIST_RENDERERS)
 @jwt_authentication
 def get_all_notfications(request):
     userId = request.user_id
-    user = User.objects.get(userId=userId)
     try:
-        notfications = Notifications.objects.filter(toUser=user)
-        notfications_serialized=NotificationSerializer(notfications, many=True)
+        params = request.query_params
+        try:
+            notfications = filter_notifications(Notifications.objects.filter(toUser=userId, dismissed=False), params)
+            parts = [notfications] if params.get('all') == "true" else windowed_notifications(notfications, userId)
+            # the cursor goes into every part, so each one still reads only its own newest rows
+            parts = [
+                NOTIFICATION_PROJECTION.values(
+                    keyset_queryset(part, NOTIFICATION_ORDERING, "notifications", params.get('cursor')).order_by(),
+                    "notification_id",
+                ) for part in parts
+            ]
+            notfications = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+            # no limit keeps the old "everything" behaviour for existing clients
+            limit = parse_limit(params.get('limit'), maximum=getattr(settings, "NOTIFICATIONS_PAGE_MAX", 100))
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+        if params.get('stream') == "true" and not limit and not wants_columnar(request):
+            notfications = notfications.order_by(*NOTIFICATION_ORDERING)
+            payload = {"notifications":NOTIFICATION_PROJECTION.stream(notfications, stream_chunk_size()), "next_cursor":None}
+            return streaming_json_response({"success":True, "message":"Notifications fetch successful", "payload":payload}, headers={"Vary": "Accept"})
+        notfications, next_cursor = paginate_keyset(notfications, NOTIFICATION_ORDERING, "notifications", None, limit)
+        notfications = NOTIFICATION_PROJECTION.serialize(notfications)
+        if wants_columnar(request):
+            notfications = NOTIFICATION_PROJECTION.columnar(notfications)
         payload={
-            "notifications":notfications_serialized.data
+            "notifications":notfications,
+            "next_cursor":next_cursor
         }
-        return Response({"success":True, "message":"Notifications fetch successful", "payload":payload},status=drf_status.HTTP_200_OK)
+        return Response({"success":True, "message":"Notifications fetch successful", "payload":payload},status=drf_status.HTTP_200_OK, headers={"Vary": "Accept"})
     except Exception as e:
         print("Fetching all the notfications : ", e)
         return Response({"success":False, "message":"Notifications could'nt be fetched", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+def unread_count(user_id):
+    # counted off notif_unread_idx, over the same rows the default listing shows
+    unread = Notifications.objects.filter(toUser=user_id, is_read=False, dismissed=False)
+    return sum(part.count() for part in windowed_notifications(unread, user_id))
+
+@api_view(['GET'])
+@jwt_authentication
+def unread_notifications_count(request):
+    try:
+        return Response({"success":True, "message":"Unread notifications count", "payload":{"unread":unread_count(request.user_id)}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Counting unread notifications : ", e)
+        return Response({"success":False, "message":"Unread notifications couldn't be counted", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
     
 @api_view(['POST'])
 @jwt_authentication
@@ -39,13 +125,16 @@ def accept_reject_workspace_invite(request):
         notification.save()# Saving the notificiation update reaction whether is accepted or rejected
 
         team_member = TeamMembers.objects.filter(workspaceId__workspaceId=workspaceId,userId__userId=user_id).first()
-        team_member.status=reaction
         if not team_member:
             return Response({
                 "success": False,
                 "message": "Team member not found for this workspace."
             }, status=drf_status.HTTP_404_NOT_FOUND)
+        team_member.status=reaction
         team_member.save()
+        invalidate_membership(user_id, workspaceId)
+        bump_workspace_version(team_member.workspaceId_id)
+        push_notifications(NOTIFICATION_UPDATED, [notification])
         return Response({"success": True,"message": f"Workspace invite {reaction} successfully."}, status=drf_status.HTTP_200_OK)
     except Exception as e:
         print("Error in updating : ", e)
@@ -59,13 +148,113 @@ def mark_notification_read(request):
         notification_id = data.get('notification_id')
         if not notification_id:
             return Response({"success": False,"message": "Notification ID is required"}, status=drf_status.HTTP_400_BAD_REQUEST)
-        notification = Notifications.objects.filter(notification_id=notification_id).first()
-        if not notification:
+        try:
+            notification_id = uuid.UUID(str(notification_id))
+        except ValueError:
+            return Response({"success": False,"message": "Invalid notification ID"}, status=drf_status.HTTP_400_BAD_REQUEST)
+        # one UPDATE, and only on the caller's own notifications
+        updated = Notifications.objects.filter(notification_id=notification_id, toUser=request.user_id).update(is_read=True, updated_at=timezone.now())
+        if not updated:
             return Response({"success": False,"message": "Notification not found"}, status=drf_status.HTTP_404_NOT_FOUND)
-        
-        notification.is_read = True
-        notification.save()
         return Response({"success": True,"message": "Notification marked as read"}, status=drf_status.HTTP_200_OK)
     except Exception as e:
         print("Error in updating the read reciept : ", e)
-        return Response({"success":False, "message":"Unable to mark read true"}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        return Response({"success":False, "message":"Unable to mark read true"}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+# Bulk inbox operations: each is one UPDATE on the caller's own notifications, the unread
+# count handed back is read in the same transaction so it already reflects the change.
+
+def notification_ids(data):
+    ids = data.get('notification_ids')
+    if ids in (None, "", []):
+        return []
+    ids = ids if isinstance(ids, list) else [ids]
+    max_ids = getattr(settings, "NOTIFICATION_BULK_MAX_IDS", 500)
+    if len(ids) > max_ids:
+        raise ValueError(f"At most {max_ids} notification_ids per request")
+    try:
+        return [uuid.UUID(str(notification_id)) for notification_id in ids]
+    except ValueError:
+        raise ValueError("Invalid UUID in notification_ids")
+
+def _selected_notifications(request):
+    # -> the caller's notifications named in the body (or all of them with "all": true)
+    ids = notification_ids(request.data)
+    notifications = Notifications.objects.filter(toUser=request.user_id)
+    if str(request.data.get('all')).lower() == "true":
+        return notifications
+    if not ids:
+        raise ValueError("notification_ids not provided")
+    return notifications.filter(notification_id__in=ids)
+
+@api_view(['POST'])
+@jwt_authentication
+def mark_notifications_read(request):
+    try:
+        try:
+            notifications = _selected_notifications(request)
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            updated = notifications.filter(is_read=False).update(is_read=True, updated_at=timezone.now())
+            unread = unread_count(request.user_id)
+        if updated:
+            push_notifications_changed(request.user_id)
+        return Response({"success":True, "message":"Notifications marked as read", "payload":{"updated":updated, "unread":unread}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Error marking notifications read : ", e)
+        return Response({"success":False, "message":"Unable to mark notifications read", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['POST'])
+@jwt_authentication
+def dismiss_notifications(request):
+    try:
+        try:
+            notifications = _selected_notifications(request)
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            # a dismissed notification counts as read, the unread badge never sees it again
+            updated = notifications.filter(dismissed=False).update(dismissed=True, is_read=True, updated_at=timezone.now())
+            unread = unread_count(request.user_id)
+        if updated:
+            push_notifications_changed(request.user_id)
+        return Response({"success":True, "message":"Notifications dismissed", "payload":{"updated":updated, "unread":unread}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Error dismissing notifications : ", e)
+        return Response({"success":False, "message":"Unable to dismiss notifications", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['POST'])
+@jwt_authentication
+def respond_to_invites(request):
+    try:
+        reaction = request.data.get('reaction')
+        if reaction not in (Reaction.ACCEPTED, Reaction.REJECTED):
+            return Response({"success":False, "message":"reaction must be accepted or rejected", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+        try:
+            notifications = _selected_notifications(request)
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        user_id = request.user_id
+        now = timezone.now()
+        invites = notifications.filter(type=Type.REQUEST, reaction=Reaction.PENDING)
+        with transaction.atomic():
+            # locked so a concurrent answer to the same invites can't slip in between
+            workspace_ids = set(invites.select_for_update().values_list("workspaceId", flat=True)) - {None}
+            updated = invites.update(reaction=reaction, is_read=True, updated_at=now)
+            memberships = TeamMembers.objects.filter(
+                userId=user_id, workspaceId__in=workspace_ids, status=TeamMembers.Status.PENDING
+            ).update(status=reaction, updated_at=now)
+            bump_workspace_version(*workspace_ids)
+            unread = unread_count(user_id)
+        # after the commit, so nobody caches the old membership in between
+        for workspace_id in workspace_ids:
+            invalidate_membership(user_id, workspace_id)
+        if updated:
+            push_notifications_changed(user_id)
+        payload = {"updated":updated, "memberships":memberships, "workspaceIds":sorted(map(str, workspace_ids)), "unread":unread}
+        return Response({"success":True, "message":f"Workspace invites {reaction}", "payload":payload}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Error answering workspace invites : ", e)
+        return Response({"success":False, "message":"Something went wrong while answering invites", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -7,13 +7,32 @@ from api.models.tasks import Tasks
 import uuid
 from api.models.workspace import Workspace
 from api.models.user import User
-from api.serializers.task_serializer import TaskSerializer, TaskSerializerDetailed
-from api.models.team_members import TeamMembers
+from api.serializers.task_serializer import TaskSerializer, TaskSerializerDetailed, ArchivedTaskSerializer, TASK_PROJECTION
+from api.models.archived_tasks import ArchivedTasks
+from api.utils.archive import restore_tasks
+from api.utils.user_utils import is_accepted_member, task_users, task_user_ids, users_by_id
+from api.utils.pagination import paginate_keyset, keyset_queryset, parse_limit
+from api.utils.streaming import streaming_json_response, stream_chunk_size
+from api.utils.task_sync import issue_sync_cursor, read_sync_cursor, sync_cursor_expired, record_tombstones
+from api.models.task_tombstones import TaskTombstones
+from api.utils.analytics import board_analytics
+from api.utils.trigram import trigram_installed
+from api.utils.ranking import rank_between, append_ranks, wait_for_rebalance, maybe_rebalance
+from api.utils.versioning import bump_workspace_version, get_workspace_version, make_etag, etag_matches, not_modified
+from api.utils.renderers import LIST_RENDERERS, wants_columnar
+from api.utils.columnar import users_columnar
+from rest_framework.decorators import renderer_classes
 from django.utils import timezone
-import asyncio
-from playwright.async_api import async_playwright
-from django.http import StreamingHttpResponse
-import os
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, F
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+import re
+from api.utils.pdf_jobs import submit as submit_pdf_job, get_job as get_pdf_job, wait_for_job as wait_for_pdf_job, job_payload as pdf_job_payload, DONE as PDF_JOB_DONE, FAILED as PDF_JOB_FAILED
+from api.utils.pdf_export import export_engine as pdf_export_engine
+from api.realtime.board import push_board_changes
+from api.utils import pdf_cache
+from django.http import FileResponse
 
 @api_view(['POST'])
 @jwt_authentication
@@ -21,6 +40,8 @@ def create_task(request):
     try:
         data = request.data
         workspaceId = data.get('workspaceId')
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to create tasks here!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
         title = str(data.get("title") or "").strip()
         print("Title : ", title)
         description = str(data.get("description") or "").strip()
@@ -43,9 +64,8 @@ def create_task(request):
             return Response({"success": False, "message": "Invalid assignee UUID format", "payload": {}},
                             status=drf_status.HTTP_400_BAD_REQUEST)
         workspace = Workspace.objects.get(workspaceId=workspaceId)
-        user = User.objects.get(userId=request.user_id)
-        task = Tasks.objects.create(
-            created_by=user,
+        task = Tasks(
+            created_by_id=request.user_id,
             workspaceId=workspace,
             assignees=assignees_uuid,
             tags=tags,
@@ -55,6 +75,10 @@ def create_task(request):
             status=status,
             title=title
         )
+        append_ranks(workspace.workspaceId, [task])
+        task.save()
+        bump_workspace_version(workspace.workspaceId)
+        push_board_changes(workspace.workspaceId, [task.task_id], by=request.user_id)
         return Response({
             "success": True,
             "message": "Task created successfully",
@@ -66,7 +90,8 @@ def create_task(request):
                 "priority": task.priority,
                 "status": task.status,
                 "assignees": [str(a) for a in task.assignees],
-                "tags": task.tags
+                "tags": task.tags,
+                "rank": task.rank
             }
         }, status=drf_status.HTTP_201_CREATED) 
     except Exception as e:
@@ -94,50 +119,63 @@ def update_task(request):
                 "payload": {}
             }, status=drf_status.HTTP_400_BAD_REQUEST)
 
-        task = Tasks.objects.filter(task_id=task_id).first()
+        task = Tasks.objects.filter(task_id=task_id).defer("search_vector").first()
         if not task:
             return Response({
                 "success": False,
                 "message": "Task not found",
                 "payload": {}
             }, status=drf_status.HTTP_404_NOT_FOUND)
+        if not check_user_elgible(task.workspaceId_id, request.user_id):
+            return Response({
+                "success": False,
+                "message": "User not authorized to update this task!",
+                "payload": {}
+            }, status=drf_status.HTTP_401_UNAUTHORIZED)
 
-        updatable_fields = [
-            "title", "description", "dueDate", "priority", "status", "assignees", "tags"
-        ]
-
-        for field in updatable_fields:
-            if field in data:
-                if field == "dueDate":
-                    try:
-                        due_date = datetime.strptime(data[field], "%Y-%m-%d").date()
-                        task.dueDate = due_date
-                    except ValueError:
-                        return Response({
-                            "success": False,
-                            "message": "Invalid date format. Use YYYY-MM-DD",
-                            "payload": {}
-                        }, status=drf_status.HTTP_400_BAD_REQUEST)
-
-                elif field == "assignees":
-                    try:
-                        assignees_uuid = [uuid.UUID(a) for a in data[field]]
-                        task.assignees = assignees_uuid
-                    except ValueError:
-                        return Response({
-                            "success": False,
-                            "message": "Invalid UUID in assignees list",
-                            "payload": {}
-                        }, status=drf_status.HTTP_400_BAD_REQUEST)
-
-                elif field == "tags":
-                    task.tags = data[field]
+        try:
+            fields = parse_task_fields(data, partial=True)
+        except ValueError as e:
+            return Response({
+                "success": False,
+                "message": str(e),
+                "payload": {}
+            }, status=drf_status.HTTP_400_BAD_REQUEST)
 
-                else:
-                    setattr(task, field, data[field])
+        # clients send the version they edited, without one we still guard against races from here on
+        try:
+            expected_version = int(data["version"]) if data.get("version") is not None else task.version
+        except (TypeError, ValueError):
+            return Response({
+                "success": False,
+                "message": "Invalid version",
+                "payload": {}
+            }, status=drf_status.HTTP_400_BAD_REQUEST)
 
-        task.updated_at = timezone.now()
-        task.save()
+        if expected_version != task.version:
+            return task_conflict(task)
+
+        # only the columns that actually change end up in the UPDATE
+        changed = {field: value for field, value in fields.items() if getattr(task, field) != value}
+        if "status" in changed:
+            # changing column without an explicit move drops the card at the bottom
+            task.status = changed["status"]
+            append_ranks(task.workspaceId_id, [task])
+            changed["rank"] = task.rank
+
+        if changed:
+            now = timezone.now()
+            updated = Tasks.objects.filter(task_id=task.task_id, version=expected_version).update(
+                **changed, version=F("version") + 1, updated_at=now
+            )
+            if not updated:
+                return task_conflict(Tasks.objects.filter(task_id=task.task_id).defer("search_vector").first())
+            for field, value in changed.items():
+                setattr(task, field, value)
+            task.version = expected_version + 1
+            task.updated_at = now
+            bump_workspace_version(task.workspaceId_id)
+            push_board_changes(task.workspaceId_id, [task.task_id], by=request.user_id)
 
         return Response({
             "success": True,
@@ -150,7 +188,9 @@ def update_task(request):
                 "priority": task.priority,
                 "status": task.status,
                 "tags": task.tags,
-                "assignees": [str(a) for a in task.assignees]
+                "assignees": [str(a) for a in task.assignees],
+                "rank": task.rank,
+                "version": task.version
             }
         }, status=drf_status.HTTP_200_OK)
 
@@ -162,6 +202,15 @@ def update_task(request):
             "payload": {}
         }, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+def task_conflict(current):
+    if current is None:
+        return Response({"success": False, "message": "Task not found", "payload": {}}, status=drf_status.HTTP_404_NOT_FOUND)
+    return Response({
+        "success": False,
+        "message": "Task was changed by someone else, reload it and try again",
+        "payload": {"task": TaskSerializerDetailed(current).data}
+    }, status=drf_status.HTTP_409_CONFLICT)
+
 
 @api_view(['POST'])
 @jwt_authentication
@@ -179,8 +228,13 @@ def delete_task(request):
         task = Tasks.objects.filter(task_id=task_uuid).first()
         if not task:
             return Response({"success": False, "message": "Task not found"}, status=drf_status.HTTP_404_NOT_FOUND)
+        if not check_user_elgible(task.workspaceId_id, request.user_id):
+            return Response({"success": False, "message": "User not authorized to delete this task!"}, status=drf_status.HTTP_401_UNAUTHORIZED)
 
         task.delete()
+        record_tombstones(task.workspaceId_id, [task_uuid])
+        bump_workspace_version(task.workspaceId_id)
+        push_board_changes(task.workspaceId_id, deleted=[task_uuid], by=request.user_id)
         return Response({"success": True, "message": "Task deletion successful"}, status=drf_status.HTTP_200_OK)
 
     except Exception as e:
@@ -191,28 +245,502 @@ def delete_task(request):
             "payload": {}
         }, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+TASK_ORDERINGS = {
+    "created": ["created_at", "task_id"],
+    "-created": ["-created_at", "-task_id"],
+    "due": ["dueDate", "task_id"],
+    "updated": ["-updated_at", "-task_id"],
+    # board order: column by column, cards in their ranked position
+    "rank": ["status", "rank", "task_id"],
+}
+
+def _as_list(value):
+    if value in (None, "", []):
+        return []
+    return value if isinstance(value, list) else [value]
+
+def filter_tasks(tasks, data):
+    # raises ValueError with a client facing message for bad filter values
+    statuses = _as_list(data.get('status'))
+    if any(s not in Tasks.Status.values for s in statuses):
+        raise ValueError("Invalid status filter")
+    if statuses:
+        tasks = tasks.filter(status__in=statuses)
+
+    priorities = _as_list(data.get('priority'))
+    if any(p not in Tasks.Priority.values for p in priorities):
+        raise ValueError("Invalid priority filter")
+    if priorities:
+        tasks = tasks.filter(priority__in=priorities)
+
+    try:
+        assignees = [uuid.UUID(str(a)) for a in _as_list(data.get('assignee'))]
+        creators = [uuid.UUID(str(c)) for c in _as_list(data.get('created_by'))]
+    except ValueError:
+        raise ValueError("Invalid UUID in assignee/created_by filter")
+    if assignees:
+        tasks = tasks.filter(assignees__overlap=assignees)
+    if creators:
+        tasks = tasks.filter(created_by__in=creators)
+
+    tags = [str(t) for t in _as_list(data.get('tag'))]
+    if tags:
+        tasks = tasks.filter(tags__overlap=tags)
+
+    try:
+        if data.get('due_from'):
+            tasks = tasks.filter(dueDate__gte=datetime.strptime(data['due_from'], "%Y-%m-%d").date())
+        if data.get('due_to'):
+            tasks = tasks.filter(dueDate__lte=datetime.strptime(data['due_to'], "%Y-%m-%d").date())
+    except (ValueError, TypeError):
+        raise ValueError("Invalid due date range. Use YYYY-MM-DD")
+    return tasks
+
 @api_view(['POST'])
+@renderer_classes(LIST_RENDERERS)
 @jwt_authentication
 def get_all_tasks(request):
     try:
         data = request.data
         workspaceId = data.get('workspaceId')
-        workspace = Workspace.objects.filter(workspaceId=workspaceId).first()
-        if not workspace:
+        # checked before the version lookup, so not even a 304 tells outsiders the workspace exists
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+        version = get_workspace_version(workspaceId)
+        if version is None:
             return Response({"success":False, "message":"Workspace doesnt exists", "payload":{}}, status=drf_status.HTTP_404_NOT_FOUND)
-        tasks = Tasks.objects.filter(workspaceId=workspace)
-        serialized_tasks = TaskSerializer(tasks, many=True)
-        return Response({"success":True, "message":"Tasks fetched successfully", "payload":{"tasks":serialized_tasks.data}},status=drf_status.HTTP_201_CREATED)
+
+        # filters, cursor and wire format are part of the representation, so they go into the tag too
+        etag = make_etag("tasks", version, data, request.accepted_renderer.format)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        ordering_name = data.get('order_by') or "created"
+        if ordering_name not in TASK_ORDERINGS:
+            return Response({"success":False, "message":"Invalid ordering", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+        # issued before reading so nothing written during the read can be missed by tasks/changes/
+        sync_cursor = issue_sync_cursor()
+        try:
+            ordering = TASK_ORDERINGS[ordering_name]
+            tasks = filter_tasks(TASK_PROJECTION.values(Tasks.objects.filter(workspaceId=workspaceId), *(f.lstrip("-") for f in ordering)), data)
+            # no limit/cursor keeps the old "whole board" behaviour for existing clients
+            limit = parse_limit(data.get('limit'), maximum=getattr(settings, "TASKS_PAGE_MAX", 500))
+            # a page is small already, only whole boards are worth streaming; columnar needs whole columns
+            stream = str(data.get('stream')).lower() == "true" and not limit and not wants_columnar(request)
+            if stream:
+                tasks = keyset_queryset(tasks, ordering, ordering_name, data.get('cursor'))
+            else:
+                tasks, next_cursor = paginate_keyset(tasks, ordering, ordering_name, data.get('cursor'), limit)
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        if stream:
+            user_ids = set()
+            def streamed_tasks():
+                for task in TASK_PROJECTION.stream(tasks, stream_chunk_size()):
+                    user_ids.update(task_user_ids(task))
+                    yield task
+            payload = {"tasks":streamed_tasks(), "users":lambda: users_by_id(user_ids), "next_cursor":None, "sync_cursor":sync_cursor}
+            return streaming_json_response({"success":True, "message":"Tasks fetched successfully", "payload":payload}, status=drf_status.HTTP_201_CREATED, headers={"ETag": etag, "Vary": "Accept"})
+
+        serialized_tasks = TASK_PROJECTION.serialize(tasks)
+        users = task_users(serialized_tasks)
+        if wants_columnar(request):
+            serialized_tasks, users = TASK_PROJECTION.columnar(serialized_tasks), users_columnar(users)
+        return Response({"success":True, "message":"Tasks fetched successfully", "payload":{"tasks":serialized_tasks, "users":users, "next_cursor":next_cursor, "sync_cursor":sync_cursor}},status=drf_status.HTTP_201_CREATED, headers={"ETag": etag, "Vary": "Accept"})
     except Exception as e:
         print("Some error occured while fetching all the tasks.!", e)
         return Response({"success":False,"message":"Tasks fetched failed", "payload":{}},status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+@api_view(['POST'])
+@jwt_authentication
+def get_task_changes(request):
+    try:
+        data = request.data
+        workspaceId = data.get('workspaceId')
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+        try:
+            since = read_sync_cursor(data.get('cursor') or "")
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        upper = timezone.now()
+        next_cursor = issue_sync_cursor(upper)
+        if sync_cursor_expired(since):
+            return Response({"success":True, "message":"Sync cursor expired, reload the board", "payload":{"reset":True, "tasks":[], "deleted":[], "next_cursor":next_cursor}}, status=drf_status.HTTP_200_OK)
+
+        max_changes = getattr(settings, "TASK_SYNC_MAX_CHANGES", 1000)
+        changed = list(
+            Tasks.objects.filter(workspaceId=workspaceId, updated_at__gt=since, updated_at__lte=upper).defer("search_vector")
+            .order_by("updated_at", "task_id")[:max_changes + 1]
+        )
+        if len(changed) > max_changes:
+            # cheaper for everyone to just refetch the board at this point
+            return Response({"success":True, "message":"Too many changes, reload the board", "payload":{"reset":True, "tasks":[], "deleted":[], "next_cursor":next_cursor}}, status=drf_status.HTTP_200_OK)
+
+        changed_ids = {t.task_id for t in changed}
+        deleted = (
+            TaskTombstones.objects.filter(workspaceId=workspaceId, deleted_at__gt=since, deleted_at__lte=upper)
+            .values_list("task_id", flat=True).distinct()
+        )
+        # a task deleted and then brought back shows up as a change, not as a removal
+        deleted = [str(task_id) for task_id in deleted if task_id not in changed_ids]
+
+        changed = TaskSerializer(changed, many=True).data
+        payload = {
+            "reset": False,
+            "tasks": changed,
+            "users": task_users(changed),
+            "deleted": deleted,
+            "next_cursor": next_cursor,
+        }
+        return Response({"success":True, "message":"Task changes fetched", "payload":payload}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Some error occured while fetching task changes : ", e)
+        return Response({"success":False, "message":"Failed fetching task changes", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+TASK_FIELDS = ["title", "description", "dueDate", "priority", "status", "assignees", "tags"]
+REQUIRED_TASK_FIELDS = ["title", "description", "dueDate", "priority", "status"]
+
+def parse_task_fields(data, partial=False):
+    # validates the writable task fields present in data, raises ValueError with a client facing message
+    fields = {}
+    for field in TASK_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if field in ("title", "description"):
+            value = str(value or "").strip()
+        elif field == "dueDate":
+            try:
+                value = datetime.strptime(str(value), "%Y-%m-%d").date()
+            except ValueError:
+                raise ValueError("Invalid date format. Use YYYY-MM-DD")
+        elif field == "priority" and value not in Tasks.Priority.values:
+            raise ValueError("Invalid priority")
+        elif field == "status" and value not in Tasks.Status.values:
+            raise ValueError("Invalid status")
+        elif field == "assignees":
+            try:
+                value = [uuid.UUID(str(a)) for a in value or []]
+            except ValueError:
+                raise ValueError("Invalid UUID in assignees list")
+        elif field == "tags":
+            value = [str(t) for t in value or []]
+            if any(len(t) > 20 for t in value):
+                raise ValueError("Tags can be at most 20 characters")
+        fields[field] = value
+    if not partial and not all(fields.get(f) for f in REQUIRED_TASK_FIELDS):
+        raise ValueError("All fields are required")
+    return fields
+
+BULK_OPS = ("create", "update", "delete")
+
+@api_view(['POST'])
+@jwt_authentication
+def bulk_tasks(request):
+    try:
+        data = request.data
+        workspaceId = data.get('workspaceId')
+        operations = data.get('operations')
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+        max_ops = getattr(settings, "TASK_BULK_MAX_OPERATIONS", 500)
+        if not isinstance(operations, list) or not operations or len(operations) > max_ops:
+            return Response({"success":False, "message":f"operations must be a list of 1 to {max_ops} items", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        # validate everything up front, nothing is written unless every item is valid
+        parsed, results, errors = [], [], False
+        referenced, seen = [], set()
+        for index, item in enumerate(operations):
+            op = item.get('op') if isinstance(item, dict) else None
+            entry = {"index": index, "op": op, "success": True}
+            try:
+                if op not in BULK_OPS:
+                    raise ValueError("op must be one of create, update, delete")
+                task_id = None
+                if op != "create":
+                    try:
+                        task_id = uuid.UUID(str(item.get('task_id')))
+                    except ValueError:
+                        raise ValueError("Invalid task_id")
+                    if task_id in seen:
+                        raise ValueError("Task referenced more than once")
+                    seen.add(task_id)
+                    referenced.append(task_id)
+                fields = parse_task_fields(item, partial=op != "create") if op != "delete" else {}
+                try:
+                    version = int(item["version"]) if op != "create" and item.get("version") is not None else None
+                except (TypeError, ValueError):
+                    raise ValueError("Invalid version")
+                parsed.append((op, task_id, fields, version))
+                entry["task_id"] = str(task_id) if task_id else None
+            except ValueError as e:
+                entry.update(success=False, message=str(e))
+                errors = True
+                parsed.append(None)
+            results.append(entry)
+
+        if errors:
+            return Response({"success":False, "message":"Validation failed, nothing was applied", "payload":{"results":results}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        now = timezone.now()
+        to_create, to_update, to_delete, update_fields = [], [], [], {"updated_at", "version"}
+        moved = []
+        with transaction.atomic():
+            # rows stay locked until commit, so the version checks below can't go stale
+            existing = Tasks.objects.select_for_update().defer("search_vector").in_bulk(referenced, field_name="task_id") if referenced else {}
+            conflicts = False
+            for entry, (op, task_id, fields, version) in zip(results, parsed):
+                if not task_id:
+                    continue
+                if task_id not in existing or str(existing[task_id].workspaceId_id) != str(workspaceId):
+                    entry.update(success=False, message="Task not found")
+                    errors = True
+                elif version is not None and version != existing[task_id].version:
+                    entry.update(success=False, message="Task was changed by someone else", current_version=existing[task_id].version)
+                    conflicts = True
+            if errors or conflicts:
+                return Response(
+                    {"success":False, "message":"Validation failed, nothing was applied", "payload":{"results":results}},
+                    status=drf_status.HTTP_400_BAD_REQUEST if errors else drf_status.HTTP_409_CONFLICT
+                )
+
+            for entry, (op, task_id, fields, version) in zip(results, parsed):
+                if op == "create":
+                    task = Tasks(workspaceId_id=workspaceId, created_by_id=request.user_id, **fields)
+                    to_create.append(task)
+                    entry["task"] = task
+                elif op == "update":
+                    task = existing[task_id]
+                    if "status" in fields and fields["status"] != task.status:
+                        moved.append(task)
+                    for field, value in fields.items():
+                        setattr(task, field, value)
+                    task.updated_at = now
+                    task.version += 1
+                    update_fields.update(fields)
+                    to_update.append(task)
+                    entry["task"] = task
+                else:
+                    to_delete.append(task_id)
+
+            append_ranks(workspaceId, to_create + moved)
+            if moved:
+                update_fields.add("rank")
+            Tasks.objects.bulk_create(to_create)
+            if to_update:
+                Tasks.objects.bulk_update(to_update, sorted(update_fields))
+            if to_delete:
+                Tasks.objects.filter(task_id__in=to_delete).delete()
+                record_tombstones(workspaceId, to_delete)
+            bump_workspace_version(workspaceId)
+            push_board_changes(workspaceId, [task.task_id for task in to_create + to_update], to_delete, by=request.user_id)
+
+        for entry in results:
+            if "task" in entry:
+                entry["task_id"] = str(entry["task"].task_id)
+                entry["task"] = TaskSerializer(entry["task"]).data
+
+        summary = {"created": len(to_create), "updated": len(to_update), "deleted": len(to_delete)}
+        return Response({"success":True, "message":"Bulk operation applied", "payload":{"summary":summary, "results":results}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Bulk task operation failed : ", e)
+        return Response({"success":False, "message":"Bulk task operation failed", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+def _neighbour_ranks(task_id, workspace_id, status, prev_id, next_id):
+    # -> (prev rank, next rank, {neighbour id: rank} for the rows they were read from)
+    if prev_id and prev_id == next_id:
+        raise ValueError("prev_task_id must sit right above next_task_id")
+    column = Tasks.objects.filter(workspaceId=workspace_id, status=status).exclude(task_id=task_id)
+    given = dict(column.filter(task_id__in=[i for i in (prev_id, next_id) if i]).values_list("task_id", "rank"))
+    if (prev_id and prev_id not in given) or (next_id and next_id not in given):
+        raise ValueError("Neighbour task is not in the target column")
+    before = (prev_id, given[prev_id]) if prev_id else None
+    after = (next_id, given[next_id]) if next_id else None
+    # only one side given, the other one is whatever card sits right next to it
+    if prev_id and not next_id:
+        after = column.filter(rank__gt=before[1]).order_by("rank").values_list("task_id", "rank").first()
+    elif next_id and not prev_id:
+        before = column.filter(rank__lt=after[1]).order_by("-rank").values_list("task_id", "rank").first()
+    elif not prev_id and not next_id:
+        before = column.order_by("-rank").values_list("task_id", "rank").first()
+    return (before[1] if before else "") or "", after[1] if after else None, dict(filter(None, (before, after)))
+
+def _locked_neighbour_ranks(task_id, workspace_id, status, prev_id, next_id):
+    # -> (prev rank, next rank) with the moved card and its neighbours locked until the
+    # transaction ends, so a column rebalance can't respace them under the move. They are
+    # locked in one statement in rank order, the order the rebalancer locks in, so the two
+    # don't deadlock; a neighbour that changed before it got locked means reading them again
+    for _ in range(3):
+        prev_rank, next_rank, read = _neighbour_ranks(task_id, workspace_id, status, prev_id, next_id)
+        locked = dict(
+            Tasks.objects.select_for_update().filter(task_id__in=[task_id, *read])
+            .order_by("rank", "task_id").values_list("task_id", "rank")
+        )
+        if all(locked.get(i) == rank for i, rank in read.items()):
+            return prev_rank, next_rank
+    return None
+
+@api_view(['POST'])
+@jwt_authentication
+def move_task(request):
+    try:
+        data = request.data
+        try:
+            task_id = uuid.UUID(str(data.get('task_id')))
+            prev_id = uuid.UUID(str(data['prev_task_id'])) if data.get('prev_task_id') else None
+            next_id = uuid.UUID(str(data['next_task_id'])) if data.get('next_task_id') else None
+        except ValueError:
+            return Response({"success":False, "message":"Invalid task id", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        task = Tasks.objects.filter(task_id=task_id).values("workspaceId", "status").first()
+        if not task:
+            return Response({"success":False, "message":"Task not found", "payload":{}}, status=drf_status.HTTP_404_NOT_FOUND)
+        workspace_id = task["workspaceId"]
+        if not check_user_elgible(workspace_id, request.user_id):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+        status = data.get('status') or task["status"]
+        if status not in Tasks.Status.values:
+            return Response({"success":False, "message":"Invalid status", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        busy = Response({"success":False, "message":"Column is being reordered, try again", "payload":{}}, status=drf_status.HTTP_409_CONFLICT)
+        try:
+            for attempt in range(2):
+                with transaction.atomic():
+                    ranks = _locked_neighbour_ranks(task_id, workspace_id, status, prev_id, next_id)
+                    if ranks is None:
+                        return busy
+                    prev_rank, next_rank = ranks
+                    if next_rank is not None and prev_rank > next_rank:
+                        raise ValueError("prev_task_id must sit right above next_task_id")
+                    if prev_rank != next_rank:
+                        rank = rank_between(prev_rank, next_rank)
+                        Tasks.objects.filter(task_id=task_id).update(rank=rank, status=status, updated_at=timezone.now(), version=F("version") + 1)
+                        bump_workspace_version(workspace_id)
+                        push_board_changes(workspace_id, [task_id], by=request.user_id)
+                        maybe_rebalance(workspace_id, status, rank)
+                        break
+                # neighbours share a key (legacy rows or a race): out of the transaction, so the
+                # background rebalancer can lock the column, respace it, then the move is retried once
+                if attempt or not wait_for_rebalance(workspace_id, status):
+                    return busy
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        return Response({"success":True, "message":"Task moved", "payload":{"task_id":str(task_id), "status":status, "rank":rank}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Failed to move task : ", e)
+        return Response({"success":False, "message":"Task move failed", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['POST'])
+@jwt_authentication
+def search_tasks(request):
+    try:
+        data = request.data
+        workspaceId = data.get('workspaceId')
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+        terms = re.findall(r"\w+", str(data.get('q') or ""))[:8]
+        if not terms:
+            return Response({"success":False, "message":"Search query is empty", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = parse_limit(data.get('limit'), default=20, maximum=100)
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        # every term may be the start of a word ("kanb" finds "kanban"), the trigram match covers typos
+        query = SearchQuery(" & ".join(f"{term}:*" for term in terms), search_type="raw", config="english")
+        text = " ".join(terms)
+        match, score = Q(search_vector=query), SearchRank(F("search_vector"), query)
+        if trigram_installed():
+            match, score = match | Q(title__trigram_similar=text), score + TrigramSimilarity("title", text)
+        tasks = (
+            Tasks.objects.filter(workspaceId=workspaceId).defer("search_vector")
+            .filter(match).annotate(score=score)
+            .order_by("-score", "task_id")[:limit]
+        )
+        results = []
+        for task in tasks:
+            result = TaskSerializer(task).data
+            result["score"] = round(task.score, 4)
+            results.append(result)
+        return Response({"success":True, "message":"Search results", "payload":{"tasks":results, "users":task_users(results)}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Task search failed : ", e)
+        return Response({"success":False, "message":"Task search failed", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+ARCHIVE_ORDERING = ["-archived_at", "task_id"]
+
+@api_view(['POST'])
+@jwt_authentication
+def archived_tasks(request):
+    try:
+        data = request.data
+        workspaceId = data.get('workspaceId')
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+
+        archived = ArchivedTasks.objects.filter(workspaceId=workspaceId)
+        q = (data.get('q') or "").strip()
+        if q:
+            archived = archived.filter(title__icontains=q)
+        if data.get('tag'):
+            archived = archived.filter(tags__contains=[data.get('tag')])
+        try:
+            limit = parse_limit(data.get('limit'), default=50, maximum=getattr(settings, "TASKS_PAGE_MAX", 500))
+            archived, next_cursor = paginate_keyset(archived, ARCHIVE_ORDERING, "archived", data.get('cursor'), limit)
+        except ValueError as e:
+            return Response({"success":False, "message":str(e), "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        serialized = ArchivedTaskSerializer(archived, many=True).data
+        return Response({"success":True, "message":"Archived tasks fetched", "payload":{"tasks":serialized, "users":task_users(serialized), "next_cursor":next_cursor}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Failed fetching archived tasks : ", e)
+        return Response({"success":False, "message":"Failed fetching archived tasks", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['POST'])
+@jwt_authentication
+def restore_archived_tasks(request):
+    try:
+        data = request.data
+        workspaceId = data.get('workspaceId')
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to restore tasks!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+        try:
+            task_ids = {uuid.UUID(str(task_id)) for task_id in _as_list(data.get('task_ids'))}
+        except ValueError:
+            return Response({"success":False, "message":"Invalid UUID in task_ids", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+        if not task_ids:
+            return Response({"success":False, "message":"task_ids not provided", "payload":{}}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+        restored = restore_tasks(workspaceId, task_ids)
+        push_board_changes(workspaceId, [task.task_id for task in restored], by=request.user_id)
+        missing = [str(task_id) for task_id in task_ids - {task.task_id for task in restored}]
+        return Response({"success":True, "message":"Tasks restored", "payload":{"tasks":TaskSerializer(restored, many=True).data, "missing":missing}}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Failed restoring archived tasks : ", e)
+        return Response({"success":False, "message":"Failed restoring archived tasks", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['POST'])
+@jwt_authentication
+def task_analytics(request):
+    try:
+        workspaceId = request.data.get('workspaceId')
+        if not check_user_elgible(workspaceId, request.user_id):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
+        version = get_workspace_version(workspaceId)
+        if version is None:
+            return Response({"success":False, "message":"Workspace doesnt exists", "payload":{}}, status=drf_status.HTTP_404_NOT_FOUND)
+        analytics = board_analytics(workspaceId, version, timezone.localdate())
+        return Response({"success":True, "message":"Board analytics", "payload":analytics}, status=drf_status.HTTP_200_OK)
+    except Exception as e:
+        print("Failed computing board analytics : ", e)
+        return Response({"success":False, "message":"Failed computing board analytics", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 def check_user_elgible(workspaceId, userId):
-    teamMember = TeamMembers.objects.get(workspaceId=workspaceId, userId=userId)
-    if teamMember.status=="accepted":
-        return True
-    else:
-        return False
+    return is_accepted_member(userId, workspaceId)
 
 
 @api_view(['POST'])
@@ -228,188 +756,122 @@ def detail_task(request):
         if not is_valid:
             return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}})
         
-        task = Tasks.objects.filter(task_id=taskId).first()
-        serialized_task_detailed = TaskSerializerDetailed(task)
+        # only tasks of the workspace the membership was checked for
+        task = Tasks.objects.filter(task_id=taskId, workspaceId=workspaceId).first()
         if not task:
             return Response({"success":False, "message":"Task doesnt exist", "payload":{}})
+        serialized_task_detailed = TaskSerializerDetailed(task)
 
-        return Response({"success":True, "message":"Detailed task found", "payload":{"task_detail":serialized_task_detailed.data}}, status=drf_status.HTTP_200_OK)
+        return Response({"success":True, "message":"Detailed task found", "payload":{"task_detail":serialized_task_detailed.data, "users":task_users([serialized_task_detailed.data])}}, status=drf_status.HTTP_200_OK)
 
     except Exception as e:
         print("Some error occured while fetching the detailed task data : ",e)
         return Response({"success":False, "message":"Failed fetching detailed task", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-import os
-import asyncio
-from playwright.async_api import async_playwright
-
-async def generate_pdf_nextjs_optimized_final(url, path, cookies):
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        context = await browser.new_context()
-        await context.add_cookies(cookies)
-        page = await context.new_page()
-
-        await page.goto(url, wait_until='networkidle')
-        await page.wait_for_function("() => window.isPageReady === true", timeout=15000)
-        await page.wait_for_timeout(2000)
-
-        # Inject custom CSS to override layout issues
-        await page.add_style_tag(content="""
-            #__next {
-                height: auto !important;
-                min-height: auto !important;
-                overflow: visible !important;
-            }
-            html, body {
-                height: auto !important;
-                min-height: 100vh !important;
-                overflow: visible !important;
-            }
-            main, .main, [role="main"] {
-                height: auto !important;
-                min-height: auto !important;
-                max-height: none !important;
-                overflow: visible !important;
-            }
-            .flex, .d-flex, [class*="flex"] {
-                height: auto !important;
-                min-height: auto !important;
-                max-height: none !important;
-            }
-            .grid, .d-grid, [class*="grid"] {
-                height: auto !important;
-                min-height: auto !important;
-                max-height: none !important;
-            }
-            .container, .container-fluid, [class*="container"] {
-                height: auto !important;
-                min-height: auto !important;
-                max-height: none !important;
-                overflow: visible !important;
-            }
-            .h-screen, .min-h-screen, .max-h-screen {
-                height: auto !important;
-                min-height: auto !important;
-                max-height: none !important;
-            }
-            .overflow-hidden, .overflow-x-hidden, .overflow-y-hidden {
-                overflow: visible !important;
-            }
-            [class*="board"], [class*="kanban"], [class*="task"] {
-                height: auto !important;
-                min-height: auto !important;
-                max-height: none !important;
-                overflow: visible !important;
-            }
-            [class*="card"], [class*="task"], [class*="item"] {
-                page-break-inside: avoid;
-                break-inside: avoid;
-            }
-        """)
-
-        # Scroll page to ensure full render
-        await page.evaluate("""
-            () => {
-                return new Promise(async (resolve) => {
-                    await new Promise(r => setTimeout(r, 1000));
-                    let lastHeight = 0;
-                    let stableCount = 0;
-                    while (stableCount < 3) {
-                        const currentHeight = Math.max(
-                            document.body.scrollHeight,
-                            document.documentElement.scrollHeight
-                        );
-                        if (currentHeight === lastHeight) {
-                            stableCount++;
-                        } else {
-                            stableCount = 0;
-                            lastHeight = currentHeight;
-                        }
-                        window.scrollTo(0, currentHeight);
-                        await new Promise(r => setTimeout(r, 200));
-                        window.scrollTo(0, 0);
-                        await new Promise(r => setTimeout(r, 200));
-                    }
-                    window.scrollTo(0, 0);
-                    resolve();
-                });
-            }
-        """)
-
-        # Compute full content height
-        content_height = await page.evaluate("""
-            () => {
-                return Math.max(
-                    document.body.scrollHeight,
-                    document.documentElement.scrollHeight
-                );
-            }
-        """)
-
-        print(f"Content height: {content_height}px")
-
-        await page.set_viewport_size({
-            "width": 1280,
-            "height": max(content_height, 1024)
-        })
-
-        await page.wait_for_timeout(1000)
-        await page.screenshot(path="/tmp/debug-nextjs-final.png", full_page=True)
-        print("Screenshot saved: /tmp/debug-nextjs-final.png")
-
-        await page.pdf(
-            path=path,
-            format="A4",
-            landscape=True,
-            print_background=True,
-            margin={"top": "0", "bottom": "0", "left": "0", "right": "0"},
-            prefer_css_page_size=True,
-            display_header_footer=False
-        )
+def _submit_pdf_export(request):
+    # -> (job, error response)
+    workspace_id = request.data.get('workspaceId')
+    if not is_accepted_member(request.user_id, workspace_id):
+        return None, Response({"success": False, "message": "Unauthorized"}, status=401)
+    try:
+        engine = pdf_export_engine(request.data.get('engine'))
+    except ValueError as e:
+        return None, Response({"success": False, "message": str(e), "payload": {}}, status=drf_status.HTTP_400_BAD_REQUEST)
+    version = get_workspace_version(workspace_id)
+    if version is None:
+        return None, Response({"success": False, "message": "Workspace not found", "payload": {}}, status=drf_status.HTTP_404_NOT_FOUND)
+    job, _ = submit_pdf_job(workspace_id, version, request.COOKIES.get("access_token"), engine)
+    if job is None:
+        return None, Response({"success": False, "message": "Too many PDF exports in progress, try again shortly", "payload": {}}, status=drf_status.HTTP_503_SERVICE_UNAVAILABLE)
+    return job, None
+
+def _pdf_file_response(job):
+    # None when the file has been evicted from the PDF cache since. FileResponse hands the open
+    # file to the server's wsgi.file_wrapper (sendfile where available)
+    path = pdf_cache.get(job["fingerprint"])
+    if path is None:
+        return None
+    try:
+        handle = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+    response = FileResponse(handle, content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="kanban-{job["workspace_id"]}.pdf"'
+    response['ETag'] = make_etag("pdf", job["fingerprint"])
+    return response
+
+def _readable_pdf_job(request):
+    # -> (job, error response) for a job of a workspace the caller belongs to
+    job = get_pdf_job(request.query_params.get('job_id'))
+    if job is None:
+        return None, Response({"success": False, "message": "Export job not found", "payload": {}}, status=drf_status.HTTP_404_NOT_FOUND)
+    if not is_accepted_member(request.user_id, job["workspace_id"]):
+        return None, Response({"success": False, "message": "Unauthorized"}, status=401)
+    return job, None
 
-        print(f"PDF generated successfully: {path}")
-        await browser.close()
-        return True
-    
 @api_view(['POST'])
 @jwt_authentication
-def export_pdf(request):
-    data = request.data
-    workspace_id = data.get('workspaceId')
-    user_id = request.user_id
-
-    is_member = TeamMembers.objects.filter(userId=user_id, workspaceId=workspace_id).first()
-    if not is_member or is_member.status != "accepted":
-        return Response({"success": False, "message": "Unauthorized"}, status=401)
-
-    token = request.COOKIES.get("access_token")
-    cookies = [{
-        "name": "access_token",
-        "value": token,
-        "domain": "localhost",
-        "path": "/",
-        "httpOnly": False,
-        "secure": False
-    }]
-
-    base_url = "http://localhost:3000"
-    secret = os.getenv("PRINT_SECRET")
-    url = f"{base_url}/workspace/{workspace_id}?print=true&secret={secret}"
-    pdf_path = f"/tmp/kanban-{workspace_id}.pdf"
+def submit_pdf_export(request):
+    try:
+        job, error = _submit_pdf_export(request)
+        if error:
+            return error
+        return Response({"success": True, "message": "PDF export queued", "payload": pdf_job_payload(job)}, status=drf_status.HTTP_202_ACCEPTED)
+
+    except Exception as e:
+        print("Some error occured while queueing the PDF export : ", e)
+        return Response({"success": False, "message": "Failed queueing the PDF export", "payload": {}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@jwt_authentication
+def pdf_export_status(request):
+    try:
+        job, error = _readable_pdf_job(request)
+        if error:
+            return error
+        return Response({"success": True, "message": f"PDF export {job['status']}", "payload": pdf_job_payload(job)}, status=drf_status.HTTP_200_OK)
+
+    except Exception as e:
+        print("Some error occured while fetching the PDF export status : ", e)
+        return Response({"success": False, "message": "Failed fetching the PDF export status", "payload": {}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+@api_view(['GET'])
+@jwt_authentication
+def download_pdf_export(request):
     try:
-        success = asyncio.run(generate_pdf_nextjs_optimized_final(url, pdf_path, cookies))
+        job, error = _readable_pdf_job(request)
+        if error:
+            return error
+        if job["status"] != PDF_JOB_DONE:
+            return Response({"success": False, "message": "PDF export is not ready", "payload": pdf_job_payload(job)}, status=drf_status.HTTP_409_CONFLICT)
+        if etag_matches(request, make_etag("pdf", job["fingerprint"])):
+            return not_modified(make_etag("pdf", job["fingerprint"]))
+        response = _pdf_file_response(job)
+        if response is None:
+            return Response({"success": False, "message": "PDF export has expired, export again", "payload": pdf_job_payload(job)}, status=drf_status.HTTP_410_GONE)
+        return response
+
+    except Exception as e:
+        print("Some error occured while downloading the PDF export : ", e)
+        return Response({"success": False, "message": "Failed downloading the PDF export", "payload": {}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        if success and os.path.exists(pdf_path):
-            file_handle = open(pdf_path, 'rb')
-            response = StreamingHttpResponse(file_handle, content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="kanban-{workspace_id}.pdf"'
-            response['Content-Length'] = os.path.getsize(pdf_path)
+@api_view(['POST'])
+@jwt_authentication
+def export_pdf(request):
+    # the original one-shot endpoint: same job queue, waits for it within the request
+    try:
+        job, error = _submit_pdf_export(request)
+        if error:
+            return error
+        timeout = getattr(settings, "PDF_EXPORT_QUEUE_TIMEOUT", 30) + getattr(settings, "PDF_EXPORT_TIMEOUT", 30)
+        job = wait_for_pdf_job(job["job_id"], timeout)
+        response = _pdf_file_response(job) if job is not None and job["status"] == PDF_JOB_DONE else None
+        if response is not None:
             return response
-        else:
-            return Response({"success": False, "message": "PDF generation failed"}, status=500)
+        if job is None or job["status"] != PDF_JOB_FAILED:
+            return Response({"success": False, "message": "PDF generation timed out, try again"}, status=503)
+        return Response({"success": False, "message": job["error"]}, status=500)
 
     except Exception as e:
         print("PDF generation error:", e)
-        return Response({"success": False, "message": str(e)}, status=500)
\ No newline at end of file
+        return Response({"success": False, "message": str(e)}, status=500)
@@ -1,16 +1,21 @@
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework import status as drf_status
 from api.models.workspace import Workspace
 from api.middlewares.auth_middleware import jwt_authentication
 from api.models.team_members import TeamMembers
-from api.serializers.team_serializer import TeamSerializer
-from api.utils.user_utils import is_user_admin
+from api.serializers.team_serializer import TEAM_PROJECTION
+from api.utils.renderers import FastJSONRenderer
+from api.utils.user_utils import is_user_admin, is_accepted_member, invalidate_membership
 from api.models.notifications import Notifications
 from api.models.message import Message
 from api.models.user import User
+from api.realtime.notifications import push_notifications, push_notifications_changed, CREATED as NOTIFICATION_CREATED
+from api.utils.versioning import bump_workspace_version, get_workspace_version, make_etag, etag_matches, not_modified
 
 @api_view(['POST'])
+@renderer_classes([FastJSONRenderer, BrowsableAPIRenderer])
 @jwt_authentication
 def all_team_members(request):
     try:
@@ -18,11 +23,19 @@ def all_team_members(request):
         workspaceId = data.get('workspaceId')
         if not workspaceId:
             return Response({"success":False, "message":"WorkspaceId not found"}, status=drf_status.HTTP_400_BAD_REQUEST)
+        # checked before the version lookup, so not even a 304 tells outsiders the workspace exists
+        if not is_accepted_member(request.user_id, workspaceId):
+            return Response({"success":False, "message":"User not authorized to get the data!", "payload":{}}, status=drf_status.HTTP_401_UNAUTHORIZED)
 
-        workspace = Workspace.objects.filter(workspaceId=workspaceId).first()
-        if not workspace:
+        version = get_workspace_version(workspaceId)
+        if version is None:
             return Response({"success": False, "message": "Workspace not found"}, status=drf_status.HTTP_404_NOT_FOUND)
 
+        etag = make_etag("members", workspaceId, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        workspace = Workspace.objects.get(workspaceId=workspaceId)
         team_members = TeamMembers.objects.filter(workspaceId=workspace)
         in_team = team_members.filter(status="accepted")
         invited = team_members.exclude(status="accepted")
@@ -31,11 +44,11 @@ def all_team_members(request):
             "success": True,
             "message": "Team Members fetched successfully",
             "payload": {
-                "creatorId": str(workspace.creator.userId),
-                "in_team": TeamSerializer(in_team, many=True).data,
-                "invited": TeamSerializer(invited, many=True).data
+                "creatorId": str(workspace.creator_id),
+                "in_team": TEAM_PROJECTION.serialize(TEAM_PROJECTION.values(in_team)),
+                "invited": TEAM_PROJECTION.serialize(TEAM_PROJECTION.values(invited))
             }
-        }, status=drf_status.HTTP_200_OK)
+        }, status=drf_status.HTTP_200_OK, headers={"ETag": etag})
 
     except Exception as e:
         print("Some error occurred while fetching the team members:", e)
@@ -67,6 +80,8 @@ def remove_member(request):
         team_member = TeamMembers.objects.get(email=email, workspaceId=workspace)
 
         team_member.delete()
+        invalidate_membership(team_member.userId_id, workspace_id)
+        bump_workspace_version(workspace.workspaceId)
 
         content = f"Your access to the Workspace '{workspace.name}' has been revoked. You no longer will be able to access it."
         message = Message.objects.create(content=content)
@@ -78,8 +93,8 @@ def remove_member(request):
             workspaceId=workspace
         ).update(reaction="revoked")
 
-        Notifications.objects.create(
-            fromUser=request.user,
+        notification = Notifications.objects.create(
+            fromUser_id=request.user_id,
             toUser=to_user if to_user else None,
             to_email=email,
             workspaceId=workspace,
@@ -87,6 +102,9 @@ def remove_member(request):
             type="info",
             reaction="revoked"
         )
+        # the pending invites above changed in bulk, the client refetches those
+        push_notifications_changed(to_user.userId if to_user else None)
+        push_notifications(NOTIFICATION_CREATED, [notification])
 
         return Response({
             "success": True,
@@ -135,6 +153,8 @@ def change_privilege(request):
         team_member = TeamMembers.objects.get(email=email, workspaceId=workspace_id)
         team_member.privilege = newPrivilege
         team_member.save()
+        invalidate_membership(team_member.userId_id, workspace_id)
+        bump_workspace_version(team_member.workspaceId_id)
         return Response({"success":True, "message":"Role updated!"},status=drf_status.HTTP_200_OK)
     except Exception as e:
         print("Some error occured in the privilege change : ", e)
@@ -7,10 +7,10 @@ from api.utils.jwt_utils import generate_token,verify_token
 from api.middlewares.auth_middleware import jwt_authentication
 from django.conf import settings
 import traceback
-from api.serializers.user_serializer import UserSerializer
 from api.models.team_members import TeamMembers
 from api.models.notifications import Notifications
 from api.utils.user_utils import is_user_admin
+from api.utils.versioning import bump_workspace_version
 
 @api_view(["POST"])
 def register(request):
@@ -49,6 +49,8 @@ def register(request):
         for tm in team_members:
             tm.userId = user
         TeamMembers.objects.bulk_update(team_members, ['userId'])
+        # member lists now resolve the invitee's name
+        bump_workspace_version(*[tm.workspaceId_id for tm in team_members])
 
         notifications = Notifications.objects.filter(to_email=email, toUser__isnull=True)
         for notif in notifications:
@@ -127,19 +129,20 @@ def refresh(request):
 @jwt_authentication
 def get_user(request):
     try:
-        user = User.objects.get(userId=request.user_id)
-        user_data = UserSerializer(user).data
+        # the auth layer already resolved who the caller is, no need to query again
+        principal = request.principal
+        if principal is None:
+            return Response({
+                "success": False, 
+                "message": "User not found",
+                "payload": {}
+            }, status=drf_status.HTTP_404_NOT_FOUND)
+        user_data = {"userId": str(principal.userId), "name": principal.name, "email": principal.email}
         return Response({
             "success": True, 
             "message": "User data found", 
             "payload": user_data
         }, status=drf_status.HTTP_200_OK)
-    except User.DoesNotExist:
-        return Response({
-            "success": False, 
-            "message": "User not found",
-            "payload": {}
-        }, status=drf_status.HTTP_404_NOT_FOUND)
     except Exception as e:
         print(f"Error in get_user: {e}")
         return Response({
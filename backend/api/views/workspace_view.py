@@ -10,7 +10,10 @@ from api.models.message import Message
 from api.serializers.workspace_serializer import WorkspaceSerializer
 from api.serializers.workspace_serializer import WorkspaceIdNameSerializer
 from django.utils import timezone
-from api.utils.user_utils import is_user_admin
+from api.utils.user_utils import is_user_admin, is_accepted_member, invalidate_membership
+from api.utils.versioning import bump_workspace_version, get_workspace_version, make_etag, etag_matches, not_modified
+from django.db.models import Q
+from api.realtime.notifications import push_notifications, CREATED as NOTIFICATION_CREATED, UPDATED as NOTIFICATION_UPDATED
 
 @api_view(['POST'])
 @jwt_authentication
@@ -43,6 +46,7 @@ def create_workspace(request):
             )
 
             msg_obj = None
+            notifications = []
             if message_content:
                 msg_obj = Message.objects.create(content=message_content)
 
@@ -66,16 +70,17 @@ def create_workspace(request):
                     )
                 )
 
-                Notifications.objects.create(
+                notifications.append(Notifications.objects.create(
                     fromUser=creator,
                     workspaceId=workspace,
                     toUser=user if user else None,
                     to_email=email,
                     type="request",
                     messageId=msg_obj
-                )
+                ))
 
             TeamMembers.objects.bulk_create(team_objs)
+            push_notifications(NOTIFICATION_CREATED, notifications)
 
             return Response({
                 "success": True,
@@ -107,19 +112,20 @@ def get_workspace(request):
         data = request.data
         workspace_id = data.get('workspaceId')
 
-        is_team_member = TeamMembers.objects.filter(
-            workspaceId=workspace_id,
-            userId=request.user_id,
-            status=TeamMembers.Status.ACCEPTED
-        ).exists()
-
-        if not is_team_member:
+        if not is_accepted_member(request.user_id, workspace_id):
             return Response({"success": False,"message": "Not a valid/accepted team member","payload": {}}, status=drf_status.HTTP_401_UNAUTHORIZED)
 
+        version = get_workspace_version(workspace_id)
+        if version is None:
+            raise Workspace.DoesNotExist
+        etag = make_etag("workspace", workspace_id, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
         workspace = Workspace.objects.get(workspaceId=workspace_id)
         workspace_data = WorkspaceSerializer(workspace).data
 
-        return Response({"success": True,"message": "Workspace data found","payload": workspace_data}, status=drf_status.HTTP_200_OK)
+        return Response({"success": True,"message": "Workspace data found","payload": workspace_data}, status=drf_status.HTTP_200_OK, headers={"ETag": etag})
 
     except Workspace.DoesNotExist:
         return Response({"success": False,"message": "Workspace not found","payload": {}}, status=drf_status.HTTP_404_NOT_FOUND)
@@ -152,13 +158,14 @@ def invite_team_members(request):
             "re_invited": [],
             "new_invites": []
         }
+        created, revoked = [], []
 
         for member in team_members:
             email = member['email'].lower()
             privilege = member['privilege']
             status = member['status']
 
-            if email == request.user.email.lower():
+            if email == request.principal.email.lower():
                 continue
 
             user = User.objects.filter(email=email).first()
@@ -173,6 +180,7 @@ def invite_team_members(request):
                 existing_member.status = TeamMembers.Status.PENDING
                 existing_member.updated_at = timezone.now()
                 existing_member.save()
+                invalidate_membership(existing_member.userId_id, workspace_id)
                 invite_summary["re_invited"].append(email)
 
                 old_notif = Notifications.objects.filter(
@@ -185,6 +193,7 @@ def invite_team_members(request):
                 if old_notif:
                     old_notif.reaction = "revoked"
                     old_notif.save()
+                    revoked.append(old_notif)
 
             else:
                 TeamMembers.objects.create(
@@ -194,17 +203,23 @@ def invite_team_members(request):
                     privilege=privilege,
                     status=status
                 )
+                if user:
+                    invalidate_membership(user.userId, workspace_id)
                 invite_summary["new_invites"].append(email)
 
-            Notifications.objects.create(
-                fromUser=request.user,
+            created.append(Notifications.objects.create(
+                fromUser_id=request.user_id,
                 workspaceId=workspace,
                 toUser=user if user else None,
                 to_email=email,
                 type="request",
                 messageId=msg_obj,
                 reaction="pending"
-            )
+            ))
+
+        bump_workspace_version(workspace.workspaceId)
+        push_notifications(NOTIFICATION_UPDATED, revoked)
+        push_notifications(NOTIFICATION_CREATED, created)
 
         message = "Invites processed."
         if invite_summary["already_in_team"]:
@@ -233,8 +248,16 @@ def invite_team_members(request):
 @jwt_authentication
 def get_all_workspaces(request):
     try:
-        user_id=request.user_id
-        user = User.objects.get(userId=user_id)
+        user = request.user_id
+
+        # every workspace in the sidebar, with its version, in one indexed lookup
+        stamps = Workspace.objects.filter(
+            Q(creator=user) | Q(member_of_workspace__userId=user, member_of_workspace__status=TeamMembers.Status.ACCEPTED)
+        ).values_list("workspaceId", "version").distinct().order_by("workspaceId")
+        etag = make_etag("workspaces", user, list(stamps))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
         my_workspaces = Workspace.objects.filter(creator=user).values("workspaceId", "name")  #I am the owner
         shared_workspace_ids = TeamMembers.objects.filter(
             userId=user,
@@ -252,7 +275,7 @@ def get_all_workspaces(request):
             "my_workspaces":owned_serialized,
             "shared_workspaces":shared_serialized
         }
-        return Response({"success":True, "message":"Workspace data found!", "payload":payload}, status=drf_status.HTTP_200_OK)
+        return Response({"success":True, "message":"Workspace data found!", "payload":payload}, status=drf_status.HTTP_200_OK, headers={"ETag": etag})
     except Exception as e:
         print("Error while getting workspaces data for app sidebar:", str(e))
         return Response({"success":False, "message":"Failed to fetch all workspaces", "payload":{}}, status=drf_status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -277,6 +300,7 @@ def update_workspace_name(request):
             return Response({"success":False,"message":""}, status=drf_status.HTTP_404_NOT_FOUND)
         workspace.name=newName
         workspace.save()
+        bump_workspace_version(workspace.workspaceId)
         return Response({"success":True, "message":"Workspace name updated!"}, status=drf_status.HTTP_200_OK)
     except Exception as e:
         print("Error occured while updating the workspace name : ",e)